@@ -0,0 +1,46 @@
+"""Solucionador del puzzle 8 (y de tableros N×N) sin dependencias de interfaz.
+
+Importar el paquete solo carga el núcleo: la ventana de Pygame está en `puzzle8.gui`, los
+lotes en `puzzle8.lote` y el banco de pruebas en `puzzle8.banco`.
+"""
+from .nucleo import (
+    ALGORITMOS,
+    META,
+    METAS,
+    BusquedaInterrumpida,
+    Configuracion,
+    ControlBusqueda,
+    EstadisticasBusqueda,
+    Marco,
+    Nodo,
+    NodoAStar,
+    busqueda_a_star,
+    busqueda_a_star_anytime,
+    busqueda_ara_star,
+    busqueda_bfs,
+    busqueda_bidireccional,
+    busqueda_hda_star,
+    busqueda_ida_star,
+    busqueda_profundidad,
+    busqueda_tabla,
+    cargar_pdbs,
+    cargar_tabla_distancias,
+    desempaquetar,
+    distancia_manhattan,
+    distancia_optima,
+    empaquetar,
+    es_estado_meta,
+    es_resoluble,
+    fichas_movidas,
+    generar_estado_aleatorio,
+    generar_meta,
+    generar_meta_filas,
+    heuristica_pdb,
+    normalizar_meta,
+    obtener_configuracion,
+    obtener_marco,
+    obtener_movimientos,
+    reconstruir_solucion,
+    resolver_uno,
+    tablero_desde_lista,
+)
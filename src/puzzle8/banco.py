@@ -0,0 +1,242 @@
+"""Banco de pruebas reproducible sobre un corpus versionado."""
+import argparse # Importa argparse para las órdenes del banco de pruebas.
+import hashlib # Importa hashlib para identificar el corpus del banco de pruebas.
+import json # Importa json para leer y escribir el corpus y los informes.
+import math # Importa math para los percentiles.
+import multiprocessing # Importa multiprocessing para medir cada búsqueda en un proceso nuevo.
+import os # Importa os para saber si se puede usar fork.
+import platform # Importa platform para anotar la máquina en los informes del banco de pruebas.
+import random # Importa random para elegir el corpus con una semilla fija.
+import statistics # Importa statistics para las medianas del banco de pruebas.
+import sys # Importa sys para la versión de Python y la salida de errores.
+import time # Importa time para fechar los informes.
+
+from .nucleo import (ALGORITMOS, desempaquetar, memoria_mb, obtener_configuracion, obtener_movimientos,
+                     preparar_tablas, resolver_uno, tablero_desde_lista)
+
+# --- Banco de pruebas (benchmark) ---
+# Mide los algoritmos sobre un corpus fijo de tableros 3x3 agrupados por distancia óptima.
+# El corpus se genera con una semilla y lleva número de versión: mientras no cambien la
+# versión, la semilla ni la meta, los tableros son exactamente los mismos, así que dos
+# ejecuciones del banco (antes y después de un cambio) son comparables.
+VERSION_CORPUS = 1 # Súbase si cambia la forma de elegir los tableros.
+GRUPOS_CORPUS = (5, 10, 15, 20, 25, 30) # Distancias óptimas del corpus (30 es la máxima con esta meta).
+# Métricas del informe y si un valor mayor es peor (True) o mejor (False).
+METRICAS_BENCH = {
+    "tiempo": True, # Segundos de reloj por búsqueda.
+    "nodos_por_segundo": False,
+    "nodos_expandidos": True,
+    "memoria_pico_mb": True, # Memoria residente máxima del proceso que resolvió.
+    "longitud": True, # Movimientos de la solución (los algoritmos óptimos no deben cambiarla nunca).
+}
+
+def estados_por_distancia(distancias):
+    """BFS desde la meta 3x3; devuelve {distancia: [codigo, ...]} para las distancias pedidas."""
+    configuracion = obtener_configuracion(3)
+    buscadas = set(distancias)
+    encontrados = {distancia: [] for distancia in buscadas}
+    visitados = {configuracion.meta_codigo}
+    frontera = [(configuracion.meta_codigo, configuracion.meta_vacio)]
+    distancia = 0
+    while frontera and distancia < max(buscadas):
+        distancia += 1
+        siguiente = []
+        for codigo, vacio in frontera:
+            for codigo_hijo, vacio_hijo in obtener_movimientos(codigo, vacio, configuracion):
+                if codigo_hijo not in visitados:
+                    visitados.add(codigo_hijo)
+                    siguiente.append((codigo_hijo, vacio_hijo))
+        frontera = siguiente
+        if distancia in buscadas:
+            encontrados[distancia] = sorted(codigo for codigo, _ in frontera)
+    return encontrados
+
+def generar_corpus(semilla=2024, por_grupo=20, grupos=GRUPOS_CORPUS):
+    """Corpus reproducible: `por_grupo` tableros elegidos con `semilla` para cada distancia óptima."""
+    configuracion = obtener_configuracion(3)
+    generador = random.Random(semilla) # Generador propio: no depende del estado global de random.
+    candidatos = estados_por_distancia(grupos)
+    corpus = {"version": VERSION_CORPUS, "semilla": semilla, "tamano": 3,
+              "meta": [valor for fila in configuracion.meta for valor in fila], "grupos": {}}
+    for distancia in grupos:
+        # Los candidatos están ordenados, así que la muestra solo depende de la semilla.
+        elegidos = generador.sample(candidatos[distancia], min(por_grupo, len(candidatos[distancia])))
+        corpus["grupos"][str(distancia)] = [
+            [valor for fila in desempaquetar(codigo, configuracion) for valor in fila] for codigo in elegidos]
+    return corpus
+
+def escribir_corpus(corpus, archivo):
+    # JSON con un tablero por línea, para que el corpus versionado se lea y se revise cómodamente.
+    cabecera = {clave: valor for clave, valor in corpus.items() if clave != "grupos"}
+    archivo.write(json.dumps(cabecera)[:-1] + ', "grupos": {\n')
+    grupos = list(corpus["grupos"].items())
+    for posicion, (grupo, tableros) in enumerate(grupos):
+        archivo.write(f' "{grupo}": [\n')
+        archivo.write(",\n".join("  " + json.dumps(tablero) for tablero in tableros))
+        archivo.write("\n ]" + ("," if posicion < len(grupos) - 1 else "") + "\n")
+    archivo.write("}}\n")
+
+def huella_corpus(corpus):
+    # Resumen de los tableros: dos informes solo se comparan si se midieron sobre el mismo corpus.
+    return hashlib.sha256(json.dumps(corpus["grupos"], sort_keys=True).encode()).hexdigest()[:16]
+
+def memoria_pico_mb():
+    """Memoria residente máxima alcanzada por el proceso en MB (0.0 si no se puede saber)."""
+    try:
+        import resource
+    except ImportError:
+        return memoria_mb()
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2 ** 20 if sys.platform == "darwin" else pico / 1024 # macOS da bytes; Linux, KB.
+
+def _medir_en_proceso(estado, algoritmo, limites, conexion):
+    # Se ejecuta en un proceso nuevo para que el pico de memoria sea solo el de esta búsqueda.
+    resultado = resolver_uno(None, estado, algoritmo, *limites)
+    resultado["memoria_pico_mb"] = memoria_pico_mb()
+    conexion.send(resultado)
+    conexion.close()
+
+def medir(estado, algoritmo, limites=(None, None, None)):
+    """Resuelve `estado` en un proceso hijo y devuelve el resultado de resolver_uno con su pico de memoria."""
+    contexto = multiprocessing.get_context("fork") if hasattr(os, "fork") else multiprocessing.get_context()
+    receptor, emisor = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=_medir_en_proceso, args=(estado, algoritmo, limites, emisor))
+    proceso.start()
+    emisor.close()
+    try:
+        resultado = receptor.recv()
+    except EOFError: # El hijo murió sin responder (por ejemplo, sin memoria).
+        resultado = {"estado": "error", "error": "el proceso de medición terminó inesperadamente"}
+    proceso.join()
+    return resultado
+
+def percentil(valores, porcentaje):
+    """Percentil por rango más cercano de una lista no vacía."""
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(porcentaje / 100 * len(ordenados)) - 1)]
+
+def resumir(muestras):
+    # Mediana y p95 de cada métrica sobre los tableros resueltos de un grupo.
+    resumen = {}
+    for metrica in METRICAS_BENCH:
+        valores = [muestra[metrica] for muestra in muestras]
+        resumen[metrica] = {"mediana": statistics.median(valores), "p95": percentil(valores, 95)} if valores else None
+    return resumen
+
+def correr_banco(corpus, algoritmos, repeticiones=3, limite_tiempo=60.0, limite_nodos=None, al_medir=None):
+    """Mide cada algoritmo sobre cada grupo del corpus y devuelve el informe como diccionario.
+
+    Cada tablero se resuelve `repeticiones` veces y se toma la mediana de su tiempo; luego se
+    resumen los tableros de cada grupo. Los que agotan un límite se cuentan aparte.
+    """
+    if corpus.get("version") != VERSION_CORPUS:
+        raise ValueError(f"Versión de corpus {corpus.get('version')} no soportada (se esperaba {VERSION_CORPUS})")
+    if corpus["meta"] != [valor for fila in obtener_configuracion(corpus["tamano"]).meta for valor in fila]:
+        raise ValueError("El corpus se generó para otra meta")
+    informe = {"version_corpus": corpus["version"], "semilla": corpus["semilla"], "huella_corpus": huella_corpus(corpus),
+               "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+               "plataforma": platform.platform(), "repeticiones": repeticiones, "resultados": {}}
+    limites = (limite_tiempo, limite_nodos, None)
+    for algoritmo in algoritmos:
+        preparar_tablas(algoritmo, corpus["tamano"]) # Las tablas se cargan antes y los hijos las heredan.
+        informe["resultados"][algoritmo] = {}
+        for grupo, tableros in corpus["grupos"].items():
+            muestras, interrumpidos = [], 0
+            for valores in tableros:
+                estado = tablero_desde_lista(valores)
+                mediciones = [medir(estado, algoritmo, limites) for _ in range(repeticiones)]
+                if any(medicion["estado"] != "resuelto" for medicion in mediciones):
+                    interrumpidos += 1
+                    continue
+                tiempo = statistics.median(medicion["tiempo"] for medicion in mediciones)
+                nodos_expandidos = mediciones[0]["nodos_expandidos"]
+                muestras.append({
+                    "tiempo": tiempo,
+                    "nodos_por_segundo": nodos_expandidos / tiempo if tiempo > 0 else 0.0,
+                    "nodos_expandidos": nodos_expandidos,
+                    "memoria_pico_mb": max(medicion["memoria_pico_mb"] for medicion in mediciones),
+                    "longitud": mediciones[0]["longitud"],
+                })
+            informe["resultados"][algoritmo][grupo] = {"tableros": len(tableros), "resueltos": len(muestras),
+                                                      "interrumpidos": interrumpidos, **resumir(muestras)}
+            if al_medir is not None:
+                al_medir(algoritmo, grupo, informe["resultados"][algoritmo][grupo])
+    return informe
+
+def comparar_informes(base, nuevo, umbral=0.10):
+    """Compara dos informes del banco; devuelve filas (algoritmo, grupo, métrica, base, nuevo, cambio, regresión).
+
+    Se compara la mediana de cada métrica. Es regresión un empeoramiento relativo mayor que `umbral`.
+    """
+    if base["huella_corpus"] != nuevo["huella_corpus"]:
+        raise ValueError("Los informes se midieron sobre corpus distintos")
+    filas = []
+    for algoritmo, grupos in nuevo["resultados"].items():
+        for grupo, datos in grupos.items():
+            datos_base = base["resultados"].get(algoritmo, {}).get(grupo)
+            if datos_base is None:
+                continue
+            for metrica, mayor_es_peor in METRICAS_BENCH.items():
+                if not datos_base[metrica] or not datos[metrica]:
+                    continue
+                valor_base, valor_nuevo = datos_base[metrica]["mediana"], datos[metrica]["mediana"]
+                cambio = (valor_nuevo - valor_base) / valor_base if valor_base else 0.0
+                empeora = cambio if mayor_es_peor else -cambio
+                filas.append((algoritmo, grupo, metrica, valor_base, valor_nuevo, cambio, empeora > umbral))
+            # Un tablero que antes se resolvía y ahora agota un límite también es una regresión.
+            if datos["resueltos"] < datos_base["resueltos"]:
+                filas.append((algoritmo, grupo, "resueltos", datos_base["resueltos"], datos["resueltos"],
+                              (datos["resueltos"] - datos_base["resueltos"]) / datos_base["resueltos"], True))
+    return filas
+
+def main_banco(argumentos):
+    # Punto de entrada: python -m puzzle8 bench {corpus,correr,comparar} ...
+    parser = argparse.ArgumentParser(prog="puzzle8 bench", description="Banco de pruebas reproducible.")
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+    p_corpus = subparsers.add_parser("corpus", help="genera el corpus de tableros")
+    p_corpus.add_argument("--semilla", type=int, default=2024)
+    p_corpus.add_argument("--por-grupo", type=int, default=20, help="tableros por distancia óptima")
+    p_corpus.add_argument("--grupos", type=int, nargs="+", default=list(GRUPOS_CORPUS), help="distancias óptimas")
+    p_corpus.add_argument("--salida", default="-")
+    p_correr = subparsers.add_parser("correr", help="mide los algoritmos sobre un corpus")
+    p_correr.add_argument("corpus", help="archivo JSON generado con 'bench corpus'")
+    p_correr.add_argument("--algoritmos", nargs="+", choices=list(ALGORITMOS), default=["A*", "IDA*", "Bidir", "Tabla"])
+    p_correr.add_argument("--repeticiones", type=int, default=3)
+    p_correr.add_argument("--limite-tiempo", type=float, default=60.0, help="segundos máximos por búsqueda")
+    p_correr.add_argument("--limite-nodos", type=int, default=None, help="nodos expandidos máximos por búsqueda")
+    p_correr.add_argument("--salida", default="-", help="archivo JSON del informe ('-' para la salida estándar)")
+    p_comparar = subparsers.add_parser("comparar", help="compara dos informes y señala regresiones")
+    p_comparar.add_argument("base")
+    p_comparar.add_argument("nuevo")
+    p_comparar.add_argument("--umbral", type=float, default=0.10, help="empeoramiento relativo tolerado (0.10 = 10%%)")
+    opciones = parser.parse_args(argumentos)
+
+    if opciones.orden == "comparar":
+        with open(opciones.base) as archivo_base, open(opciones.nuevo) as archivo_nuevo:
+            filas = comparar_informes(json.load(archivo_base), json.load(archivo_nuevo), opciones.umbral)
+        for algoritmo, grupo, metrica, valor_base, valor_nuevo, cambio, regresion in filas:
+            print(f"{algoritmo:6} {grupo:>3} {metrica:18} {valor_base:14.6g} {valor_nuevo:14.6g} {cambio:+8.1%}"
+                  + ("  REGRESIÓN" if regresion else ""))
+        regresiones = sum(1 for fila in filas if fila[-1])
+        print(f"{regresiones} regresiones", file=sys.stderr)
+        sys.exit(1 if regresiones else 0) # El código de salida permite usarlo en scripts.
+
+    if opciones.orden == "corpus":
+        documento = generar_corpus(opciones.semilla, opciones.por_grupo, opciones.grupos)
+    else:
+        with open(opciones.corpus) as archivo:
+            corpus = json.load(archivo)
+        def al_medir(algoritmo, grupo, datos): # Resumen legible en stderr mientras avanza.
+            tiempo = datos["tiempo"]
+            print(f"{algoritmo:6} d={grupo:>3}  {datos['resueltos']}/{datos['tableros']} resueltos"
+                  + (f"  mediana {tiempo['mediana'] * 1000:.2f} ms  p95 {tiempo['p95'] * 1000:.2f} ms" if tiempo else ""),
+                  file=sys.stderr)
+        documento = correr_banco(corpus, opciones.algoritmos, opciones.repeticiones,
+                                 opciones.limite_tiempo, opciones.limite_nodos, al_medir)
+    salida = sys.stdout if opciones.salida == "-" else open(opciones.salida, "w")
+    with salida:
+        if opciones.orden == "corpus":
+            escribir_corpus(documento, salida)
+        else:
+            json.dump(documento, salida, indent=1)
+            salida.write("\n")
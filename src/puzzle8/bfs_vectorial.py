@@ -0,0 +1,208 @@
+"""BFS por capas vectorizada con NumPy.
+
+Cada capa de la BFS es un arreglo ordenado de estados empaquetados (uint64) con otro arreglo
+paralelo para la casilla del vacío. Los sucesores de toda una capa se generan de una vez, una
+dirección cada vez, con las tablas de destino del vacío, y se deduplican ordenando (np.unique).
+El grafo del puzzle es bipartito, porque cada movimiento cambia el color de la casilla del
+vacío como en un tablero de ajedrez. Por eso los vecinos de la capa d solo pueden estar en las
+capas d-1 o d+1, y basta con quitar la capa anterior para quedarse con los estados nuevos.
+
+Respalda la construcción de la tabla de distancias y de las PDB, y el modo de resolución "BFS".
+Este módulo necesita NumPy; el núcleo lo importa solo cuando hace falta y, si no está
+instalado, usa sus versiones nodo a nodo.
+"""
+import numpy as np
+
+from .nucleo import (ESTADOS_POR_VACIO, FACTORIALES, SIN_DISTANCIA, TAMANO_TABLA_DISTANCIAS, BusquedaInterrumpida,
+                     Nodo, _en_marco_canonico, empaquetar, es_resoluble, memoria_mb, obtener_configuracion,
+                     obtener_movimientos)
+
+MAXIMO_LADO = 4 # Un estado empaquetado cabe en un uint64 hasta 4x4 (16 casillas de 4 bits).
+# Pico de memoria al expandir una capa, por estado de la capa: hasta 4 hijos con su vacío, los
+# temporales de cada dirección y los de np.unique (medido con tracemalloc: unos 133 bytes).
+BYTES_POR_ESTADO_EXPANDIDO = 136
+_destinos = {} # Tablas de destino del vacío, por tamaño de tablero.
+
+def destinos_por_direccion(configuracion):
+    """Arreglo (4, casillas): casilla a la que se mueve el vacío en cada dirección, o -1 si sale del tablero."""
+    n = configuracion.n
+    if n not in _destinos:
+        destinos = np.full((4, configuracion.casillas), -1, np.int64)
+        direcciones = {-n: 0, n: 1, -1: 2, 1: 3} # Arriba, abajo, izquierda, derecha.
+        for vacio, movimientos in enumerate(configuracion.movimientos):
+            for destino, _, _ in movimientos:
+                destinos[direcciones[destino - vacio], vacio] = destino
+        _destinos[n] = destinos
+    return _destinos[n]
+
+def sucesores(codigos, vacios, configuracion):
+    """Todos los hijos de una capa: devuelve (codigos, vacios), con repetidos."""
+    bits, mascara = np.uint64(configuracion.bits), np.uint64(configuracion.mascara)
+    hijos_codigos, hijos_vacios = [], []
+    for destinos in destinos_por_direccion(configuracion):
+        destino = destinos[vacios]
+        validos = destino >= 0
+        codigo = codigos[validos]
+        destino = destino[validos].astype(np.uint64)
+        desp_destino, desp_vacio = destino * bits, vacios[validos].astype(np.uint64) * bits
+        ficha = (codigo >> desp_destino) & mascara # Ficha que se desliza hacia el vacío.
+        # La casilla del vacío vale 0, así que sumar la ficha allí nunca desborda.
+        hijos_codigos.append(codigo + (ficha << desp_vacio) - (ficha << desp_destino))
+        hijos_vacios.append(destino.astype(np.uint8))
+    return np.concatenate(hijos_codigos), np.concatenate(hijos_vacios)
+
+def contenidos(valores, ordenados):
+    """Máscara de los `valores` que aparecen en el arreglo ordenado `ordenados`."""
+    if not len(ordenados):
+        return np.zeros(len(valores), bool)
+    posiciones = np.minimum(np.searchsorted(ordenados, valores), len(ordenados) - 1)
+    return ordenados[posiciones] == valores
+
+def capas(configuracion, codigo, vacio):
+    """Genera (distancia, codigos, vacios, generados) para cada capa de una BFS desde un estado.
+
+    `codigos` está ordenado; `generados` es el número de hijos (con repetidos) que produjo la
+    capa anterior. Los sucesores de una capa solo se calculan al pedir la siguiente.
+    """
+    if configuracion.n > MAXIMO_LADO:
+        raise ValueError(f"La BFS por capas solo admite tableros de hasta {MAXIMO_LADO}x{MAXIMO_LADO}")
+    anterior = np.empty(0, np.uint64)
+    codigos, vacios = np.array([codigo], np.uint64), np.array([vacio], np.uint8)
+    distancia, generados = 0, 0
+    while len(codigos):
+        yield distancia, codigos, vacios, generados
+        hijos, hijos_vacios = sucesores(codigos, vacios, configuracion)
+        generados = len(hijos)
+        hijos, primeros = np.unique(hijos, return_index=True)
+        nuevos = ~contenidos(hijos, anterior) # Grafo bipartito: solo pueden repetir la capa anterior.
+        anterior, codigos, vacios = codigos, hijos[nuevos], hijos_vacios[primeros][nuevos]
+        distancia += 1
+
+# --- Tabla completa de distancias (3x3) ---
+_PESOS_LEHMER = np.array(FACTORIALES[7::-1], np.int64) # 7!, 6!, ..., 0!
+_POSTERIORES = np.triu(np.ones((8, 8), bool), 1) # [i, j]: la posición j va después de la i.
+
+def indices_estado(codigos, vacios):
+    """Versión vectorizada de nucleo.indice_estado para arreglos de estados 3x3."""
+    fichas = ((codigos[:, None] >> (np.arange(9, dtype=np.uint64) * np.uint64(4))) & np.uint64(0xF)).astype(np.int8)
+    fichas = fichas[fichas != 0].reshape(-1, 8) # Cada fila tiene un solo vacío: quedan las 8 fichas en orden.
+    # Dígitos de Lehmer: para cada ficha, cuántas fichas menores aparecen después.
+    digitos = ((fichas[:, None, :] < fichas[:, :, None]) & _POSTERIORES).sum(axis=2)
+    return vacios.astype(np.int64) * ESTADOS_POR_VACIO + ((digitos @ _PESOS_LEHMER) >> 1)
+
+def construir_tabla_distancias_vectorial(meta=None):
+    """Como nucleo.construir_tabla_distancias, capa a capa: recorre los 181440 estados de una vez por capa."""
+    configuracion = obtener_configuracion(3, meta)
+    tabla = np.full(TAMANO_TABLA_DISTANCIAS, SIN_DISTANCIA, np.uint8)
+    for distancia, codigos, vacios, _ in capas(configuracion, configuracion.meta_codigo, configuracion.meta_vacio):
+        tabla[indices_estado(codigos, vacios)] = distancia
+    return bytearray(tabla.tobytes())
+
+# --- Bases de datos de patrones ---
+def construir_pdb_vectorial(configuracion, primera, cantidad):
+    """Como nucleo.construir_pdb, capa a capa; devuelve un bytearray con la misma tabla.
+
+    Es el mismo algoritmo aplicado a toda una capa a la vez: para cada estado se crece la
+    región libre del vacío como máscara de bits, se marca como cubierta y se mueven las
+    fichas del grupo vecinas a la región.
+    """
+    n, bits, casillas = configuracion.n, configuracion.bits, configuracion.casillas
+    tamano = 1 << (bits * cantidad)
+    tipo = np.uint16 if casillas <= 16 else np.uint32
+    todas = tipo((1 << casillas) - 1)
+    sin_primera_columna = tipo(sum(1 << i for i in range(casillas) if i % n))
+    sin_ultima_columna = tipo(sum(1 << i for i in range(casillas) if i % n != n - 1))
+    destinos = destinos_por_direccion(configuracion)
+    pdb = np.full(tamano, SIN_DISTANCIA, np.uint8)
+    cubiertas = np.zeros(tamano, tipo) # Casillas del vacío ya cubiertas para cada colocación.
+    desplazamientos = np.arange(cantidad, dtype=np.int64) * bits
+
+    indice_meta = (configuracion.meta_inverso >> (bits * primera)) & (tamano - 1)
+    indices, vacios = np.array([indice_meta], np.int64), np.array([configuracion.meta_vacio], np.int64)
+    distancia = 0
+    while len(indices):
+        claves = np.unique((indices << 5) | vacios) # Pares (indice, vacio) distintos.
+        indices, vacios = claves >> 5, claves & 31
+        nuevos = ((cubiertas[indices] >> vacios.astype(tipo)) & 1) == 0
+        indices, vacios = indices[nuevos], vacios[nuevos]
+        if not len(indices):
+            break
+        posiciones = (indices[:, None] >> desplazamientos) & configuracion.mascara
+        ocupadas = np.bitwise_or.reduce(np.left_shift(1, posiciones.astype(tipo), dtype=tipo), axis=1)
+        libres = todas & ~ocupadas
+        region = np.left_shift(1, vacios.astype(tipo), dtype=tipo)
+        while True: # Crece todas las regiones a la vez hasta que ninguna cambie.
+            vecinas = (((region << 1) & sin_primera_columna) | ((region >> 1) & sin_ultima_columna)
+                       | (region << n) | (region >> n))
+            nueva = region | (vecinas & libres)
+            if np.array_equal(nueva, region):
+                break
+            region = nueva
+        # Dos vacíos de la misma región de una colocación dan lo mismo: se deja uno.
+        claves, primeros = np.unique((indices << casillas) | region.astype(np.int64), return_index=True)
+        indices, region, posiciones = claves >> casillas, region[primeros], posiciones[primeros]
+        np.bitwise_or.at(cubiertas, indices, region)
+        sin_distancia = pdb[indices] == SIN_DISTANCIA
+        pdb[indices[sin_distancia]] = distancia
+
+        # Cada ficha del grupo vecina a la región se desliza hacia ella; el vacío queda donde estaba la ficha.
+        hijos_indices, hijos_vacios = [], []
+        for j in range(cantidad):
+            posicion = posiciones[:, j]
+            for destinos_direccion in destinos:
+                destino = destinos_direccion[posicion]
+                mueve = destino >= 0
+                mueve[mueve] = ((region[mueve] >> destino[mueve].astype(tipo)) & 1).astype(bool)
+                hijos_indices.append(indices[mueve] + ((destino[mueve] - posicion[mueve]) << desplazamientos[j]))
+                hijos_vacios.append(posicion[mueve])
+        indices, vacios = np.concatenate(hijos_indices), np.concatenate(hijos_vacios)
+        distancia += 1
+    return bytearray(pdb.tobytes())
+
+# --- Resolución por capas ---
+@_en_marco_canonico
+def busqueda_bfs_capas(estado_inicial, control=None, estadisticas=None, meta=None):
+    # BFS completa desde el estado inicial, una capa por iteración, hasta la capa que contiene la
+    # meta; la solución es óptima. Se guardan todas las capas (ordenadas) y el camino se
+    # reconstruye hacia atrás buscando en cada capa un vecino del estado actual. El control se
+    # revisa una vez por capa. Como la siguiente capa se reserva de una vez, el límite de memoria
+    # se comprueba antes con una estimación de lo que va a ocupar expandirla.
+    if len(estado_inicial) > MAXIMO_LADO:
+        raise ValueError(f"La BFS por capas solo admite tableros de hasta {MAXIMO_LADO}x{MAXIMO_LADO}")
+    if not es_resoluble(estado_inicial, meta):
+        return None, 0
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion)
+    meta = np.array([configuracion.meta_codigo], np.uint64)
+    guardadas = []
+    nodos_expandidos = 0
+    for distancia, codigos, _, generados in capas(configuracion, codigo_inicial, vacio_inicial):
+        guardadas.append(codigos)
+        if estadisticas is not None and distancia:
+            estadisticas.expandir(nodos_expandidos, len(codigos), distancia - 1, generados, len(guardadas[-2]))
+        if contenidos(meta, codigos)[0]:
+            break
+        nodos_expandidos += len(codigos) # Al pedir la siguiente capa se expande toda esta.
+        if control is not None:
+            control.revisar(nodos_expandidos, len(codigos), distancia)
+            if control.limite_memoria_mb is not None and \
+                    memoria_mb() + len(codigos) * BYTES_POR_ESTADO_EXPANDIDO / 2 ** 20 >= control.limite_memoria_mb:
+                raise BusquedaInterrumpida("limite_memoria", nodos_expandidos)
+
+    # Reconstrucción: de la meta hacia atrás, un vecino en cada capa anterior.
+    codigo, vacio = configuracion.meta_codigo, configuracion.meta_vacio
+    camino = [(codigo, vacio)]
+    for capa in reversed(guardadas[:-1]):
+        for codigo, vacio in obtener_movimientos(codigo, vacio, configuracion):
+            if contenidos(np.array([codigo], np.uint64), capa)[0]:
+                camino.append((codigo, vacio))
+                break
+    nodo = None
+    for codigo, vacio in reversed(camino):
+        nodo = Nodo(codigo, vacio, nodo)
+
+    if estadisticas is not None:
+        visitados = sum(len(capa) for capa in guardadas)
+        estadisticas.terminar("BFS", nodos_expandidos, duplicados=estadisticas.nodos_generados - (visitados - 1),
+                              visitados=visitados)
+    return nodo, nodos_expandidos
@@ -0,0 +1,164 @@
+"""Caché persistente de soluciones óptimas.
+
+Cada estado de un camino óptimo se guarda con su distancia restante a la meta y la casilla a
+la que se mueve el vacío en el siguiente paso. Como todos los estados del camino entran en
+la caché, los caminos que comparten un sufijo lo comparten también en ella, y cualquier
+consulta que llegue a un estado guardado termina siguiendo esos pasos. A* usa además las
+distancias guardadas como heurística exacta.
+
+En disco la caché es un registro al que solo se añaden entradas de 10 bytes (código, distancia,
+siguiente casilla), en orden de uso. Varios procesos pueden leerlo y añadir a la vez: las
+escrituras se hacen con un cerrojo y los lectores ignoran un registro final a medias. Cuando el
+archivo dobla la capacidad se compacta y se reemplaza de forma atómica, igual que las tablas.
+"""
+import os # Importa os para ubicar el registro en disco y reemplazarlo de forma atómica.
+import struct # Importa struct para el formato binario de las entradas.
+from collections import OrderedDict # Importa OrderedDict para el orden LRU de las entradas.
+
+try:
+    import fcntl # Cerrojo entre procesos; en Windows no existe y las escrituras van sin cerrojo.
+except ImportError:
+    fcntl = None
+
+from .nucleo import directorio_cache, normalizar_meta, obtener_configuracion
+
+ENTRADA = struct.Struct("<QBB") # Código empaquetado, distancia restante y casilla siguiente del vacío.
+SIN_SIGUIENTE = 0xFF # Casilla siguiente de la meta.
+CAPACIDAD_CACHE = 500_000 # Estados guardados por defecto (unos 5 MB en disco).
+
+def ruta_cache_soluciones(n, meta=None):
+    # Como las tablas, el nombre incluye la meta para no mezclar cachés de metas distintas.
+    return os.path.join(directorio_cache(), f"soluciones_{n}x{n}_{obtener_configuracion(n, meta).meta_codigo:x}.bin")
+
+class CacheSoluciones:
+    """Caché LRU de distancias exactas y siguientes movimientos, respaldada por un registro en disco.
+
+    Las entradas se mantienen en orden de uso y, al usar o añadir un estado, se usan también
+    todos los de su camino hasta la meta, en ese orden. Así el siguiente paso de un estado
+    siempre es más reciente que él, y expulsar por el extremo menos reciente nunca rompe un camino.
+    Guarda caminos hacia una sola meta (por defecto, el caracol); con otras metas se usa la de
+    su meta canónica (nucleo.Marco).
+    """
+    def __init__(self, n=3, capacidad=CAPACIDAD_CACHE, ruta=None, autoguardar=10_000, meta=None):
+        self.configuracion = obtener_configuracion(n, meta)
+        self.capacidad = capacidad # Máximo de estados en memoria y en disco tras compactar.
+        self.ruta = ruta or ruta_cache_soluciones(n, meta)
+        self.autoguardar = autoguardar # Entradas pendientes a partir de las que agregar_camino() guarda solo.
+        self.entradas = OrderedDict() # codigo -> (distancia, casilla siguiente del vacío), de menos a más reciente.
+        self.pendientes = [] # Códigos usados o añadidos desde el último guardado, en orden de uso.
+        self.aciertos = 0
+        self.fallos = 0
+        self._leido = 0 # Bytes del registro ya leídos.
+        self._inodo = None # Para notar que otro proceso compactó (reemplazó) el registro.
+        self.recargar()
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def recargar(self):
+        """Lee las entradas que otros procesos hayan añadido al registro desde la última lectura."""
+        try:
+            archivo = open(self.ruta, "rb")
+        except FileNotFoundError:
+            return
+        with archivo:
+            inodo = os.fstat(archivo.fileno()).st_ino
+            if inodo != self._inodo: # Archivo nuevo o compactado: se lee entero.
+                self._inodo, self._leido = inodo, 0
+            archivo.seek(self._leido)
+            datos = archivo.read()
+        completos = len(datos) - len(datos) % ENTRADA.size # Un registro final a medias aún se está escribiendo.
+        self._leido += completos
+        entradas = self.entradas
+        for codigo, distancia, siguiente in ENTRADA.iter_unpack(datos[:completos]):
+            entradas[codigo] = (distancia, siguiente)
+            entradas.move_to_end(codigo)
+        self._recortar()
+
+    def _recortar(self):
+        while len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+
+    def distancia(self, codigo):
+        """Distancia exacta a la meta de un estado empaquetado, o None si no está guardado."""
+        entrada = self.entradas.get(codigo)
+        return entrada[0] if entrada is not None else None
+
+    def camino(self, codigo, vacio):
+        """Lista de pares (codigo, vacio) desde el estado dado hasta la meta, o None si no está guardado."""
+        entradas, pendientes = self.entradas, self.pendientes
+        mascara, bits = self.configuracion.mascara, self.configuracion.bits
+        if codigo not in entradas:
+            self.fallos += 1
+            return None
+        pasos = []
+        while True:
+            distancia, siguiente = entradas[codigo]
+            entradas.move_to_end(codigo) # Uso en orden hacia la meta: el sucesor queda más reciente.
+            pendientes.append(codigo)
+            pasos.append((codigo, vacio))
+            if siguiente == SIN_SIGUIENTE:
+                break
+            ficha = (codigo >> (bits * siguiente)) & mascara
+            codigo = codigo + (ficha << (bits * vacio)) - (ficha << (bits * siguiente))
+            vacio = siguiente
+        self.aciertos += 1
+        return pasos
+
+    def agregar_camino(self, pasos):
+        """Guarda un camino óptimo dado como lista de pares (codigo, vacio) que termina en la meta."""
+        entradas, pendientes = self.entradas, self.pendientes
+        restantes = len(pasos) - 1
+        for i, (codigo, _) in enumerate(pasos):
+            # Si el estado ya estaba se sustituye su siguiente paso por el de este camino, que
+            # es igual de corto y acaba de usarse entero.
+            entradas[codigo] = (restantes - i, pasos[i + 1][1] if i < restantes else SIN_SIGUIENTE)
+            entradas.move_to_end(codigo)
+            pendientes.append(codigo)
+        self._recortar()
+        if len(pendientes) >= self.autoguardar:
+            self.guardar()
+
+    def guardar(self):
+        """Añade al registro en disco las entradas usadas o nuevas, compactándolo si hace falta."""
+        if not self.pendientes:
+            return
+        entradas = self.entradas
+        datos = b"".join(ENTRADA.pack(codigo, *entradas[codigo]) for codigo in self.pendientes if codigo in entradas)
+        self.pendientes = []
+        os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+        with open(self.ruta + ".lock", "wb") as cerrojo:
+            if fcntl is not None:
+                fcntl.flock(cerrojo, fcntl.LOCK_EX)
+            self.recargar() # Primero lo que escribieron otros, para que lo nuestro quede como lo más reciente.
+            with open(self.ruta, "ab") as archivo:
+                archivo.write(datos)
+                self._inodo = os.fstat(archivo.fileno()).st_ino # Por si el archivo no existía aún.
+            self._leido += len(datos)
+            if os.path.getsize(self.ruta) > 2 * self.capacidad * ENTRADA.size:
+                self._compactar()
+
+    def _compactar(self):
+        # Reescribe el registro con una sola entrada por estado, de menos a más reciente.
+        # Se llama con el cerrojo tomado y con todo el registro ya leído.
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(b"".join(ENTRADA.pack(codigo, distancia, siguiente)
+                                   for codigo, (distancia, siguiente) in self.entradas.items()))
+        os.replace(temporal, self.ruta)
+        self._inodo = os.stat(self.ruta).st_ino
+        self._leido = len(self.entradas) * ENTRADA.size
+
+_caches = {} # Cachés abiertas en este proceso, por (tamaño de tablero, meta).
+
+def obtener_cache(n=3, meta=None):
+    """Devuelve (y memoriza) la caché de soluciones del proceso para un tablero n x n y una meta."""
+    meta = normalizar_meta(meta)
+    cache = _caches.get((n, meta))
+    if cache is None:
+        cache = _caches[(n, meta)] = CacheSoluciones(n, meta=meta)
+    return cache
+
+def caches_abiertas():
+    """Cachés de soluciones abiertas en este proceso."""
+    return list(_caches.values())
@@ -0,0 +1,66 @@
+"""Línea de órdenes: python -m puzzle8 [solve|lote|bench] ...; sin orden abre la ventana.
+
+Cada orden importa solo lo que necesita, así que `solve` arranca sin cargar pygame,
+multiprocessing ni el resto de módulos de los lotes y del banco de pruebas.
+"""
+import sys # Importa sys para leer los argumentos de la línea de órdenes.
+
+from .nucleo import ALGORITMOS, meta_desde_texto, resolver_uno, tablero_desde_lista
+
+def main_solve(argumentos):
+    # Punto de entrada: python -m puzzle8 solve 1 2 3 8 0 4 7 6 5 --algoritmo IDA*
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog="puzzle8 solve", description="Resuelve un tablero y escribe el resultado en JSON.")
+    parser.add_argument("tablero", nargs="+",
+                        help="fichas por filas con 0 para el vacío (separadas por espacios o comas, o como lista JSON)")
+    parser.add_argument("--algoritmo", choices=list(ALGORITMOS), default="A*")
+    parser.add_argument("--limite-tiempo", type=float, default=None, help="segundos máximos")
+    parser.add_argument("--limite-nodos", type=int, default=None, help="nodos expandidos máximos")
+    parser.add_argument("--limite-memoria", type=float, default=None, help="MB máximos de memoria residente")
+    parser.add_argument("--estadisticas", action="store_true", help="añadir las estadísticas detalladas de la búsqueda")
+    parser.add_argument("--cache", action="store_true", help="usar y ampliar la caché de soluciones en disco (solo A*)")
+    parser.add_argument("--meta", default=None, help="caracol (por defecto), filas o la lista de fichas de la meta")
+    opciones = parser.parse_args(argumentos)
+
+    texto = " ".join(opciones.tablero).replace("[", " ").replace("]", " ").replace(",", " ")
+    try:
+        valores = [int(valor) for valor in texto.split()]
+    except ValueError:
+        parser.error("el tablero solo puede contener números")
+    try:
+        estado = tablero_desde_lista(valores)
+    except ValueError as error:
+        parser.error(f"tablero inválido: {error}")
+    meta = None
+    if opciones.meta is not None:
+        try:
+            meta = meta_desde_texto(opciones.meta, len(estado))
+        except ValueError:
+            parser.error("la meta tiene que ser caracol, filas o un tablero cuadrado de números")
+    resultado = resolver_uno(None, estado, opciones.algoritmo, opciones.limite_tiempo, opciones.limite_nodos,
+                             opciones.limite_memoria, opciones.estadisticas, opciones.cache, meta)
+    if opciones.cache:
+        from .cache import caches_abiertas
+        for cache in caches_abiertas():
+            cache.guardar()
+    del resultado["id"]
+    sys.stdout.write(json.dumps(resultado) + "\n")
+    # "sin_solucion" también es una respuesta válida; el resto (límites, errores) no.
+    sys.exit(0 if resultado["estado"] in ("resuelto", "sin_solucion") else 1)
+
+def main(argumentos=None):
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    orden = argumentos[0] if argumentos else None
+    if orden == "solve":
+        main_solve(argumentos[1:])
+    elif orden == "lote":
+        from .lote import main_lote
+        main_lote(argumentos[1:]) # Modo por lotes, sin ventana.
+    elif orden == "bench":
+        from .banco import main_banco
+        main_banco(argumentos[1:]) # Banco de pruebas, sin ventana.
+    else:
+        from .gui import main as main_gui
+        main_gui()
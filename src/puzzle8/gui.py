@@ -0,0 +1,589 @@
+"""Interfaz gráfica con Pygame.
+
+pygame solo se importa al abrir la ventana: importar este módulo (por ejemplo, en el proceso
+que resuelve en segundo plano) no carga SDL.
+"""
+import multiprocessing # Importa multiprocessing para resolver en segundo plano desde la GUI.
+import os # Importa os para silenciar el saludo de pygame.
+import queue # Importa queue para recoger sin bloquear los mensajes del proceso que resuelve.
+import time # Importa time para medir el tiempo de ejecución de los algoritmos de búsqueda.
+
+from .nucleo import (ALGORITMOS, METAS, BusquedaInterrumpida, ControlBusqueda, EstadisticasBusqueda,
+                     busqueda_a_star_anytime, fichas_movidas, generar_estado_aleatorio, obtener_configuracion,
+                     obtener_marco, reconstruir_solucion)
+
+# --- Resolución en segundo plano para la GUI ---
+# La búsqueda corre en otro proceso para que la ventana siga respondiendo (y dibujándose)
+# mientras tanto. El proceso envía mensajes por una cola:
+#   ("progreso", nodos_expandidos, frontera, cota, segundos)
+#   ("mejora", camino, fichas, cota_suboptimo, nodos_expandidos, segundos)  (solo ARA*, antes del resultado)
+#   ("resultado", camino, nodos_expandidos, segundos, estadisticas)
+#   ("interrumpida", motivo, nodos_expandidos, segundos)
+#   ("error", texto)
+MENSAJES_INTERRUPCION = {
+    "cancelada": "Búsqueda cancelada",
+    "limite_nodos": "Límite de nodos alcanzado",
+    "limite_memoria": "Límite de memoria alcanzado",
+    "limite_tiempo": "Límite de tiempo alcanzado",
+}
+
+def _resolver_en_segundo_plano(estado, algoritmo, limites, cola, cancelar, meta=None):
+    ultimo_aviso = [0.0]
+
+    def al_progreso(nodos_expandidos, frontera, cota, segundos):
+        if segundos - ultimo_aviso[0] >= 0.05: # Como mucho unos 20 avisos por segundo.
+            ultimo_aviso[0] = segundos
+            cola.put(("progreso", nodos_expandidos, frontera, cota, segundos))
+
+    control = ControlBusqueda(*limites, cancelado=cancelar.is_set, al_progreso=al_progreso)
+    estadisticas = EstadisticasBusqueda() # Para el panel de estadísticas de la ventana.
+    marco = obtener_marco(len(estado), meta) # Se busca hacia la meta canónica, con sus tablas.
+    try:
+        if algoritmo == "ARA*": # Cada mejora se envía en cuanto llega, para mostrarla mientras se refina.
+            nodo, nodos_expandidos = None, 0
+            for nodo, nodos_expandidos, cota in busqueda_a_star_anytime(marco.a_canonico(estado), control=control,
+                                                                        estadisticas=estadisticas, meta=marco.canonica):
+                camino = [marco.desde_canonico(paso) for paso in reconstruir_solucion(nodo, len(estado))]
+                fichas = marco.fichas_desde_canonico(fichas_movidas(nodo, obtener_configuracion(len(estado),
+                                                                                                marco.canonica)))
+                cola.put(("mejora", camino, fichas, cota, nodos_expandidos, time.perf_counter() - control.inicio))
+        else:
+            nodo, nodos_expandidos = ALGORITMOS[algoritmo](marco.a_canonico(estado), control=control,
+                                                           estadisticas=estadisticas, meta=marco.canonica)
+    except BusquedaInterrumpida as interrupcion:
+        cola.put(("interrumpida", interrupcion.motivo, interrupcion.nodos_expandidos,
+                  time.perf_counter() - control.inicio))
+        return
+    except (ValueError, MemoryError) as error:
+        cola.put(("error", str(error) or "Memoria agotada"))
+        return
+    segundos = time.perf_counter() - control.inicio
+    # Se envía el camino ya reconstruido y con los nombres de la meta pedida: la cadena de nodos
+    # no hace falta fuera de aquí.
+    camino = [marco.desde_canonico(paso) for paso in reconstruir_solucion(nodo, len(estado))] if nodo is not None else []
+    cola.put(("resultado", camino, nodos_expandidos, segundos, estadisticas.como_diccionario()))
+
+# --- Interfaz Gráfica Pygame ---
+# Todo lo que se dibuja (fichas, botones, textos) se renderiza una sola vez y se guarda; cada
+# fotograma solo compone listas de (superficie, posición) por región de la ventana y vuelve a
+# pintar, y a enviar a la pantalla, únicamente las regiones cuya lista cambió.
+
+DURACION_PASO = 0.25 # Segundos que tarda en deslizarse una ficha al reproducir la solución.
+DURACION_MAXIMA_REPRODUCCION = 30.0 # Las soluciones largas se aceleran para durar como mucho esto.
+FICHAS_MEJORA = 12 # Fichas de la mejor solución de ARA* que se listan mientras se refina.
+MAXIMO_TEXTOS = 512 # Textos renderizados guardados; el progreso cambia en cada aviso, así que se vacía al llegar aquí.
+
+def main(limite_nodos=5_000_000, limite_memoria_mb=2048, limite_tiempo=120.0):
+    # Los límites son los presupuestos de cada búsqueda lanzada desde la ventana (None = sin límite).
+    # pygame se importa aquí y no al cargar el módulo: el núcleo, los lotes y la línea de órdenes
+    # no pagan su importación ni la inicialización de SDL, y funcionan en servidores sin pantalla.
+    # Sin esta variable pygame escribe un saludo en la salida estándar al importarse.
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame # Importa el módulo pygame para la creación de la interfaz gráfica de usuario (GUI).
+
+    pygame.init() # Inicializa todos los módulos de Pygame.
+
+    WIDTH, HEIGHT = 900, 740 # Define el ancho y alto de la ventana.
+    screen = pygame.display.set_mode((WIDTH, HEIGHT)) # Crea la ventana de visualización.
+    pygame.display.set_caption("Puzzle 8 Solver") # Establece el título de la ventana.
+    reloj = pygame.time.Clock() # Un solo reloj para todo el bucle: así tick() limita de verdad los fotogramas.
+
+    # Definición de colores RGB.
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    GRAY = (200, 200, 200)
+    GREEN = (0, 200, 0)
+    DARK_GREEN = (0, 150, 0)
+    BLUE = (50, 50, 200)
+    DARK_BLUE = (30, 30, 150)
+
+    # Definición de fuentes para el texto.
+    font_large = pygame.font.Font(None, 74) # Fuente grande para los números del puzzle.
+    font_medium = pygame.font.Font(None, 40) # Fuente mediana para títulos y botones.
+    font_small = pygame.font.Font(None, 30) # Fuente pequeña para estadísticas.
+    font_tiny = pygame.font.Font(None, 24) # Fuente para el panel de estadísticas detalladas.
+
+    tamano = 3 # Lado del tablero (3x3 o 4x4).
+    nombre_meta = "caracol" # Meta del puzzle: "caracol" o "filas" (ver nucleo.METAS).
+    meta = METAS[nombre_meta](tamano)
+    estado_inicial = generar_estado_aleatorio(tamano, meta) # Genera un estado inicial resoluble aleatorio.
+
+    # Variables para almacenar los resultados de la solución.
+    solucion_path = None # El camino de estados que lleva a la solución.
+    movimientos = 0 # Número de movimientos en la solución.
+    tiempo_ejecucion = 0.0 # Tiempo que tardó el algoritmo en resolver.
+    nodos_expandidos = 0 # Número de nodos expandidos por el algoritmo.
+    estadisticas = None # Estadísticas detalladas de la última búsqueda (EstadisticasBusqueda.como_diccionario()).
+    cota_suboptimo = None # Con ARA*: la solución mostrada cuesta como mucho cota * óptimo.
+    fichas_mejora = [] # Con ARA*, mientras se refina: fichas que mueve la mejor solución hasta ahora.
+    algoritmo_seleccionado = None # Almacena el algoritmo de búsqueda seleccionado ("DFS", "A*", "ARA*", "Tabla", "IDA*", "Bidir" o "BFS").
+
+    # Banderas para controlar el estado de la GUI.
+    solving_in_progress = False # True si un algoritmo está en ejecución.
+    solution_found_display = False # True si se ha encontrado una solución y se debe mostrar.
+
+    # Estado de la búsqueda en segundo plano.
+    proceso = None # Proceso que resuelve el puzzle.
+    cola = None # Cola por la que llegan el progreso y el resultado.
+    cancelar = None # Evento para pedir al proceso que se detenga.
+    progreso = None # Último aviso de progreso: (nodos, frontera, cota, segundos).
+    mensaje_estado = None # Motivo por el que terminó sin solución (cancelada, límite...), si lo hay.
+    cancelado_en = None # Momento en que se pidió cancelar (para forzar la parada si no responde).
+
+    # Estado de la reproducción de la solución.
+    paso = 0 # Índice en solucion_path del tablero que se muestra.
+    reproduciendo = False # True mientras la solución avanza sola, ficha a ficha.
+    inicio_paso = 0.0 # Momento en que empezó a deslizarse la ficha del paso actual.
+    duracion_paso = DURACION_PASO
+    arrastrando = False # True mientras se arrastra la barra de la reproducción.
+
+    # Definición de los botones para seleccionar algoritmos.
+    buttons_alg = [
+        {"rect": pygame.Rect(20 + i * 125, 20, 115, 50), "text": nombre, "color": GRAY, "hover_color": (150, 150, 150), "value": nombre}
+        for i, nombre in enumerate(("DFS", "A*", "ARA*", "Tabla", "IDA*", "Bidir", "BFS"))
+    ]
+    # Definición de los botones "Empezar" y "Reset".
+    start_button = {"rect": pygame.Rect(20, 90, 130, 50), "text": "Empezar", "color": GREEN, "hover_color": DARK_GREEN, "value": "START"}
+    reset_button = {"rect": pygame.Rect(165, 90, 130, 50), "text": "Reset", "color": BLUE, "hover_color": DARK_BLUE, "value": "RESET"}
+    # Botón para alternar el tamaño del tablero entre 3x3 y 4x4.
+    size_button = {"rect": pygame.Rect(310, 90, 130, 50), "text": "3x3", "color": GRAY, "hover_color": (150, 150, 150), "value": "SIZE"}
+    # Botón para alternar la meta entre el caracol y la meta por filas.
+    meta_button = {"rect": pygame.Rect(455, 90, 130, 50), "text": "Caracol", "color": GRAY, "hover_color": (150, 150, 150), "value": "META"}
+    # Botón para cancelar la búsqueda en curso; ocupa el sitio de "Empezar", que mientras tanto no se usa.
+    cancel_button = {"rect": pygame.Rect(20, 90, 130, 50), "text": "Cancelar", "color": (230, 120, 120), "hover_color": (200, 80, 80), "value": "CANCEL"}
+    # Controles de la reproducción: al principio, paso anterior, reproducir/pausa, paso siguiente y al final.
+    play_buttons = [
+        {"rect": pygame.Rect(x, HEIGHT - 65, ancho, 45), "text": texto_boton, "color": GRAY, "hover_color": (150, 150, 150), "value": valor}
+        for x, ancho, texto_boton, valor in ((20, 50, "|<", "INICIO"), (75, 50, "<", "ANTERIOR"), (130, 95, "Play", "PLAY"),
+                                             (230, 50, ">", "SIGUIENTE"), (285, 50, ">|", "FIN"))
+    ]
+    barra = pygame.Rect(360, HEIGHT - 47, WIDTH - 500, 10) # Barra para moverse por la solución arrastrando.
+
+    # Regiones de la ventana que se repintan por separado (además de un botón por región).
+    region_etiqueta = pygame.Rect(600, 90, WIDTH - 600, 55) # Nombre del algoritmo seleccionado.
+    region_izquierda = pygame.Rect(0, 150, WIDTH // 2, HEIGHT - 240) # Puzzle inicial y panel de estadísticas.
+    region_derecha = pygame.Rect(WIDTH // 2, 150, WIDTH - WIDTH // 2, HEIGHT - 240) # Solución.
+    region_inferior = pygame.Rect(0, HEIGHT - 90, WIDTH, 90) # Progreso de la búsqueda o reproducción.
+
+    # Superficies ya renderizadas: fichas, botones y piezas de la barra, por su aspecto.
+    superficies = {}
+    textos = {} # Textos renderizados, por (fuente, texto, color).
+
+    def superficie(clave, crear):
+        resultado = superficies.get(clave)
+        if resultado is None:
+            resultado = superficies[clave] = crear()
+        return resultado
+
+    def texto(fuente, contenido, color=BLACK):
+        # Devuelve el texto renderizado, renderizándolo solo la primera vez.
+        clave = (fuente, contenido, color)
+        resultado = textos.get(clave)
+        if resultado is None:
+            if len(textos) >= MAXIMO_TEXTOS:
+                textos.clear()
+            resultado = textos[clave] = fuente.render(contenido, True, color)
+        return resultado
+
+    def crear_ficha(valor, lado):
+        ficha = pygame.Surface((lado, lado), pygame.SRCALPHA)
+        if valor != 0: # Si la celda no es el espacio vacío.
+            # Fondo gris claro, borde negro y el número centrado.
+            pygame.draw.rect(ficha, (230, 230, 230), (0, 0, lado, lado), border_radius=8)
+            pygame.draw.rect(ficha, BLACK, (0, 0, lado, lado), 2, border_radius=8)
+            numero = font_large.render(str(valor), True, BLACK)
+            ficha.blit(numero, numero.get_rect(center=(lado // 2, lado // 2)))
+        else: # El espacio vacío es un rectángulo azul claro.
+            pygame.draw.rect(ficha, (200, 220, 240), (0, 0, lado, lado), border_radius=8)
+        return ficha
+
+    def crear_boton(texto_boton, color, seleccionado, ancho, alto):
+        # El botón se dibuja con 3 píxeles de margen para que quepa el borde de selección.
+        boton = pygame.Surface((ancho + 6, alto + 6), pygame.SRCALPHA)
+        cuerpo = pygame.Rect(3, 3, ancho, alto)
+        if seleccionado: # Algoritmo seleccionado: borde azul.
+            pygame.draw.rect(boton, BLUE, cuerpo.inflate(6, 6), 3, border_radius=10)
+        pygame.draw.rect(boton, color, cuerpo, border_radius=10)
+        etiqueta = font_medium.render(texto_boton, True, BLACK)
+        boton.blit(etiqueta, etiqueta.get_rect(center=cuerpo.center))
+        return boton
+
+    def crear_pomo():
+        pomo = pygame.Surface((22, 22), pygame.SRCALPHA)
+        pygame.draw.circle(pomo, BLUE, (11, 11), 10)
+        return pomo
+
+    def crear_riel(ancho, alto):
+        riel = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+        pygame.draw.rect(riel, GRAY, (0, 0, ancho, alto), border_radius=alto // 2)
+        return riel
+
+    # Función para dibujar un botón: añade su superficie a la lista de la región.
+    def draw_button(operaciones, button_data, mouse_pos, current_alg_selected=None):
+        rect = button_data["rect"]
+        # Cambia el color del botón si el ratón está sobre él.
+        current_color = button_data["hover_color"] if rect.collidepoint(mouse_pos) else button_data["color"]
+        seleccionado = button_data["value"] == current_alg_selected
+        boton = superficie(("boton", button_data["text"], current_color, seleccionado, rect.width, rect.height),
+                           lambda: crear_boton(button_data["text"], current_color, seleccionado, rect.width, rect.height))
+        operaciones.append((boton, (rect.x - 3, rect.y - 3)))
+
+    # Función para dibujar la cuadrícula del puzzle. Con `siguiente`, la ficha que se mueve para
+    # llegar a ese tablero se dibuja a una fracción `avance` de su recorrido.
+    def dibujar_puzzle_grid(estado, operaciones, offset_x=0, offset_y=0, tile_size=100, siguiente=None, avance=0.0):
+        TILE_SIZE = tile_size # Tamaño de cada celda (ficha) del puzzle.
+        TILE_MARGIN = 5 # Margen entre celdas.
+        celda = TILE_SIZE + TILE_MARGIN
+        n = len(estado)
+
+        movil = None # (valor, fila, columna) de la ficha que se desliza hacia el vacío.
+        if siguiente is not None:
+            for r in range(n):
+                for c in range(n):
+                    if siguiente[r][c] == 0: # El vacío de `siguiente` es la casilla que deja la ficha.
+                        movil = (estado[r][c], r, c)
+                    if estado[r][c] == 0:
+                        fila_vacio, columna_vacio = r, c
+
+        for r in range(n): # Itera sobre las filas.
+            for c in range(n): # Itera sobre las columnas.
+                valor = estado[r][c] # Obtiene el valor de la celda.
+                if movil is not None and valor == movil[0]:
+                    valor = 0 # Mientras se desliza, su casilla de origen se ve vacía.
+                ficha = superficie(("ficha", valor, TILE_SIZE), lambda: crear_ficha(valor, TILE_SIZE))
+                operaciones.append((ficha, (offset_x + c * celda, offset_y + r * celda)))
+
+        if movil is not None:
+            valor, fila, columna = movil
+            t = avance * avance * (3 - 2 * avance) # Arranca y frena suavemente.
+            ficha = superficie(("ficha", valor, TILE_SIZE), lambda: crear_ficha(valor, TILE_SIZE))
+            operaciones.append((ficha, (offset_x + round((columna + (columna_vacio - columna) * t) * celda),
+                                        offset_y + round((fila + (fila_vacio - fila) * t) * celda))))
+
+    def hay_reproduccion():
+        # Hay una solución terminada con al menos un movimiento que reproducir.
+        return solution_found_display and not solving_in_progress and solucion_path is not None and len(solucion_path) > 1
+
+    def ir_a_paso(nuevo):
+        # Muestra un paso de la solución sin animación (botones, teclas y barra).
+        nonlocal paso, reproduciendo
+        paso = max(0, min(nuevo, len(solucion_path) - 1))
+        reproduciendo = False
+
+    def paso_en_barra(x):
+        return round((x - barra.x) / barra.width * (len(solucion_path) - 1))
+
+    def alternar_reproduccion(ahora):
+        nonlocal paso, reproduciendo, inicio_paso
+        if not reproduciendo and paso == len(solucion_path) - 1: # Al final, vuelve a empezar.
+            paso = 0
+        reproduciendo = not reproduciendo
+        inicio_paso = ahora
+
+    anteriores = {} # Lista de (superficie, posición) con que se pintó cada región la última vez.
+    screen.fill(WHITE) # Rellena el fondo de la pantalla con blanco.
+    pygame.display.flip()
+
+    running = True # Bucle principal del juego.
+    while running:
+        ahora = time.perf_counter()
+
+        for event in pygame.event.get(): # Procesa los eventos de Pygame.
+            if event.type == pygame.QUIT: # Si el usuario cierra la ventana.
+                running = False # Sale del bucle principal.
+                if solving_in_progress:
+                    proceso.terminate() # No tiene sentido esperar a una búsqueda que nadie va a ver.
+
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): # La ventana se tapó: se repinta entera.
+                anteriores = {}
+                screen.fill(WHITE)
+                pygame.display.flip()
+
+            if event.type == pygame.MOUSEBUTTONUP:
+                arrastrando = False
+
+            if event.type == pygame.MOUSEMOTION and arrastrando and hay_reproduccion():
+                ir_a_paso(paso_en_barra(event.pos[0]))
+
+            if event.type == pygame.KEYDOWN and hay_reproduccion(): # Flechas, espacio, Inicio y Fin.
+                if event.key == pygame.K_SPACE:
+                    alternar_reproduccion(ahora)
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    ir_a_paso(paso + (1 if event.key == pygame.K_RIGHT else -1))
+                elif event.key in (pygame.K_HOME, pygame.K_END):
+                    ir_a_paso(0 if event.key == pygame.K_HOME else len(solucion_path) - 1)
+
+            if event.type == pygame.MOUSEBUTTONDOWN: # Si se hace clic con el ratón.
+                mouse_x, mouse_y = event.pos # Obtiene las coordenadas del clic.
+
+                if hay_reproduccion():
+                    for btn in play_buttons:
+                        if btn["rect"].collidepoint(mouse_x, mouse_y):
+                            if btn["value"] == "PLAY":
+                                alternar_reproduccion(ahora)
+                            else:
+                                ir_a_paso({"INICIO": 0, "ANTERIOR": paso - 1, "SIGUIENTE": paso + 1,
+                                           "FIN": len(solucion_path) - 1}[btn["value"]])
+                    if barra.inflate(0, 24).collidepoint(mouse_x, mouse_y): # Clic en la barra: salta y empieza a arrastrar.
+                        arrastrando = True
+                        ir_a_paso(paso_en_barra(mouse_x))
+
+                for btn in buttons_alg: # Itera sobre los botones de selección de algoritmo.
+                    # Si el clic fue en un botón de algoritmo (no se cambia mientras se resuelve).
+                    if btn["rect"].collidepoint(mouse_x, mouse_y) and not solving_in_progress:
+                        algoritmo_seleccionado = btn["value"] # Establece el algoritmo seleccionado.
+                        # Reinicia las variables de solución al cambiar de algoritmo.
+                        solucion_path = None
+                        movimientos = 0
+                        tiempo_ejecucion = 0.0
+                        nodos_expandidos = 0
+                        estadisticas = None
+                        cota_suboptimo = None
+                        solution_found_display = False
+
+                # Si el clic fue en el botón "Empezar" y no hay una solución en progreso.
+                if start_button["rect"].collidepoint(mouse_x, mouse_y) and not solving_in_progress:
+                    if algoritmo_seleccionado: # Si se ha seleccionado un algoritmo.
+                        solving_in_progress = True # Indica que la solución está en progreso.
+                        # Reinicia las variables de solución.
+                        solucion_path = None
+                        movimientos = 0
+                        tiempo_ejecucion = 0.0
+                        nodos_expandidos = 0
+                        estadisticas = None
+                        cota_suboptimo = None
+                        solution_found_display = False
+
+                        progreso = None
+                        mensaje_estado = None
+                        cancelado_en = None
+                        print(f"Resolviendo con {algoritmo_seleccionado}...")
+                        # Lanza la búsqueda en otro proceso; el bucle principal sigue dibujando
+                        # la ventana y recoge el progreso y el resultado por la cola.
+                        cola = multiprocessing.Queue()
+                        cancelar = multiprocessing.Event()
+                        proceso = multiprocessing.Process(
+                            target=_resolver_en_segundo_plano,
+                            args=(estado_inicial, algoritmo_seleccionado, (limite_nodos, limite_memoria_mb, limite_tiempo), cola, cancelar,
+                                  meta),
+                            daemon=True)
+                        proceso.start()
+
+                # Si el clic fue en el botón "Cancelar" mientras se resuelve, pide al proceso que pare
+                # (con elif: el mismo clic que acaba de empezar la búsqueda no la cancela).
+                elif cancel_button["rect"].collidepoint(mouse_x, mouse_y) and solving_in_progress:
+                    cancelar.set()
+                    cancelado_en = time.perf_counter()
+
+                # Si el clic fue en el botón de tamaño, cambia de tablero y genera un puzzle nuevo.
+                if size_button["rect"].collidepoint(mouse_x, mouse_y) and not solving_in_progress:
+                    tamano = 4 if tamano == 3 else 3
+                    size_button["text"] = f"{tamano}x{tamano}"
+
+                # Si el clic fue en el botón de meta, cambia de meta y genera un puzzle nuevo.
+                if meta_button["rect"].collidepoint(mouse_x, mouse_y) and not solving_in_progress:
+                    nombre_meta = "filas" if nombre_meta == "caracol" else "caracol"
+                    meta_button["text"] = nombre_meta.capitalize()
+
+                # Si el clic fue en el botón "Reset" (o en el de tamaño o meta) y no hay una solución en progreso.
+                if any(boton["rect"].collidepoint(mouse_x, mouse_y) for boton in (reset_button, size_button, meta_button)) \
+                        and not solving_in_progress:
+                    meta = METAS[nombre_meta](tamano)
+                    estado_inicial = generar_estado_aleatorio(tamano, meta) # Genera un nuevo estado inicial aleatorio.
+                    # Reinicia todas las variables de solución y estado de la GUI.
+                    solucion_path = None
+                    movimientos = 0
+                    tiempo_ejecucion = 0.0
+                    nodos_expandidos = 0
+                    estadisticas = None
+                    cota_suboptimo = None
+                    algoritmo_seleccionado = None
+                    solution_found_display = False
+                    print("\nNuevo puzzle generado.")
+
+        # Recoge los mensajes del proceso que resuelve sin bloquear el bucle.
+        while solving_in_progress:
+            try:
+                mensaje = cola.get_nowait()
+            except queue.Empty:
+                if not proceso.is_alive() and cola.empty(): # El proceso murió sin avisar (p. ej. sin memoria).
+                    mensaje = ("error", "El proceso de búsqueda terminó inesperadamente")
+                elif cancelado_en is not None and time.perf_counter() - cancelado_en > 2.0:
+                    proceso.terminate() # No respondió a la cancelación a tiempo: se detiene a la fuerza.
+                    mensaje = ("interrumpida", "cancelada", progreso[0] if progreso else 0,
+                               progreso[3] if progreso else 0.0)
+                else:
+                    break
+            tipo = mensaje[0]
+            if tipo == "progreso":
+                progreso = mensaje[1:]
+                continue
+            if tipo == "mejora": # ARA* sigue refinando: se muestra la mejor solución hasta ahora.
+                solucion_path, fichas_mejora, cota_suboptimo, nodos_expandidos, tiempo_ejecucion = mensaje[1:]
+                movimientos = len(solucion_path) - 1
+                continue
+            # Cualquier otro mensaje es el final de la búsqueda.
+            solving_in_progress = False # Indica que la solución ha terminado.
+            solution_found_display = True
+            proceso.join(timeout=1)
+            if tipo == "resultado":
+                solucion_path, nodos_expandidos, tiempo_ejecucion, estadisticas = mensaje[1:]
+                if solucion_path: # Si se encontró una solución.
+                    # Calcula el número de movimientos (longitud del camino - 1).
+                    movimientos = len(solucion_path) - 1
+                    print(f"Solución encontrada en {movimientos} movimientos con {algoritmo_seleccionado}.")
+                else: # Si no se encontró una solución.
+                    movimientos = 0
+                    print(f"No se encontró solución con {algoritmo_seleccionado}.")
+                print(f"Nodos expandidos: {nodos_expandidos}")
+            elif tipo == "interrumpida":
+                motivo, nodos_expandidos, tiempo_ejecucion = mensaje[1:]
+                solucion_path = []
+                mensaje_estado = MENSAJES_INTERRUPCION[motivo]
+                print(f"{mensaje_estado} ({nodos_expandidos} nodos expandidos).")
+            else: # "error"
+                solucion_path = []
+                mensaje_estado = mensaje[1]
+                print(mensaje_estado)
+            # La solución se reproduce desde el principio; las muy largas, más deprisa.
+            paso, reproduciendo, inicio_paso = 0, hay_reproduccion(), ahora
+            duracion_paso = min(DURACION_PASO, DURACION_MAXIMA_REPRODUCCION / max(movimientos, 1))
+
+        # Avanza la reproducción según el tiempo transcurrido (varios pasos si la solución es muy larga).
+        avance = 0.0 # Fracción del recorrido de la ficha que se está moviendo.
+        if reproduciendo and hay_reproduccion():
+            avance = (ahora - inicio_paso) / duracion_paso
+            if avance >= 1:
+                pasos = int(avance)
+                paso = min(paso + pasos, len(solucion_path) - 1)
+                inicio_paso += pasos * duracion_paso
+                avance -= pasos
+                if paso == len(solucion_path) - 1:
+                    reproduciendo, avance = False, 0.0
+
+        # --- Composición de las regiones ---
+        mouse_pos = pygame.mouse.get_pos() # Obtiene la posición actual del ratón.
+        regiones = {} # nombre -> (rect, lista de (superficie, posición)).
+
+        for btn in buttons_alg: # Dibuja los botones de selección de algoritmo.
+            operaciones = []
+            draw_button(operaciones, btn, mouse_pos, algoritmo_seleccionado)
+            regiones[btn["value"]] = (btn["rect"].inflate(8, 8), operaciones)
+        # El botón "Cancelar" solo aparece mientras se resuelve, en lugar de "Empezar".
+        for btn in (cancel_button if solving_in_progress else start_button, reset_button, size_button, meta_button):
+            operaciones = []
+            draw_button(operaciones, btn, mouse_pos)
+            regiones[btn["rect"].topleft] = (btn["rect"].inflate(8, 8), operaciones)
+
+        operaciones = []
+        if algoritmo_seleccionado: # Muestra el nombre del algoritmo seleccionado.
+            operaciones.append((texto(font_small, f"Algoritmo: {algoritmo_seleccionado}", BLUE), (620, 105)))
+        regiones["etiqueta"] = (region_etiqueta, operaciones)
+
+        # Define el tamaño y el espaciado para la visualización de los puzzles.
+        PUZZLE_TILE_SIZE = 300 // tamano # El tablero ocupa siempre unos 300 píxeles.
+        TILE_MARGIN = 5
+        PUZZLE_WIDTH = PUZZLE_TILE_SIZE * tamano + TILE_MARGIN * (tamano - 1)
+        TOTAL_PUZZLE_AREA_WIDTH = PUZZLE_WIDTH * 2 + 100
+        INITIAL_PUZZLE_OFFSET_X = (WIDTH - TOTAL_PUZZLE_AREA_WIDTH) // 2
+        SOLVED_PUZZLE_OFFSET_X = INITIAL_PUZZLE_OFFSET_X + PUZZLE_WIDTH + 100
+        PUZZLE_OFFSET_Y = 220
+
+        # Izquierda: puzzle inicial y, tras una búsqueda, el panel de estadísticas detalladas.
+        operaciones = [(texto(font_medium, "Puzzle Inicial:"), (INITIAL_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y - 40))]
+        dibujar_puzzle_grid(estado_inicial, operaciones, offset_x=INITIAL_PUZZLE_OFFSET_X, offset_y=PUZZLE_OFFSET_Y, tile_size=PUZZLE_TILE_SIZE)
+        if solution_found_display and not solving_in_progress and estadisticas:
+            lineas = [
+                f"Generados: {estadisticas['nodos_generados']}   Duplicados: {estadisticas['duplicados']}",
+                f"Obsoletos: {estadisticas['obsoletos']}   Frontera máx.: {estadisticas['frontera_maxima']}",
+                f"Visitados: {estadisticas['visitados']}   g_scores: {estadisticas['g_scores']}",
+                "Expansión/preparación/cola: " + "/".join(
+                    f"{estadisticas[clave] * 1000:.0f}" for clave in ("tiempo_expansion", "tiempo_preparacion", "tiempo_cola")) + " ms",
+            ]
+            for i, linea in enumerate(lineas):
+                operaciones.append((texto(font_tiny, linea), (INITIAL_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 20 + 25 * i)))
+        regiones["izquierda"] = (region_izquierda, operaciones)
+
+        # Derecha: la solución (o la mejor hasta ahora, con ARA*) y sus datos.
+        operaciones = []
+        if solving_in_progress and solucion_path: # ARA*: la mejor solución hasta ahora mientras se refina.
+            # El último tablero es siempre la meta: se muestra su primer movimiento (la ficha se desliza
+            # una y otra vez desde el tablero inicial) y la lista de fichas que mueve, que cambia con cada mejora.
+            operaciones.append((texto(font_medium, "Mejor hasta ahora:"), (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y - 40)))
+            siguiente = solucion_path[1] if len(solucion_path) > 1 else None
+            dibujar_puzzle_grid(solucion_path[0], operaciones, offset_x=SOLVED_PUZZLE_OFFSET_X, offset_y=PUZZLE_OFFSET_Y,
+                                tile_size=PUZZLE_TILE_SIZE, siguiente=siguiente, avance=min(1.0, ahora % 1.0 * 2))
+            operaciones.append((texto(font_small, f"Movimientos: {movimientos} (<= {cota_suboptimo:.2f} x óptimo)"),
+                                (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 20)))
+            lista_fichas = " ".join(str(ficha) for ficha in fichas_mejora[:FICHAS_MEJORA])
+            if len(fichas_mejora) > FICHAS_MEJORA:
+                lista_fichas += " ..."
+            operaciones.append((texto(font_tiny, f"Fichas: {lista_fichas}"), (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 50)))
+        elif solution_found_display and not solving_in_progress: # Si se encontró o no una solución y se debe mostrar.
+            if solucion_path and len(solucion_path) > 0: # Si hay una solución encontrada.
+                ultimo = len(solucion_path) - 1
+                titulo = "Puzzle Resuelto:" if paso == ultimo else f"Paso {paso} de {ultimo}:"
+                operaciones.append((texto(font_medium, titulo), (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y - 40)))
+                # Dibuja el paso actual de la reproducción, con la ficha en movimiento si se está reproduciendo.
+                siguiente = solucion_path[paso + 1] if reproduciendo and paso < ultimo else None
+                dibujar_puzzle_grid(solucion_path[paso], operaciones, offset_x=SOLVED_PUZZLE_OFFSET_X, offset_y=PUZZLE_OFFSET_Y,
+                                    tile_size=PUZZLE_TILE_SIZE, siguiente=siguiente, avance=avance)
+            else: # Si no se encontró solución (o la búsqueda se interrumpió).
+                operaciones.append((texto(font_medium, "Puzzle Resuelto:"), (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y - 40)))
+                operaciones.append((texto(font_medium, mensaje_estado or "No se encontró solución", (255, 0, 0)),
+                                    (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + 100)))
+
+            # Muestra las estadísticas de la solución: movimientos, tiempo y nodos expandidos.
+            texto_movimientos = f"Movimientos: {movimientos}"
+            if cota_suboptimo is not None and cota_suboptimo > 1.0: # ARA* cortado antes de probar la optimalidad.
+                texto_movimientos += f" (<= {cota_suboptimo:.2f} x óptimo)"
+            operaciones.append((texto(font_small, texto_movimientos), (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 20)))
+            operaciones.append((texto(font_small, f"Tiempo: {tiempo_ejecucion:.4f} seg"),
+                                (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 50)))
+            operaciones.append((texto(font_small, f"Nodos Expandidos: {nodos_expandidos}"),
+                                (SOLVED_PUZZLE_OFFSET_X, PUZZLE_OFFSET_Y + PUZZLE_WIDTH + 80)))
+        regiones["derecha"] = (region_derecha, operaciones)
+
+        # Abajo: el progreso mientras se resuelve o, con una solución, los controles de la reproducción.
+        operaciones = []
+        if solving_in_progress: # Si la solución está en progreso.
+            solving_text = texto(font_medium, "Resolviendo...", (255, 0, 0)) # Muestra el texto "Resolviendo...".
+            operaciones.append((solving_text, (WIDTH // 2 - solving_text.get_width() // 2, HEIGHT - 80)))
+            if progreso: # Muestra el último aviso de progreso de la búsqueda.
+                nodos, frontera, cota, segundos = progreso
+                texto_progreso = f"Nodos: {nodos}   Frontera: {frontera}"
+                if cota is not None:
+                    texto_progreso += f"   Cota f: {cota}"
+                texto_progreso += f"   Tiempo: {segundos:.1f} seg"
+                progreso_text = texto(font_small, texto_progreso)
+                operaciones.append((progreso_text, (WIDTH // 2 - progreso_text.get_width() // 2, HEIGHT - 40)))
+        elif hay_reproduccion():
+            ultimo = len(solucion_path) - 1
+            play_buttons[2]["text"] = "Pausa" if reproduciendo else "Play"
+            for btn in play_buttons:
+                draw_button(operaciones, btn, mouse_pos)
+            operaciones.append((superficie(("riel", barra.width, barra.height), lambda: crear_riel(barra.width, barra.height)),
+                                barra.topleft))
+            pomo_x = barra.x + round((paso + avance) / ultimo * barra.width)
+            operaciones.append((superficie("pomo", crear_pomo), (pomo_x - 11, barra.centery - 11)))
+            operaciones.append((texto(font_small, f"{paso}/{ultimo}"), (barra.right + 25, barra.centery - 10)))
+        regiones["inferior"] = (region_inferior, operaciones)
+
+        # Solo se repintan (y se envían a la pantalla) las regiones que cambiaron.
+        sucias = []
+        for nombre, (rect, operaciones) in regiones.items():
+            if anteriores.get(nombre) == operaciones:
+                continue
+            anteriores[nombre] = operaciones
+            screen.set_clip(rect)
+            screen.fill(WHITE, rect)
+            screen.blits(operaciones, doreturn=False)
+            screen.set_clip(None)
+            sucias.append(rect)
+        if sucias:
+            pygame.display.update(sucias)
+        reloj.tick(60) # Limita el bucle a un máximo de 60 fotogramas por segundo.
+
+    if proceso is not None and proceso.is_alive():
+        proceso.join(timeout=1)
+    pygame.quit() # Desinicializa todos los módulos de Pygame al salir del bucle principal.
@@ -0,0 +1,161 @@
+"""Resolución por lotes sin interfaz gráfica."""
+import argparse # Importa argparse para las opciones del modo por lotes.
+import concurrent.futures # Importa concurrent.futures para repartir los lotes entre procesos.
+import itertools # Importa itertools para trocear el flujo de tableros en bloques.
+import json # Importa json para leer y escribir los lotes en formato JSONL.
+import os # Importa os para contar los núcleos disponibles.
+import sys # Importa sys para la entrada y salida estándar.
+from collections import deque # Importa deque para los bloques en vuelo.
+
+from .nucleo import ALGORITMOS, meta_desde_texto, preparar_tablas, resolver_uno, tablero_desde_lista
+
+# --- Resolución por lotes ---
+# Para corpus grandes: los tableros se leen como un flujo (JSONL o binario), se reparten en
+# bloques entre procesos y los resultados se emiten en cuanto están listos, sin tener nunca
+# el corpus completo en memoria. Cada proceso carga las tablas precalculadas una sola vez.
+
+class RegistroInvalido:
+    # Lo que genera leer_tableros en lugar de un tablero cuando una línea no se puede leer: el
+    # lote sigue y ese registro sale como {"estado": "error", ...}.
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+def leer_tableros(archivo, formato="jsonl", tamano=3):
+    """Genera pares (id, tablero) leyendo el archivo de uno en uno.
+
+    jsonl: una línea por tablero, como lista (plana o de filas) u objeto {"id": ..., "tablero": ...}.
+    Una línea que no se puede leer genera un RegistroInvalido en lugar del tablero.
+    binario: registros consecutivos de tamano*tamano bytes con las fichas por filas.
+    """
+    if formato == "binario":
+        largo = tamano * tamano
+        indice = 0
+        while True:
+            registro = archivo.read(largo)
+            if len(registro) < largo:
+                return
+            yield indice, tablero_desde_lista(list(registro))
+            indice += 1
+    else:
+        for indice, linea in enumerate(archivo):
+            linea = linea.strip()
+            if not linea:
+                continue
+            identificador = indice
+            try:
+                dato = json.loads(linea)
+                if isinstance(dato, dict):
+                    identificador = dato.get("id", indice)
+                    dato = dato["tablero"]
+                tablero = tablero_desde_lista(dato)
+            except json.JSONDecodeError:
+                tablero = RegistroInvalido("línea JSON inválida")
+            except KeyError:
+                tablero = RegistroInvalido("falta el campo 'tablero'")
+            except (TypeError, ValueError) as error:
+                tablero = RegistroInvalido(f"tablero inválido: {error}")
+            yield identificador, tablero
+
+def _resolver_bloque(bloque, algoritmo, limites, con_estadisticas=False, usar_cache=False, meta=None):
+    if usar_cache: # Antes de cada bloque se leen las soluciones que guardaron los demás trabajadores.
+        from .cache import caches_abiertas
+        for cache in caches_abiertas():
+            cache.recargar()
+    resultados = [{"id": identificador, "algoritmo": algoritmo, "estado": "error", "error": estado.error}
+                  if isinstance(estado, RegistroInvalido) else
+                  resolver_uno(identificador, estado, algoritmo, *limites, con_estadisticas=con_estadisticas,
+                               usar_cache=usar_cache, meta=meta)
+                  for identificador, estado in bloque]
+    if usar_cache: # Y al terminarlo se añaden al registro en disco las del bloque.
+        for cache in caches_abiertas():
+            cache.guardar()
+    return resultados
+
+def resolver_lote(tableros, algoritmo="A*", procesos=None, tamano_bloque=64, limite_tiempo=None,
+                  ordenado=True, tamano=3, limite_nodos=None, limite_memoria_mb=None, con_estadisticas=False,
+                  usar_cache=False, meta=None):
+    """Resuelve un flujo de pares (id, tablero) en paralelo y genera los resultados.
+
+    Con `ordenado` los resultados salen en el orden de entrada; si no, en cuanto terminan.
+    Solo hay unos pocos bloques en vuelo a la vez, así que la memoria no crece con el corpus.
+    Con `usar_cache` (solo A*) los trabajadores comparten la caché de soluciones en disco.
+    `meta` es el tablero meta de todo el lote (por defecto, el caracol). HDA* ya reparte cada
+    tablero entre todos los núcleos, así que con él los tableros se resuelven de uno en uno.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+    procesos = 1 if algoritmo == "HDA*" else procesos or os.cpu_count() or 1
+    preparar_tablas(algoritmo, tamano, meta)
+    limites = (limite_tiempo, limite_nodos, limite_memoria_mb)
+    bloques = iter(lambda: list(itertools.islice(tableros, tamano_bloque)), [])
+
+    if procesos == 1: # Sin pool: evita el costo de lanzar procesos para lotes pequeños.
+        for bloque in bloques:
+            yield from _resolver_bloque(bloque, algoritmo, limites, con_estadisticas, usar_cache, meta)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(procesos, initializer=preparar_tablas,
+                                                initargs=(algoritmo, tamano, meta)) as ejecutor:
+        en_vuelo = deque() # Futuros en orden de envío.
+        for bloque in bloques:
+            en_vuelo.append(ejecutor.submit(_resolver_bloque, bloque, algoritmo, limites, con_estadisticas, usar_cache,
+                                            meta))
+            # Dos bloques por trabajador mantienen a todos ocupados sin leer más de la cuenta.
+            while len(en_vuelo) >= 2 * procesos:
+                yield from _recoger(en_vuelo, ordenado)
+        while en_vuelo:
+            yield from _recoger(en_vuelo, ordenado)
+
+def _recoger(en_vuelo, ordenado):
+    # Saca de `en_vuelo` el bloque más antiguo (ordenado) o el primero que termine.
+    if ordenado:
+        return en_vuelo.popleft().result()
+    listos, _ = concurrent.futures.wait(en_vuelo, return_when=concurrent.futures.FIRST_COMPLETED)
+    resultados = []
+    for futuro in listos:
+        en_vuelo.remove(futuro)
+        resultados.extend(futuro.result())
+    return resultados
+
+def main_lote(argumentos):
+    # Punto de entrada sin interfaz: python -m puzzle8 lote tableros.jsonl --algoritmo A* ...
+    parser = argparse.ArgumentParser(prog="puzzle8 lote", description="Resuelve un lote de tableros sin GUI.")
+    parser.add_argument("entrada", help="archivo de tableros ('-' para la entrada estándar)")
+    parser.add_argument("--formato", choices=["jsonl", "binario"], default="jsonl")
+    parser.add_argument("--tamano", type=int, default=3, help="lado del tablero (necesario para el formato binario)")
+    parser.add_argument("--algoritmo", choices=list(ALGORITMOS), default="A*")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos trabajadores (por defecto, uno por núcleo)")
+    parser.add_argument("--bloque", type=int, default=64, help="tableros por tarea enviada a un trabajador")
+    parser.add_argument("--limite-tiempo", type=float, default=None, help="segundos máximos por tablero")
+    parser.add_argument("--limite-nodos", type=int, default=None, help="nodos expandidos máximos por tablero")
+    parser.add_argument("--limite-memoria", type=float, default=None, help="MB máximos por proceso trabajador")
+    parser.add_argument("--desordenado", action="store_true", help="emitir los resultados según terminan")
+    parser.add_argument("--estadisticas", action="store_true", help="añadir las estadísticas detalladas de cada búsqueda")
+    parser.add_argument("--cache", action="store_true", help="usar y ampliar la caché de soluciones en disco (solo A*)")
+    parser.add_argument("--meta", default=None,
+                        help="meta de todos los tableros: caracol (por defecto), filas o la lista de fichas")
+    parser.add_argument("--salida", default="-", help="archivo JSONL de resultados ('-' para la salida estándar)")
+    opciones = parser.parse_args(argumentos)
+    meta = None
+    if opciones.meta is not None:
+        try:
+            meta = meta_desde_texto(opciones.meta, opciones.tamano)
+        except ValueError:
+            parser.error("la meta tiene que ser caracol, filas o un tablero cuadrado de números")
+
+    binario = opciones.formato == "binario"
+    if opciones.entrada == "-":
+        entrada = sys.stdin.buffer if binario else sys.stdin
+    else:
+        entrada = open(opciones.entrada, "rb" if binario else "r")
+    salida = sys.stdout if opciones.salida == "-" else open(opciones.salida, "w")
+    with entrada, salida:
+        for resultado in resolver_lote(leer_tableros(entrada, opciones.formato, opciones.tamano),
+                                       opciones.algoritmo, opciones.procesos, opciones.bloque,
+                                       opciones.limite_tiempo, not opciones.desordenado, opciones.tamano,
+                                       opciones.limite_nodos, opciones.limite_memoria, opciones.estadisticas,
+                                       opciones.cache, meta):
+            salida.write(json.dumps(resultado) + "\n")
+            salida.flush()
@@ -0,0 +1,1498 @@
+"""Núcleo del solucionador: estados, movimientos, heurísticas, tablas precalculadas y búsquedas.
+
+No depende de pygame ni de nada fuera de la biblioteca estándar, y solo importa módulos
+ligeros, para que se pueda usar (y arrancar) rápido en servidores sin pantalla.
+"""
+import random # Importa el módulo random para generar números aleatorios (usado para barajar el puzzle).
+import heapq # Importa el módulo heapq, que implementa el algoritmo de cola de prioridad (usado en A*).
+import time # Importa el módulo time para medir el tiempo de ejecución de los algoritmos de búsqueda.
+import os # Importa os para ubicar y guardar la tabla de distancias en disco.
+import mmap # Importa mmap para cargar la tabla de distancias sin copiarla en memoria.
+import array # Importa array para las marcas compactas usadas al construir las PDB.
+import math # Importa math para deducir el lado de un tablero dado como lista plana.
+import functools # Importa functools para conservar nombre y documentación de las búsquedas envueltas.
+import inspect # Importa inspect para leer la firma de cada búsqueda al llevarla al marco canónico.
+
+# Realizado por: Alanys Silva
+# --- Representación compacta del estado ---
+# Cada estado se guarda como un único entero: la ficha de la casilla i (leyendo el
+# tablero por filas) ocupa los bits b*i..b*i+b-1, con b = 4 bits para 3x3 y 4x4. Un entero
+# es inmutable y hashable, ocupa mucho menos que una tupla de tuplas y se compara/hashea
+# sin recorrer el tablero. Junto al entero se guarda el índice de la casilla vacía para no
+# tener que buscarla.
+#
+# Todo lo que depende del tamaño del tablero (tabla de movimientos, meta, distancias de
+# Manhattan...) se precalcula una sola vez por tamaño en una `Configuracion`.
+
+def generar_meta(n):
+    """Meta en espiral (caracol) para un tablero n x n; el vacío queda al final de la espiral."""
+    tablero = [[0] * n for _ in range(n)]
+    fila, col, df, dc = 0, 0, 0, 1 # Empieza arriba a la izquierda avanzando hacia la derecha.
+    for valor in range(1, n * n):
+        tablero[fila][col] = valor
+        nueva_fila, nueva_col = fila + df, col + dc
+        if not (0 <= nueva_fila < n and 0 <= nueva_col < n) or tablero[nueva_fila][nueva_col]:
+            df, dc = dc, -df # Gira a la derecha al llegar a un borde o a una casilla ya ocupada.
+            nueva_fila, nueva_col = fila + df, col + dc
+        fila, col = nueva_fila, nueva_col
+    return tuple(map(tuple, tablero))
+
+def generar_meta_filas(n, vacio=None):
+    """Meta por filas para un tablero n x n: 1, 2, ..., n*n-1 leyendo por filas, con el vacío en la
+    casilla `vacio` (por defecto la última)."""
+    plano = list(range(1, n * n))
+    plano.insert(n * n - 1 if vacio is None else vacio, 0)
+    return tuple(tuple(plano[i:i + n]) for i in range(0, n * n, n))
+
+META = generar_meta(3) # Estado meta del puzzle 8: ((1, 2, 3), (8, 0, 4), (7, 6, 5)).
+METAS = {"caracol": generar_meta, "filas": generar_meta_filas} # Metas con nombre, por tamaño de tablero.
+
+class Configuracion:
+    # Tablas precalculadas para un tamaño de tablero y una meta. Se crean con
+    # obtener_configuracion() y se comparten entre todas las búsquedas con esa meta.
+    __slots__ = ("n", "casillas", "bits", "mascara", "meta", "meta_codigo", "meta_vacio",
+                 "meta_inverso", "posiciones_meta", "movimientos", "distancia_manhattan",
+                 "movimientos_manhattan")
+
+    def __init__(self, n, meta=None):
+        self.n = n # Lado del tablero.
+        self.casillas = n * n # Número de casillas (fichas + vacío).
+        self.bits = max(4, (self.casillas - 1).bit_length()) # Bits por ficha en el entero empaquetado.
+        self.mascara = (1 << self.bits) - 1 # Máscara para extraer una ficha.
+        self.meta = meta or generar_meta(n)
+        plano = [valor for fila in self.meta for valor in fila]
+        self.posiciones_meta = tuple(plano.index(ficha) for ficha in range(self.casillas)) # Casilla meta de cada ficha.
+        self.movimientos = self._construir_tabla_movimientos()
+        self.meta_codigo, self.meta_vacio = empaquetar(self.meta, self)
+        self.meta_inverso = inverso(self.meta_codigo, self)
+        self.distancia_manhattan = self._construir_tabla_manhattan()
+        self.movimientos_manhattan = self._construir_movimientos_manhattan()
+
+    def _construir_tabla_movimientos(self):
+        # Para cada posición del vacío se precalculan las casillas vecinas junto con los
+        # desplazamientos de bits de la casilla destino y del vacío. Así generar un sucesor
+        # es solo aritmética entera: no hay que buscar el 0 ni copiar el tablero.
+        n, bits = self.n, self.bits
+        tabla = []
+        for vacio in range(self.casillas):
+            fila, col = divmod(vacio, n)
+            destinos = []
+            # Mismo orden que antes: arriba, abajo, izquierda, derecha.
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nueva_fila, nueva_col = fila + dr, col + dc
+                if 0 <= nueva_fila < n and 0 <= nueva_col < n:
+                    destino = nueva_fila * n + nueva_col
+                    destinos.append((destino, bits * destino, bits * vacio))
+            tabla.append(tuple(destinos))
+        return tuple(tabla)
+
+    def _construir_tabla_manhattan(self):
+        # distancia_manhattan[ficha][casilla] = distancia de Manhattan entre la casilla y la
+        # posición meta de la ficha. El vacío (0) no cuenta, así que su fila es todo ceros.
+        n = self.n
+        tabla = []
+        for ficha in range(self.casillas):
+            meta_fila, meta_col = divmod(self.posiciones_meta[ficha], n)
+            tabla.append(tuple(
+                0 if ficha == 0 else abs(i // n - meta_fila) + abs(i % n - meta_col)
+                for i in range(self.casillas)
+            ))
+        return tuple(tabla)
+
+    def _construir_movimientos_manhattan(self):
+        # Igual que `movimientos`, pero cada movimiento lleva además la variación de la
+        # heurística indexada por la ficha que se desliza. Un deslizamiento solo cambia la
+        # distancia de esa ficha (en ±1), así que el hijo hereda la heurística del padre más ese delta.
+        distancia = self.distancia_manhattan
+        return tuple(
+            tuple(
+                (destino, desp_destino, desp_vacio,
+                 tuple(distancia[ficha][vacio] - distancia[ficha][destino] for ficha in range(self.casillas)))
+                for destino, desp_destino, desp_vacio in self.movimientos[vacio]
+            )
+            for vacio in range(self.casillas)
+        )
+
+_configuraciones = {} # Configuraciones ya construidas, por (tamaño de tablero, meta).
+
+def normalizar_meta(meta):
+    """La meta como tupla de tuplas, que sirve de clave en las tablas memorizadas; None es el caracol."""
+    return None if meta is None else tablero_desde_lista(meta) # Acepta también listas de filas o planas.
+
+def obtener_configuracion(n=3, meta=None):
+    """Devuelve (y memoriza) las tablas precalculadas para un tablero n x n y una meta (por defecto, el caracol)."""
+    meta = normalizar_meta(meta)
+    configuracion = _configuraciones.get((n, meta))
+    if configuracion is None:
+        configuracion = _configuraciones[(n, meta)] = Configuracion(n, meta)
+    return configuracion
+
+def empaquetar(estado, configuracion=None):
+    """Convierte un tablero (tupla de tuplas) en el par (codigo, vacio)."""
+    if configuracion is None:
+        configuracion = obtener_configuracion(len(estado))
+    bits = configuracion.bits
+    codigo = 0
+    vacio = -1
+    for i, valor in enumerate(valor for fila in estado for valor in fila):
+        codigo |= valor << (bits * i) # Coloca la ficha en su grupo de bits.
+        if valor == 0:
+            vacio = i # Recuerda dónde está el espacio vacío.
+    return codigo, vacio
+
+def desempaquetar(codigo, configuracion=None):
+    """Convierte un entero empaquetado de vuelta en una tupla de tuplas."""
+    if configuracion is None:
+        configuracion = obtener_configuracion(3)
+    n, bits, mascara = configuracion.n, configuracion.bits, configuracion.mascara
+    plano = [(codigo >> (bits * i)) & mascara for i in range(configuracion.casillas)]
+    return tuple(tuple(plano[i:i + n]) for i in range(0, n * n, n))
+
+def desempaquetar_vacio(codigo, configuracion):
+    """Casilla del vacío de un estado empaquetado (para cuando solo se guardó el código)."""
+    bits, mascara = configuracion.bits, configuracion.mascara
+    for i in range(configuracion.casillas):
+        if not (codigo >> (bits * i)) & mascara:
+            return i
+    return -1
+
+def inverso(codigo, configuracion):
+    """Empaqueta la casilla de cada ficha: el grupo de bits t guarda dónde está la ficha t."""
+    bits, mascara = configuracion.bits, configuracion.mascara
+    resultado = 0
+    for i in range(configuracion.casillas):
+        resultado |= i << (bits * ((codigo >> (bits * i)) & mascara))
+    return resultado
+
+def distancia_manhattan(codigo, configuracion=None):
+    """Suma de las distancias de Manhattan de todas las fichas (cálculo completo)."""
+    if configuracion is None:
+        configuracion = obtener_configuracion(3)
+    bits, mascara, tabla = configuracion.bits, configuracion.mascara, configuracion.distancia_manhattan
+    distancia = 0
+    for i in range(configuracion.casillas):
+        distancia += tabla[(codigo >> (bits * i)) & mascara][i]
+    return distancia
+
+# --- Clase para representar un nodo en la búsqueda (para DFS/BFS) ---
+class Nodo:
+    __slots__ = ("codigo", "vacio", "padre")
+
+    def __init__(self, codigo, vacio, padre=None):
+        self.codigo = codigo # Estado empaquetado (entero inmutable y hashable, usado en `visitados`).
+        self.vacio = vacio # Índice de la casilla vacía dentro del tablero.
+        self.padre = padre  # Almacena el nodo padre para reconstruir el camino una vez que se encuentra la solución.
+
+# --- Clase para representar un nodo en A* ---
+class NodoAStar:
+    # Registro ligero: con __slots__ no hay diccionario por instancia. El orden en la cola
+    # de prioridad lo da la tupla (f, h, contador, nodo), así que no hacen falta __lt__,
+    # __eq__ ni __hash__; los estados cerrados se guardan como enteros, no como nodos.
+    __slots__ = ("codigo", "vacio", "padre", "costo", "heuristica", "inverso")
+
+    def __init__(self, codigo, vacio, padre=None, costo=0, heuristica=0, inverso=0):
+        self.codigo = codigo # Estado empaquetado.
+        self.vacio = vacio # Índice de la casilla vacía.
+        self.padre = padre # Almacena el nodo padre para reconstruir el camino.
+        self.costo = costo  # Costo acumulado desde el nodo inicial hasta este nodo (g_cost).
+        self.heuristica = heuristica # Estimación del costo hasta la meta (h_cost).
+        self.inverso = inverso # Casilla de cada ficha empaquetada (solo la usa la heurística PDB).
+
+    @property
+    def f(self):
+        return self.costo + self.heuristica  # Costo total (f_cost = g_cost + h_cost).
+
+# --- Funciones Auxiliares ---
+
+# Función para verificar si el estado (empaquetado) es el estado meta
+def es_estado_meta(codigo, configuracion=None):
+    if configuracion is None:
+        configuracion = obtener_configuracion(3)
+    return codigo == configuracion.meta_codigo # Comparar dos enteros es inmediato.
+
+# Función para obtener los movimientos posibles
+def obtener_movimientos(codigo, vacio, configuracion=None):
+    if configuracion is None:
+        configuracion = obtener_configuracion(3)
+    mascara = configuracion.mascara
+    movimientos = [] # Lista de pares (codigo_hijo, vacio_hijo).
+    for destino, desp_destino, desp_vacio in configuracion.movimientos[vacio]:
+        ficha = (codigo >> desp_destino) & mascara # Ficha que se desliza hacia el vacío.
+        # La ficha pasa de la casilla destino a la del vacío; el vacío (0) ocupa la casilla destino.
+        movimientos.append((codigo + (ficha << desp_vacio) - (ficha << desp_destino), destino))
+    return movimientos # Retorna todos los estados posibles después de un movimiento.
+
+# Función para verificar si el estado es resoluble
+def es_resoluble(estado, meta=None):
+    # Cada movimiento intercambia el vacío con una ficha vecina: cambia la paridad de la
+    # permutación (contando el vacío como una ficha más) y también la paridad de la distancia
+    # de Manhattan entre el vacío y su casilla meta. Por eso un estado es resoluble si y solo si
+    # ambas paridades coinciden. La regla vale para cualquier ancho, par o impar; en el 3x3
+    # equivale a la clásica cuenta de inversiones. Las paridades se miden respecto a `meta`.
+    configuracion = obtener_configuracion(len(estado), meta)
+    n = configuracion.n
+    plano = [valor for fila in estado for valor in fila]
+    destino = [configuracion.posiciones_meta[valor] for valor in plano] # Casilla meta de lo que hay en cada casilla.
+
+    # Paridad de la permutación a partir de sus ciclos: casillas - ciclos.
+    ciclos = 0
+    vistos = [False] * configuracion.casillas
+    for inicio in range(configuracion.casillas):
+        if not vistos[inicio]:
+            ciclos += 1
+            i = inicio
+            while not vistos[i]:
+                vistos[i] = True
+                i = destino[i]
+    paridad_permutacion = (configuracion.casillas - ciclos) % 2
+
+    vacio = plano.index(0)
+    meta_vacio = configuracion.meta_vacio
+    paridad_vacio = (abs(vacio // n - meta_vacio // n) + abs(vacio % n - meta_vacio % n)) % 2
+    return paridad_permutacion == paridad_vacio
+
+# Función para generar un estado inicial aleatorio resoluble
+def generar_estado_aleatorio(n=3, meta=None):
+    meta = obtener_configuracion(n, meta).meta
+    while True: # Bucle infinito hasta que se genere un estado válido.
+        estado_plano = list(range(n * n)) # Crea una lista de números del 0 al n*n-1.
+        random.shuffle(estado_plano) # Baraja aleatoriamente los números en la lista.
+        # Convierte la lista plana en una tupla de tuplas n x n.
+        estado_2d = tuple(tuple(estado_plano[i:i + n]) for i in range(0, n * n, n))
+
+        # Verificar si es resoluble para el estado meta y si es diferente de él.
+        # Si el estado generado es resoluble y no es el estado meta, se retorna.
+        if es_resoluble(estado_2d, meta) and estado_2d != meta:
+            return estado_2d
+
+# --- Archivos precalculados en disco ---
+def directorio_cache():
+    # Directorio de caché configurable con PUZZLE8_CACHE.
+    return os.environ.get("PUZZLE8_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "puzzle8"))
+
+def _cargar_o_construir(ruta, tamano, construir):
+    # Devuelve el archivo mapeado en memoria; si no existe (o está incompleto) lo construye
+    # y lo escribe con un reemplazo atómico para que otro proceso nunca lea un archivo a medias.
+    if not os.path.exists(ruta) or os.path.getsize(ruta) != tamano:
+        datos = construir()
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(datos)
+        os.replace(temporal, ruta)
+    with open(ruta, "rb") as archivo:
+        return mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+# --- Tabla completa de distancias (3x3) ---
+# Desde la meta solo se alcanzan 9!/2 = 181440 estados. Una BFS hacia atrás desde la meta
+# calcula la distancia óptima de todos ellos y la guarda en un byte por estado, en la
+# posición dada por un hash perfecto del estado (rango de Lehmer). Con la tabla, resolver
+# es bajar por ella: en cada paso se elige el vecino cuya distancia es una menos.
+# Para 4x4 (16!/2 estados) una tabla así es imposible; ahí se usan las PDB de más abajo.
+FACTORIALES = [1] * 9 # FACTORIALES[k] = k!
+for _k in range(1, 9):
+    FACTORIALES[_k] = FACTORIALES[_k - 1] * _k
+ESTADOS_POR_VACIO = FACTORIALES[8] // 2 # Ordenaciones resolubles de las 8 fichas para una posición del vacío.
+TAMANO_TABLA_DISTANCIAS = 9 * ESTADOS_POR_VACIO # 181440 bytes.
+SIN_DISTANCIA = 0xFF # Marca de una entrada aún no alcanzada por la BFS.
+
+_tablas_distancias = {} # Tablas cargadas (mmap) por meta, compartidas por todas las búsquedas.
+
+def indice_estado(codigo, vacio):
+    """Hash perfecto de un estado 3x3 resoluble en el rango [0, 181440)."""
+    # Rango de Lehmer de la secuencia de fichas sin el vacío: para cada ficha se cuentan
+    # las fichas menores que aún no han aparecido. La paridad de esa secuencia es la misma
+    # en todos los estados resolubles, así que el último dígito de Lehmer es redundante y
+    # basta con rango // 2. El vacío selecciona el bloque.
+    rango = 0
+    libres = (1 << 9) - 2 # Bit v encendido = la ficha v aún no ha aparecido.
+    k = 7
+    for i in range(9):
+        if i != vacio:
+            ficha = (codigo >> (4 * i)) & 0xF
+            rango += (libres & ((1 << ficha) - 1)).bit_count() * FACTORIALES[k]
+            libres ^= 1 << ficha
+            k -= 1
+    return vacio * ESTADOS_POR_VACIO + (rango >> 1)
+
+def construir_tabla_distancias(meta=None):
+    """BFS hacia atrás desde la meta; devuelve un bytearray con la distancia de cada estado."""
+    try:
+        from .bfs_vectorial import construir_tabla_distancias_vectorial
+    except ImportError: # Sin NumPy, la BFS nodo a nodo de abajo.
+        pass
+    else:
+        return construir_tabla_distancias_vectorial(meta)
+    configuracion = obtener_configuracion(3, meta)
+    meta_codigo, meta_vacio = configuracion.meta_codigo, configuracion.meta_vacio
+    tabla = bytearray([SIN_DISTANCIA]) * TAMANO_TABLA_DISTANCIAS
+    tabla[indice_estado(meta_codigo, meta_vacio)] = 0
+    visitados = {meta_codigo}
+    frontera = [(meta_codigo, meta_vacio)]
+    distancia = 0
+    while frontera: # Una capa de la BFS por iteración.
+        distancia += 1
+        siguiente = []
+        for codigo, vacio in frontera:
+            for codigo_hijo, vacio_hijo in obtener_movimientos(codigo, vacio, configuracion):
+                if codigo_hijo not in visitados:
+                    visitados.add(codigo_hijo)
+                    tabla[indice_estado(codigo_hijo, vacio_hijo)] = distancia
+                    siguiente.append((codigo_hijo, vacio_hijo))
+        frontera = siguiente
+    return tabla
+
+def ruta_tabla_distancias(meta=None):
+    # El nombre incluye la meta para que una tabla construida para otra meta nunca se reutilice por error.
+    return os.path.join(directorio_cache(), f"distancias_3x3_{obtener_configuracion(3, meta).meta_codigo:x}.bin")
+
+def cargar_tabla_distancias(ruta=None, meta=None):
+    """Devuelve la tabla de distancias a `meta` mapeada en memoria, construyéndola la primera vez."""
+    meta = normalizar_meta(meta)
+    if meta not in _tablas_distancias:
+        _tablas_distancias[meta] = _cargar_o_construir(ruta or ruta_tabla_distancias(meta), TAMANO_TABLA_DISTANCIAS,
+                                                       lambda: construir_tabla_distancias(meta))
+    return _tablas_distancias[meta]
+
+def distancia_optima(estado, meta=None):
+    """Número mínimo de movimientos para resolver un puzzle 3x3, o None si no es resoluble."""
+    if len(estado) != 3:
+        raise ValueError("La tabla de distancias solo existe para el puzzle 3x3")
+    if not es_resoluble(estado, meta):
+        return None
+    marco = obtener_marco(3, meta) # La tabla es la de la meta canónica.
+    return cargar_tabla_distancias(meta=marco.canonica)[indice_estado(*empaquetar(marco.a_canonico(estado)))]
+
+# --- Bases de datos de patrones (PDB) aditivas ---
+# Las fichas se reparten en grupos de números consecutivos (con la meta en espiral, cada
+# grupo ocupa una zona contigua del tablero). La PDB de un grupo guarda, para cada forma de
+# colocar sus fichas, el mínimo de movimientos *de esas fichas* necesario para llevarlas a
+# su sitio, ignorando al resto. Como cada movimiento mueve una sola ficha, la suma de las
+# PDB de todos los grupos nunca sobreestima: es una heurística admisible y mucho más
+# informada que Manhattan. El índice de una colocación son las casillas de las fichas del
+# grupo empaquetadas, es decir, un trozo contiguo de bits del `inverso` del estado.
+PARTICIONES_PDB = {3: (4, 4), 4: (6, 6, 3)} # Tamaños de los grupos por lado del tablero.
+
+_pdbs = {} # PDB cargadas, por (n, particion, meta).
+
+def particion_por_defecto(n):
+    particion = PARTICIONES_PDB.get(n)
+    if particion is None: # Para otros tamaños, grupos de hasta 4 fichas.
+        fichas = n * n - 1
+        particion = (4,) * (fichas // 4) + ((fichas % 4,) if fichas % 4 else ())
+    return particion
+
+def _expandir_region(region, libres, n, sin_primera_columna, sin_ultima_columna):
+    # Crece la región (máscara de casillas) por las casillas libres vecinas hasta que no
+    # cambie: son todas las casillas que el vacío alcanza sin mover fichas del grupo.
+    while True:
+        vecinas = (((region << 1) & sin_primera_columna) | ((region >> 1) & sin_ultima_columna)
+                   | (region << n) | (region >> n))
+        nueva = region | (vecinas & libres)
+        if nueva == region:
+            return region
+        region = nueva
+
+def construir_pdb(configuracion, primera, cantidad):
+    """BFS sobre las colocaciones de las fichas primera..primera+cantidad-1; devuelve un bytearray."""
+    try:
+        from .bfs_vectorial import construir_pdb_vectorial
+    except ImportError: # Sin NumPy, la BFS nodo a nodo de abajo.
+        pass
+    else:
+        return construir_pdb_vectorial(configuracion, primera, cantidad)
+    n, bits, mascara = configuracion.n, configuracion.bits, configuracion.mascara
+    todas = (1 << configuracion.casillas) - 1
+    sin_primera_columna = sum(1 << i for i in range(configuracion.casillas) if i % n)
+    sin_ultima_columna = sum(1 << i for i in range(configuracion.casillas) if i % n != n - 1)
+    vecinos = [tuple(destino for destino, _, _ in movimientos) for movimientos in configuracion.movimientos]
+    pdb = bytearray([SIN_DISTANCIA]) * (1 << (bits * cantidad))
+    # Para cada colocación, máscara de las casillas del vacío ya cubiertas: dos estados que
+    # solo difieren en el vacío dentro de una misma región libre valen lo mismo.
+    cubiertas = array.array("H" if configuracion.casillas <= 16 else "L", [0]) * len(pdb)
+
+    indice_meta = (configuracion.meta_inverso >> (bits * primera)) & ((1 << (bits * cantidad)) - 1)
+    # La frontera guarda cada estado como un solo entero: el índice seguido de la casilla del vacío.
+    frontera = [(indice_meta << bits) | configuracion.meta_vacio]
+    distancia = 0
+    while frontera: # Una capa por iteración; cada capa son los movimientos de fichas del grupo.
+        siguiente = []
+        for estado in frontera:
+            indice, vacio = estado >> bits, estado & mascara
+            if (cubiertas[indice] >> vacio) & 1:
+                continue
+            posiciones = [(indice >> (bits * j)) & mascara for j in range(cantidad)]
+            ocupadas = 0
+            for posicion in posiciones:
+                ocupadas |= 1 << posicion
+            region = _expandir_region(1 << vacio, todas & ~ocupadas, n, sin_primera_columna, sin_ultima_columna)
+            cubiertas[indice] |= region
+            if pdb[indice] == SIN_DISTANCIA:
+                pdb[indice] = distancia
+            # Cada ficha del grupo vecina a la región puede deslizarse hacia ella; el vacío
+            # queda donde estaba la ficha.
+            for j, posicion in enumerate(posiciones):
+                for destino in vecinos[posicion]:
+                    if (region >> destino) & 1:
+                        siguiente.append(((indice + ((destino - posicion) << (bits * j))) << bits) | posicion)
+        frontera = siguiente
+        distancia += 1
+    return pdb
+
+def cargar_pdbs(n, particion=None, meta=None):
+    """Devuelve una lista de (desplazamiento, mascara, tabla) por grupo, construyendo lo que falte."""
+    particion = tuple(particion or particion_por_defecto(n))
+    meta = normalizar_meta(meta)
+    clave = (n, particion, meta)
+    if clave not in _pdbs:
+        configuracion = obtener_configuracion(n, meta)
+        bits = configuracion.bits
+        pdbs = []
+        primera = 1
+        for cantidad in particion:
+            ruta = os.path.join(directorio_cache(), f"pdb_{n}x{n}_{configuracion.meta_codigo:x}_{primera}-{primera + cantidad - 1}.bin")
+            tabla = _cargar_o_construir(ruta, 1 << (bits * cantidad),
+                                        lambda: construir_pdb(configuracion, primera, cantidad))
+            pdbs.append((bits * primera, (1 << (bits * cantidad)) - 1, tabla))
+            primera += cantidad
+        _pdbs[clave] = pdbs
+    return _pdbs[clave]
+
+def heuristica_pdb(inverso_estado, pdbs):
+    """Suma de las PDB de todos los grupos para un estado dado por su `inverso`."""
+    return sum(tabla[(inverso_estado >> desplazamiento) & mascara] for desplazamiento, mascara, tabla in pdbs)
+
+# --- Conflicto lineal ---
+# Dos fichas que están en su fila meta pero en orden invertido tienen que apartarse una de la
+# otra: cada par así cuesta al menos 2 movimientos que Manhattan no cuenta. Para cada fila (y
+# columna) se suma 2 * (mínimo de fichas que hay que sacar para que el resto quede en orden);
+# sumado a Manhattan sigue siendo admisible. Cada línea se describe con una clave reducida: en
+# cada casilla, 0 si la ficha no pertenece a esa línea, o 1 + su posición meta dentro de ella.
+# Así una sola tabla, indexada por esa clave, sirve para todas las filas y columnas.
+_conflictos = {} # Tablas de conflicto lineal, por (tamaño de tablero, meta).
+
+def tablas_conflicto_lineal(configuracion):
+    """Devuelve (conflicto, valor_fila, valor_columna, bits_linea) para el tamaño dado."""
+    n = configuracion.n
+    clave = (n, configuracion.meta_codigo)
+    if clave not in _conflictos:
+        bits_linea = n.bit_length() # Bits por casilla en la clave reducida (valores 0..n).
+        # valor_fila[ficha][fila]: valor de la ficha en la clave de esa fila (igual para columnas).
+        valor_fila, valor_columna = [], []
+        for ficha in range(configuracion.casillas):
+            meta_fila, meta_col = divmod(configuracion.posiciones_meta[ficha], n)
+            valor_fila.append(tuple(meta_col + 1 if ficha and fila == meta_fila else 0 for fila in range(n)))
+            valor_columna.append(tuple(meta_fila + 1 if ficha and col == meta_col else 0 for col in range(n)))
+
+        conflicto = bytearray(1 << (bits_linea * n))
+        mascara = (1 << bits_linea) - 1
+        for reducida in range(len(conflicto)):
+            secuencia = [v for v in ((reducida >> (bits_linea * i)) & mascara for i in range(n)) if v]
+            # Mínimo de fichas a retirar = largo - subsecuencia creciente más larga.
+            mas_larga = [1] * len(secuencia)
+            for i in range(len(secuencia)):
+                for j in range(i):
+                    if secuencia[j] < secuencia[i] and mas_larga[j] + 1 > mas_larga[i]:
+                        mas_larga[i] = mas_larga[j] + 1
+            conflicto[reducida] = 2 * (len(secuencia) - max(mas_larga, default=0))
+        _conflictos[clave] = (conflicto, tuple(valor_fila), tuple(valor_columna), bits_linea)
+    return _conflictos[clave]
+
+# --- Control de la búsqueda: presupuestos, cancelación y progreso ---
+class BusquedaInterrumpida(Exception):
+    # Se lanza desde dentro de una búsqueda cuando se cancela o se agota un presupuesto.
+    # `motivo` es "cancelada", "limite_nodos", "limite_memoria" o "limite_tiempo".
+    def __init__(self, motivo, nodos_expandidos):
+        super().__init__(motivo)
+        self.motivo = motivo
+        self.nodos_expandidos = nodos_expandidos
+
+def memoria_mb():
+    """Memoria residente actual del proceso en MB (pico del proceso si no hay /proc)."""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+        except ImportError:
+            return 0.0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+class ControlBusqueda:
+    """Presupuestos, cancelación y avisos de progreso para una búsqueda.
+
+    Las búsquedas llaman a revisar() cada `intervalo` nodos expandidos; sin control
+    (control=None) solo pagan una comparación de enteros por expansión.
+    """
+    def __init__(self, limite_nodos=None, limite_memoria_mb=None, limite_tiempo=None,
+                 cancelado=None, al_progreso=None, intervalo=1000):
+        self.limite_nodos = limite_nodos # Máximo de nodos expandidos.
+        self.limite_memoria_mb = limite_memoria_mb # Máximo de memoria residente del proceso.
+        self.limite_tiempo = limite_tiempo # Máximo de segundos.
+        self.cancelado = cancelado # Función sin argumentos que devuelve True si hay que parar.
+        self.al_progreso = al_progreso # Función (nodos_expandidos, frontera, cota, segundos).
+        self.intervalo = intervalo
+        self.inicio = time.perf_counter()
+
+    def revisar(self, nodos_expandidos, frontera, cota):
+        if self.cancelado is not None and self.cancelado():
+            raise BusquedaInterrumpida("cancelada", nodos_expandidos)
+        if self.limite_nodos is not None and nodos_expandidos >= self.limite_nodos:
+            raise BusquedaInterrumpida("limite_nodos", nodos_expandidos)
+        transcurrido = time.perf_counter() - self.inicio
+        if self.limite_tiempo is not None and transcurrido >= self.limite_tiempo:
+            raise BusquedaInterrumpida("limite_tiempo", nodos_expandidos)
+        if self.limite_memoria_mb is not None and memoria_mb() >= self.limite_memoria_mb:
+            raise BusquedaInterrumpida("limite_memoria", nodos_expandidos)
+        if self.al_progreso is not None:
+            self.al_progreso(nodos_expandidos, frontera, cota, transcurrido)
+
+# --- Estadísticas de la búsqueda ---
+class EstadisticasBusqueda:
+    """Contadores y tiempos de una búsqueda, para ajustar memoria y rendimiento.
+
+    Se activa pasando una instancia como `estadisticas` a una búsqueda. Sin ella las búsquedas
+    no hacen nada extra: los datos por expansión se toman en el mismo punto en que se revisa
+    el control, y lo demás se deduce al terminar de las estructuras que la búsqueda ya tiene.
+    """
+    __slots__ = ("al_progreso", "intervalo", "exportar", "algoritmo", "nodos_generados", "nodos_expandidos",
+                 "duplicados", "obsoletos", "frontera_maxima", "visitados", "g_scores", "histograma_f",
+                 "inserciones", "extracciones", "tiempo_total", "tiempo_preparacion", "tiempo_cola",
+                 "tiempo_expansion", "expandidos_por_trabajador", "inicio")
+
+    def __init__(self, al_progreso=None, intervalo=1000, exportar=None):
+        self.al_progreso = al_progreso # Función (estadisticas) llamada cada `intervalo` nodos expandidos.
+        self.intervalo = intervalo
+        self.exportar = exportar # Función (diccionario) llamada al terminar: perfilador, métricas, registro...
+        self.algoritmo = None
+        self.nodos_generados = 0 # Hijos producidos por los nodos expandidos.
+        self.nodos_expandidos = 0
+        self.duplicados = 0 # Hijos descartados por ser un estado ya visto (o sin mejor costo).
+        self.obsoletos = 0 # Entradas sacadas de la frontera cuyo estado ya estaba cerrado.
+        self.frontera_maxima = 0 # Tamaño máximo de la frontera (en IDA*, profundidad máxima del camino).
+        self.visitados = 0 # Tamaño final del conjunto de estados cerrados/visitados.
+        self.g_scores = 0 # Tamaño final del diccionario de costos (solo A*).
+        self.histograma_f = {} # Nodos expandidos por valor de f (en BFS, por profundidad).
+        self.inserciones = 0 # Operaciones sobre la frontera.
+        self.extracciones = 0
+        self.tiempo_total = 0.0 # Segundos, y su reparto entre preparación, frontera y expansión.
+        self.tiempo_preparacion = 0.0 # Carga de tablas y heurística del estado inicial.
+        self.tiempo_cola = 0.0
+        self.tiempo_expansion = 0.0 # El resto, incluida la heurística de cada hijo, que se actualiza al generarlo.
+        self.expandidos_por_trabajador = None # Reparto de la expansión entre procesos (solo HDA*).
+        self.inicio = time.perf_counter()
+
+    def cronometrar_cola(self, insertar, extraer):
+        # Envuelve las operaciones de la frontera para contarlas y medir su tiempo. Solo se usa
+        # con estadísticas activas; sin ellas las búsquedas llaman a las funciones originales.
+        reloj = time.perf_counter
+
+        def insertar_medido(*argumentos):
+            inicio = reloj()
+            insertar(*argumentos)
+            self.tiempo_cola += reloj() - inicio
+            self.inserciones += 1
+
+        def extraer_medido(*argumentos):
+            inicio = reloj()
+            elemento = extraer(*argumentos)
+            self.tiempo_cola += reloj() - inicio
+            self.extracciones += 1
+            return elemento
+        return insertar_medido, extraer_medido
+
+    def expandir(self, nodos_expandidos, frontera, f, generados, cantidad=1):
+        # Se llama en cada expansión (solo con estadísticas activas). Las búsquedas por capas la
+        # llaman una vez por capa, con los `cantidad` nodos expandidos de la capa.
+        self.nodos_expandidos = nodos_expandidos
+        self.nodos_generados += generados
+        if frontera > self.frontera_maxima:
+            self.frontera_maxima = frontera
+        if f is not None:
+            self.histograma_f[f] = self.histograma_f.get(f, 0) + cantidad
+        if self.al_progreso is not None and nodos_expandidos // self.intervalo != (nodos_expandidos - cantidad) // self.intervalo:
+            self.al_progreso(self)
+
+    def terminar(self, algoritmo, nodos_expandidos, tiempo_preparacion=0.0, duplicados=0, obsoletos=0,
+                 visitados=0, g_scores=0):
+        self.algoritmo = algoritmo
+        self.nodos_expandidos = nodos_expandidos
+        self.tiempo_total = time.perf_counter() - self.inicio
+        self.tiempo_preparacion = tiempo_preparacion
+        self.tiempo_expansion = max(0.0, self.tiempo_total - tiempo_preparacion - self.tiempo_cola)
+        self.duplicados, self.obsoletos = duplicados, obsoletos
+        self.visitados, self.g_scores = visitados, g_scores
+        if self.exportar is not None:
+            self.exportar(self.como_diccionario())
+
+    def como_diccionario(self):
+        """Las estadísticas como diccionario serializable a JSON."""
+        datos = {nombre: getattr(self, nombre) for nombre in self.__slots__[3:-1]}
+        datos["histograma_f"] = {str(f): cantidad for f, cantidad in sorted(self.histograma_f.items())}
+        return datos
+
+def preparar_revision(control, estadisticas):
+    """Devuelve (primera revisión, función revisar) para el bucle de una búsqueda.
+
+    Las búsquedas comparan su contador de expansiones con la próxima revisión y solo entonces
+    llaman a revisar(nodos_expandidos, frontera, cota, f, generados), que devuelve la siguiente.
+    Sin control ni estadísticas la revisión es -1 y nunca se alcanza.
+    """
+    if estadisticas is None:
+        if control is None:
+            return -1, None
+
+        def revisar(nodos_expandidos, frontera, cota, f, generados):
+            control.revisar(nodos_expandidos, frontera, cota)
+            return nodos_expandidos + control.intervalo
+        return control.intervalo, revisar
+
+    proximo_control = [control.intervalo if control is not None else -1]
+
+    def revisar(nodos_expandidos, frontera, cota, f, generados):
+        # Con estadísticas se revisa en cada expansión; el control sigue con su propio intervalo.
+        estadisticas.expandir(nodos_expandidos, frontera, f, generados)
+        if nodos_expandidos == proximo_control[0]:
+            control.revisar(nodos_expandidos, frontera, cota)
+            proximo_control[0] += control.intervalo
+        return nodos_expandidos + 1
+    return 1, revisar
+
+# --- Búsquedas hacia cualquier meta ---
+# Todas las búsquedas aceptan `meta` tal cual, pero solo buscan hacia metas canónicas (ver
+# Marco): así las PDB y las tablas de conflicto lineal y de distancias se construyen y
+# memorizan una vez por meta canónica. Este decorador lleva el estado inicial al marco canónico
+# de `meta`, llama a la búsqueda con la meta canónica y traduce de vuelta el camino encontrado.
+def _en_marco_canonico(busqueda):
+    firma = inspect.signature(busqueda)
+
+    def preparar(args, opciones):
+        argumentos = firma.bind(*args, **opciones)
+        estado = argumentos.arguments["estado_inicial"]
+        marco = obtener_marco(len(estado), argumentos.arguments.get("meta"))
+        argumentos.arguments["estado_inicial"] = marco.a_canonico(estado)
+        argumentos.arguments["meta"] = marco.canonica
+        return marco, argumentos
+
+    if inspect.isgeneratorfunction(busqueda): # Búsquedas "anytime": generan (nodo, expandidos, cota).
+        @functools.wraps(busqueda)
+        def envoltura(*args, **opciones):
+            marco, argumentos = preparar(args, opciones)
+            for nodo, *resto in busqueda(*argumentos.args, **argumentos.kwargs):
+                yield (_nodo_desde_canonico(nodo, marco), *resto)
+    else:
+        @functools.wraps(busqueda)
+        def envoltura(*args, **opciones):
+            marco, argumentos = preparar(args, opciones)
+            nodo, nodos_expandidos = busqueda(*argumentos.args, **argumentos.kwargs)
+            return _nodo_desde_canonico(nodo, marco), nodos_expandidos
+    return envoltura
+
+def _nodo_desde_canonico(nodo, marco):
+    # La misma cadena de nodos, con cada estado traducido del marco canónico a la meta original.
+    if nodo is None or marco.identidad:
+        return nodo
+    configuracion = obtener_configuracion(marco.n) # Empaquetar no depende de la meta.
+    return _nodos_desde_pasos(empaquetar(marco.desde_canonico(desempaquetar(codigo, configuracion)), configuracion)
+                              for codigo, _ in _pasos_desde_nodo(nodo))
+
+# --- Algoritmos de Búsqueda ---
+
+# Implementación de Búsqueda en Profundidad (DFS)
+@_en_marco_canonico
+def busqueda_profundidad(estado_inicial, control=None, estadisticas=None, meta=None):
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion) # Empaqueta el estado inicial.
+    meta_codigo = configuracion.meta_codigo
+    pila = [Nodo(codigo_inicial, vacio_inicial)] # Crea una pila (lista) y añade el nodo inicial. DFS usa una pila (LIFO).
+    apilar, desapilar = pila.append, pila.pop
+    if estadisticas is not None: # Solo entonces se cuentan y cronometran las operaciones de la pila.
+        apilar, desapilar = estadisticas.cronometrar_cola(apilar, desapilar)
+    visitados = set() # Conjunto de estados empaquetados ya visitados, para evitar ciclos.
+    nodos_expandidos = 0 # Contador para el número de nodos expandidos.
+    revision, revisar = preparar_revision(control, estadisticas) # Próxima revisión (-1: nunca).
+    movimientos = configuracion.movimientos
+    nodo_meta = None
+
+    while pila: # Mientras la pila no esté vacía.
+        nodo_actual = desapilar() # Saca el nodo superior de la pila (LIFO).
+        codigo = nodo_actual.codigo
+
+        if codigo == meta_codigo: # Si el estado del nodo actual es el estado meta.
+            nodo_meta = nodo_actual
+            break
+
+        if codigo not in visitados: # Si el estado actual no ha sido visitado.
+            visitados.add(codigo) # Añade el estado actual al conjunto de visitados.
+            nodos_expandidos += 1 # Incrementa el contador de nodos expandidos.
+            if nodos_expandidos == revision:
+                revision = revisar(nodos_expandidos, len(pila), None, None, len(movimientos[nodo_actual.vacio]))
+
+            # Genera sucesores en orden inverso para explorar el "primer" hijo primero.
+            # DFS explora un camino tan profundo como sea posible antes de retroceder.
+            # Al invertir el orden de los movimientos, se asegura una exploración consistente.
+            for codigo_hijo, vacio_hijo in reversed(obtener_movimientos(codigo, nodo_actual.vacio, configuracion)):
+                if codigo_hijo not in visitados: # Si el estado hijo no ha sido visitado.
+                    apilar(Nodo(codigo_hijo, vacio_hijo, nodo_actual)) # Añade el nodo hijo a la pila.
+
+    if estadisticas is not None:
+        # La meta se saca de la pila sin expandirse; el resto de extracciones sobrantes son obsoletas.
+        estadisticas.terminar("DFS", nodos_expandidos,
+                              duplicados=estadisticas.nodos_generados - estadisticas.inserciones,
+                              obsoletos=estadisticas.extracciones - nodos_expandidos - (nodo_meta is not None),
+                              visitados=len(visitados))
+    return nodo_meta, nodos_expandidos # Nodo meta (None si la pila se vació sin encontrarla) y nodos expandidos.
+
+# Implementación de Búsqueda A* con distancia Manhattan (o PDB aditivas)
+@_en_marco_canonico
+def busqueda_a_star(estado_inicial, heuristica=None, particion=None, control=None, estadisticas=None, cache=None,
+                    meta=None):
+    # heuristica: "manhattan" o "pdb". Por defecto Manhattan en 3x3 y PDB en tableros mayores,
+    # donde Manhattan no basta para terminar en un tiempo y memoria razonables.
+    # cache: una CacheSoluciones (puzzle8.cache). Si el estado inicial está guardado se responde
+    # sin buscar; si no, cada estado guardado que se genera lleva su distancia exacta como
+    # heurística y no se expande: al salir de la cola se completa con su camino guardado. La
+    # solución encontrada se añade a la caché, que tiene que ser la de la meta canónica de `meta`
+    # (la búsqueda se hace en ese marco; ver _en_marco_canonico).
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    bits, mascara = configuracion.bits, configuracion.mascara
+    meta_codigo = configuracion.meta_codigo
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion) # Empaqueta el estado inicial.
+
+    exacta = None # Distancia exacta de un estado guardado en la caché (None si no lo está).
+    terminales = set() # Estados generados con distancia exacta: al salir de la cola terminan la búsqueda.
+    if cache is not None:
+        guardado = cache.camino(codigo_inicial, vacio_inicial)
+        if guardado is not None:
+            if estadisticas is not None: # Respuesta sin búsqueda: solo cuenta el tiempo de la consulta.
+                estadisticas.terminar("A*", 0)
+            return _nodos_desde_pasos(guardado), 0
+        exacta = cache.distancia
+
+    inicio_preparacion = time.perf_counter()
+    h_inicial, inverso_inicial, pdb_por_ficha = _preparar_heuristica(configuracion, heuristica, particion, meta,
+                                                                     codigo_inicial)
+    tiempo_preparacion = time.perf_counter() - inicio_preparacion # Carga de tablas y heurística inicial.
+
+    contador = 0 # Desempate estable entre nodos con igual f y h (evita comparar nodos).
+    # La cola de prioridad guarda tuplas (f, h, contador, nodo): a igual f se prefiere
+    # el nodo más cercano a la meta. heapq mantiene el menor elemento en la raíz.
+    cola_prioridad = [(h_inicial, h_inicial, contador,
+                       NodoAStar(codigo_inicial, vacio_inicial, None, 0, h_inicial, inverso_inicial))]
+
+    visitados = set() # Conjunto para almacenar los estados ya procesados (cerrados).
+    # Diccionario para almacenar el costo g_cost (costo real desde el inicio) para cada estado.
+    g_scores = {codigo_inicial: 0}
+    nodos_expandidos = 0 # Contador para el número de nodos expandidos.
+    revision, revisar = preparar_revision(control, estadisticas) # Próxima revisión (-1: nunca).
+    heappush, heappop = heapq.heappush, heapq.heappop
+    if estadisticas is not None: # Solo entonces se cuentan y cronometran las operaciones del montículo.
+        heappush, heappop = estadisticas.cronometrar_cola(heappush, heappop)
+    movimientos_manhattan = configuracion.movimientos_manhattan
+    nodo_meta = None
+
+    while cola_prioridad: # Mientras la cola de prioridad no esté vacía.
+        # Saca el nodo con el menor f_cost (costo total) de la cola de prioridad.
+        f, h, _, nodo_actual = heappop(cola_prioridad)
+        codigo = nodo_actual.codigo
+
+        # Una entrada es obsoleta si el estado ya tiene un camino más corto. No basta con mirar si
+        # está cerrado: la PDB no es consistente (un movimiento puede bajar h en más de 1), así que
+        # un estado cerrado puede mejorar su g más tarde y entonces se vuelve a abrir y expandir.
+        if nodo_actual.costo > g_scores[codigo]:
+            continue
+
+        visitados.add(codigo) # Marca el nodo actual como visitado (cerrado).
+        nodos_expandidos += 1 # Incrementa el contador de nodos expandidos.
+
+        # Si es la meta, o un estado con distancia exacta: su f es el costo real de la mejor
+        # solución que pasa por él, y ningún nodo de la cola tiene un f menor.
+        if codigo == meta_codigo or codigo in terminales:
+            nodo_meta = nodo_actual
+            break
+
+        if nodos_expandidos == revision:
+            revision = revisar(nodos_expandidos, len(cola_prioridad), f, f, len(movimientos_manhattan[nodo_actual.vacio]))
+
+        # Calcula el costo acumulado para llegar a los hijos desde el inicio (costo del padre + 1 movimiento).
+        costo_hijo = nodo_actual.costo + 1
+        vacio = nodo_actual.vacio
+        inverso_actual = nodo_actual.inverso
+        # Itera sobre todos los movimientos posibles desde el estado actual.
+        for destino, desp_destino, desp_vacio, deltas in movimientos_manhattan[vacio]:
+            ficha = (codigo >> desp_destino) & mascara # Ficha que se desliza hacia el vacío.
+            codigo_hijo = codigo + (ficha << desp_vacio) - (ficha << desp_destino)
+            # Si el hijo no ha sido visitado antes, o si se encontró un camino más corto hacia él.
+            if costo_hijo < g_scores.get(codigo_hijo, costo_hijo + 1):
+                g_scores[codigo_hijo] = costo_hijo # Actualiza el g_score para el hijo.
+                if pdb_por_ficha is None:
+                    h_hijo = h + deltas[ficha] # Heurística incremental: solo cambia la ficha movida.
+                    inverso_hijo = 0
+                else:
+                    # La ficha pasa de `destino` a `vacio` y el vacío (ficha 0) de `vacio` a `destino`.
+                    inverso_hijo = inverso_actual + ((vacio - destino) << (bits * ficha)) + (destino - vacio)
+                    desplazamiento, mascara_pdb, tabla = pdb_por_ficha[ficha]
+                    h_hijo = (h - tabla[(inverso_actual >> desplazamiento) & mascara_pdb]
+                              + tabla[(inverso_hijo >> desplazamiento) & mascara_pdb])
+                if exacta is not None:
+                    distancia_guardada = exacta(codigo_hijo)
+                    if distancia_guardada is not None:
+                        # Su f es exacto: a igual f sale antes que cualquier nodo con h estimada.
+                        terminales.add(codigo_hijo)
+                        contador += 1
+                        heappush(cola_prioridad, (costo_hijo + distancia_guardada, -1, contador,
+                                                  NodoAStar(codigo_hijo, destino, nodo_actual, costo_hijo, distancia_guardada)))
+                        continue
+                contador += 1
+                heappush(cola_prioridad, (costo_hijo + h_hijo, h_hijo, contador,
+                                          NodoAStar(codigo_hijo, destino, nodo_actual, costo_hijo, h_hijo, inverso_hijo)))
+
+    if estadisticas is not None:
+        estadisticas.terminar("A*", nodos_expandidos, tiempo_preparacion,
+                              duplicados=estadisticas.nodos_generados - estadisticas.inserciones,
+                              obsoletos=estadisticas.extracciones - nodos_expandidos,
+                              visitados=len(visitados), g_scores=len(g_scores))
+    if cache is not None and nodo_meta is not None:
+        if nodo_meta.codigo != meta_codigo: # Se llegó a un estado guardado: se sigue su camino.
+            nodo_meta = _nodos_desde_pasos(cache.camino(nodo_meta.codigo, nodo_meta.vacio)[1:], nodo_meta)
+        cache.agregar_camino(_pasos_desde_nodo(nodo_meta))
+    return nodo_meta, nodos_expandidos # Nodo meta (None si la cola se vació sin encontrarla) y nodos expandidos.
+
+def _preparar_heuristica(configuracion, heuristica, particion, meta, codigo_inicial):
+    # Devuelve (h_inicial, inverso_inicial, pdb_por_ficha). pdb_por_ficha es None con Manhattan,
+    # que se actualiza con los deltas de movimientos_manhattan; con PDB da, para cada ficha, la
+    # PDB de su grupo: al moverla solo cambia ese término de la suma.
+    if heuristica is None:
+        heuristica = "manhattan" if configuracion.n <= 3 else "pdb"
+    if heuristica != "pdb":
+        return distancia_manhattan(codigo_inicial, configuracion), 0, None # Única vez que se calcula la heurística completa.
+    bits = configuracion.bits
+    pdbs = cargar_pdbs(configuracion.n, particion, meta)
+    pdb_por_ficha = [None]
+    for desplazamiento, mascara_pdb, tabla in pdbs:
+        pdb_por_ficha.extend([(desplazamiento, mascara_pdb, tabla)] * ((mascara_pdb.bit_length()) // bits))
+    inverso_inicial = inverso(codigo_inicial, configuracion)
+    return heuristica_pdb(inverso_inicial, pdbs), inverso_inicial, pdb_por_ficha
+
+def _nodos_desde_pasos(pasos, padre=None):
+    # Encadena nodos para una lista de pares (codigo, vacio), como si los hubiera generado una búsqueda.
+    nodo = padre
+    for codigo, vacio in pasos:
+        nodo = Nodo(codigo, vacio, nodo)
+    return nodo
+
+def _pasos_desde_nodo(nodo):
+    # Lista de pares (codigo, vacio) desde la raíz de la cadena hasta `nodo`.
+    pasos = []
+    while nodo is not None:
+        pasos.append((nodo.codigo, nodo.vacio))
+        nodo = nodo.padre
+    return pasos[::-1]
+
+# Implementación de A* ponderado "anytime" (ARA*)
+@_en_marco_canonico
+def busqueda_a_star_anytime(estado_inicial, peso=3.0, paso=0.5, heuristica=None, particion=None, control=None,
+                            estadisticas=None, meta=None):
+    # A* con f = g + peso * h: con un peso mayor que 1 llega mucho antes a una solución, que cuesta
+    # como mucho `peso` veces la óptima. Después se baja el peso en `paso` y se sigue buscando con
+    # la misma cola, los mismos g_scores y los mismos nodos (ARA*): solo se vuelven a expandir los
+    # estados cuyo costo mejoró. Es un generador de (nodo_meta, nodos_expandidos, cota) con cada
+    # solución mejor que la anterior; `cota` acota costo / costo óptimo. Al probar la optimalidad
+    # genera una última vez con cota 1 (aunque la solución no haya cambiado) y termina.
+    # La PDB no es consistente, así que la garantía de `peso` de ARA* no vale con ella: la cota se
+    # calcula siempre con la menor g + h pendiente, y con peso 1 los estados cerrados que mejoran
+    # su g se vuelven a abrir (como en busqueda_a_star) hasta que no queda nada por debajo.
+    # Si el control corta la búsqueda (tiempo, nodos, memoria o cancelación) después de la primera
+    # solución, el generador termina sin error y la última solución generada es la mejor encontrada;
+    # antes de la primera, lanza BusquedaInterrumpida como las demás búsquedas.
+    if not es_resoluble(estado_inicial, meta):
+        return
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    bits, mascara = configuracion.bits, configuracion.mascara
+    meta_codigo = configuracion.meta_codigo
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion)
+
+    inicio_preparacion = time.perf_counter()
+    h_inicial, inverso_inicial, pdb_por_ficha = _preparar_heuristica(configuracion, heuristica, particion, meta,
+                                                                     codigo_inicial)
+    tiempo_preparacion = time.perf_counter() - inicio_preparacion
+
+    raiz = NodoAStar(codigo_inicial, vacio_inicial, None, 0, h_inicial, inverso_inicial)
+    # Cola de tuplas (g + peso * h, h, contador, nodo). Una entrada es obsoleta si su nodo ya no
+    # lleva el mejor g del estado (cada mejora de g añade una entrada nueva).
+    cola_prioridad = [(peso * h_inicial, h_inicial, 0, raiz)]
+    contador = 0
+    g_scores = {codigo_inicial: 0}
+    cerrados = set() # Estados expandidos con el peso actual.
+    inconsistentes = {} # Estados cerrados cuyo g mejoró después: vuelven a la cola al bajar el peso.
+    nodo_meta = raiz if codigo_inicial == meta_codigo else None
+    costo_meta = 0 if nodo_meta is not None else math.inf
+    costo_generado = math.inf # Costo de la última solución generada.
+    nodos_expandidos = 0
+    revision, revisar = preparar_revision(control, estadisticas) # Próxima revisión (-1: nunca).
+    heappush, heappop = heapq.heappush, heapq.heappop
+    if estadisticas is not None:
+        heappush, heappop = estadisticas.cronometrar_cola(heappush, heappop)
+    movimientos_manhattan = configuracion.movimientos_manhattan
+
+    try:
+        while True:
+            # Con este peso, solo se expande lo que aún puede dar una solución más barata que la actual.
+            while cola_prioridad and cola_prioridad[0][0] < costo_meta:
+                _, h, _, nodo_actual = heappop(cola_prioridad)
+                codigo = nodo_actual.codigo
+                if nodo_actual.costo != g_scores[codigo]:
+                    continue
+                cerrados.add(codigo)
+                nodos_expandidos += 1
+                if nodos_expandidos == revision:
+                    f = nodo_actual.costo + h
+                    revision = revisar(nodos_expandidos, len(cola_prioridad), f, f, len(movimientos_manhattan[nodo_actual.vacio]))
+
+                costo_hijo = nodo_actual.costo + 1
+                vacio = nodo_actual.vacio
+                inverso_actual = nodo_actual.inverso
+                for destino, desp_destino, desp_vacio, deltas in movimientos_manhattan[vacio]:
+                    ficha = (codigo >> desp_destino) & mascara
+                    codigo_hijo = codigo + (ficha << desp_vacio) - (ficha << desp_destino)
+                    if costo_hijo < g_scores.get(codigo_hijo, costo_hijo + 1):
+                        g_scores[codigo_hijo] = costo_hijo
+                        if pdb_por_ficha is None:
+                            h_hijo = h + deltas[ficha]
+                            inverso_hijo = 0
+                        else:
+                            inverso_hijo = inverso_actual + ((vacio - destino) << (bits * ficha)) + (destino - vacio)
+                            desplazamiento, mascara_pdb, tabla = pdb_por_ficha[ficha]
+                            h_hijo = (h - tabla[(inverso_actual >> desplazamiento) & mascara_pdb]
+                                      + tabla[(inverso_hijo >> desplazamiento) & mascara_pdb])
+                        hijo = NodoAStar(codigo_hijo, destino, nodo_actual, costo_hijo, h_hijo, inverso_hijo)
+                        if codigo_hijo == meta_codigo: # La meta no se expande: basta con recordar el mejor camino.
+                            nodo_meta, costo_meta = hijo, costo_hijo
+                        elif codigo_hijo in cerrados and peso > 1.0: # Con peso 1 se reabre en el acto.
+                            inconsistentes[codigo_hijo] = hijo
+                        else:
+                            contador += 1
+                            heappush(cola_prioridad, (costo_hijo + peso * h_hijo, h_hijo, contador, hijo))
+
+            if nodo_meta is None: # Cola vacía sin llegar a la meta.
+                return
+            # Los estados pendientes (en la cola o inconsistentes) cubren todo camino mejor que la
+            # solución actual, así que el menor g + h entre ellos es una cota inferior del óptimo.
+            pendientes = {nodo.codigo: nodo for _, _, _, nodo in cola_prioridad
+                          if nodo.costo == g_scores[nodo.codigo] and nodo.codigo not in cerrados}
+            pendientes.update(inconsistentes)
+            minimo = min((nodo.costo + nodo.heuristica for nodo in pendientes.values()), default=costo_meta)
+            cota = 1.0 if costo_meta <= minimo else costo_meta / minimo
+            if costo_meta < costo_generado or cota == 1.0: # Una solución mejor, o la prueba de que es óptima.
+                costo_generado = costo_meta
+                yield nodo_meta, nodos_expandidos, cota
+            if cota == 1.0 or peso <= 1.0:
+                return
+            # Se baja el peso y se reordena la cola con él; los inconsistentes vuelven a ella.
+            peso = max(1.0, peso - paso)
+            cola_prioridad = [(nodo.costo + peso * nodo.heuristica, nodo.heuristica, i, nodo)
+                              for i, nodo in enumerate(pendientes.values())]
+            heapq.heapify(cola_prioridad)
+            contador = len(cola_prioridad)
+            cerrados = set()
+            inconsistentes = {}
+    except BusquedaInterrumpida:
+        if nodo_meta is None:
+            raise
+    finally:
+        if estadisticas is not None:
+            estadisticas.terminar("ARA*", nodos_expandidos, tiempo_preparacion,
+                                  duplicados=estadisticas.nodos_generados - estadisticas.inserciones,
+                                  obsoletos=estadisticas.extracciones - nodos_expandidos, g_scores=len(g_scores))
+
+def busqueda_ara_star(estado_inicial, control=None, estadisticas=None, meta=None):
+    # Misma interfaz que las demás búsquedas: la mejor solución de busqueda_a_star_anytime al
+    # terminar (la óptima, salvo que el control la corte antes).
+    nodo_meta, nodos_expandidos = None, 0
+    for nodo_meta, nodos_expandidos, _ in busqueda_a_star_anytime(estado_inicial, control=control,
+                                                                   estadisticas=estadisticas, meta=meta):
+        pass
+    return nodo_meta, nodos_expandidos
+
+# Implementación de IDA* (A* con profundización iterativa)
+@_en_marco_canonico
+def busqueda_ida_star(estado_inicial, control=None, estadisticas=None, meta=None):
+    # Búsqueda en profundidad con una cota sobre f = g + h que crece de iteración en iteración.
+    # Solo se guarda el camino actual: el tablero se modifica en el sitio al bajar y se
+    # deshace al volver, así que la memoria es proporcional a la profundidad de la solución.
+    # Heurística: Manhattan + conflicto lineal, ambas actualizadas de forma incremental.
+    if not es_resoluble(estado_inicial, meta): # Sin solución IDA* nunca terminaría.
+        return None, 0
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    n, bits = configuracion.n, configuracion.bits
+    inicio_preparacion = time.perf_counter()
+    conflicto, valor_fila, valor_columna, bits_linea = tablas_conflicto_lineal(configuracion)
+
+    tablero = [valor for fila in estado_inicial for valor in fila] # Tablero plano, se modifica en el sitio.
+    filas = [0] * n # Clave reducida de cada fila para el conflicto lineal.
+    columnas = [0] * n # Clave reducida de cada columna.
+    for i, ficha in enumerate(tablero):
+        fila, col = divmod(i, n)
+        filas[fila] += valor_fila[ficha][fila] << (bits_linea * col)
+        columnas[col] += valor_columna[ficha][col] << (bits_linea * fila)
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion)
+    h_manhattan = distancia_manhattan(codigo_inicial, configuracion)
+    h_conflicto = sum(conflicto[clave] for clave in filas) + sum(conflicto[clave] for clave in columnas)
+    tiempo_preparacion = time.perf_counter() - inicio_preparacion # Tablas y heurística inicial.
+
+    # Para cada movimiento: (destino, deltas de Manhattan, vertical, línea de la ficha antes y
+    # después, desplazamiento de la ficha dentro de esas líneas, línea perpendicular y
+    # desplazamientos de la ficha dentro de ella antes y después). En un movimiento vertical
+    # cambian de contenido dos filas; la columna solo cambia de orden, y como la ficha pasa al
+    # lado del vacío su conflicto no varía. En uno horizontal, al revés.
+    movimientos = []
+    for vacio in range(configuracion.casillas):
+        fila_v, col_v = divmod(vacio, n)
+        opciones = []
+        for destino, _, _, deltas in configuracion.movimientos_manhattan[vacio]:
+            fila_d, col_d = divmod(destino, n)
+            if col_d == col_v:
+                opciones.append((destino, deltas, True, fila_d, fila_v, bits_linea * col_v, col_v,
+                                 bits_linea * fila_d, bits_linea * fila_v))
+            else:
+                opciones.append((destino, deltas, False, col_d, col_v, bits_linea * fila_v, fila_v,
+                                 bits_linea * col_d, bits_linea * col_v))
+        movimientos.append(tuple(opciones))
+
+    camino = [] # Casillas a las que se ha movido el vacío en la rama actual.
+    nodos_expandidos = 0
+    revision, revisar = preparar_revision(control, estadisticas) # Próxima revisión (-1: nunca).
+
+    def buscar(vacio, g, h_manhattan, h_conflicto, cota, previo):
+        nonlocal nodos_expandidos, revision
+        f = g + h_manhattan + h_conflicto
+        if f > cota:
+            return f # Devuelve el menor f que excede la cota, para la siguiente iteración.
+        if h_manhattan == 0: # Todas las fichas en su sitio: es la meta.
+            return True
+        nodos_expandidos += 1
+        if nodos_expandidos == revision: # La "frontera" de IDA* es el camino actual.
+            revision = revisar(nodos_expandidos, len(camino), cota, f, len(movimientos[vacio]) - (previo >= 0))
+        minimo = float("inf")
+        for (destino, deltas, vertical, linea_antes, linea_despues, desp_linea,
+             perpendicular, desp_antes, desp_despues) in movimientos[vacio]:
+            if destino == previo: # Deshacer el último movimiento nunca lleva a un camino óptimo.
+                continue
+            ficha = tablero[destino]
+            if vertical:
+                lineas, perpendiculares, valores, valores_perp = filas, columnas, valor_fila[ficha], valor_columna[ficha]
+            else:
+                lineas, perpendiculares, valores, valores_perp = columnas, filas, valor_columna[ficha], valor_fila[ficha]
+
+            # Aplica el movimiento en el sitio.
+            clave_antes, clave_despues, clave_perp = lineas[linea_antes], lineas[linea_despues], perpendiculares[perpendicular]
+            nueva_antes = clave_antes - (valores[linea_antes] << desp_linea)
+            nueva_despues = clave_despues + (valores[linea_despues] << desp_linea)
+            lineas[linea_antes], lineas[linea_despues] = nueva_antes, nueva_despues
+            valor_perp = valores_perp[perpendicular]
+            perpendiculares[perpendicular] = clave_perp + (valor_perp << desp_despues) - (valor_perp << desp_antes)
+            tablero[vacio], tablero[destino] = ficha, 0
+            camino.append(destino)
+
+            resultado = buscar(destino, g + 1, h_manhattan + deltas[ficha],
+                               h_conflicto - conflicto[clave_antes] - conflicto[clave_despues]
+                               + conflicto[nueva_antes] + conflicto[nueva_despues],
+                               cota, vacio)
+            if resultado is True:
+                return True
+
+            # Deshace el movimiento.
+            camino.pop()
+            tablero[vacio], tablero[destino] = 0, ficha
+            lineas[linea_antes], lineas[linea_despues], perpendiculares[perpendicular] = clave_antes, clave_despues, clave_perp
+            if resultado < minimo:
+                minimo = resultado
+        return minimo
+
+    cota = h_manhattan + h_conflicto
+    while True: # Cada iteración repite la búsqueda con la cota que la anterior no pudo superar.
+        resultado = buscar(vacio_inicial, 0, h_manhattan, h_conflicto, cota, -1)
+        if resultado is True:
+            break
+        cota = resultado
+
+    # Reconstruye la cadena de nodos reproduciendo los movimientos del camino encontrado.
+    mascara = configuracion.mascara
+    codigo, vacio = codigo_inicial, vacio_inicial
+    nodo = Nodo(codigo, vacio)
+    for destino in camino:
+        ficha = (codigo >> (bits * destino)) & mascara
+        codigo = codigo + (ficha << (bits * vacio)) - (ficha << (bits * destino))
+        vacio = destino
+        nodo = Nodo(codigo, vacio, nodo)
+    if estadisticas is not None: # Sin visitados ni cola: no hay duplicados detectados ni entradas obsoletas.
+        estadisticas.terminar("IDA*", nodos_expandidos, tiempo_preparacion)
+    return nodo, nodos_expandidos
+
+# Implementación de búsqueda bidireccional (BFS desde el inicio y desde la meta)
+@_en_marco_canonico
+def busqueda_bidireccional(estado_inicial, control=None, estadisticas=None, meta=None):
+    # Dos BFS, una desde el estado inicial y otra hacia atrás desde la meta (los movimientos
+    # son reversibles), que se encuentran en el medio. Cada una solo llega a la mitad de la
+    # profundidad, así que se expanden del orden de 2 * b^(d/2) nodos en lugar de b^d.
+    # Siempre se expande una capa completa del lado con la frontera más pequeña. Antes de esa
+    # capa ningún estado de un lado estaba en el otro, así que el primer encuentro se produce
+    # justo a la profundidad óptima y se puede parar en ese momento.
+    if not es_resoluble(estado_inicial, meta): # Sin solución, las dos BFS recorrerían medio espacio.
+        return None, 0
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion)
+    meta_codigo, meta_vacio = configuracion.meta_codigo, configuracion.meta_vacio
+
+    # Padre de cada estado visitado en cada sentido (None para la raíz); también hace de `visitados`.
+    padres_adelante = {codigo_inicial: None}
+    padres_atras = {meta_codigo: None}
+    frontera_adelante = [(codigo_inicial, vacio_inicial)]
+    frontera_atras = [(meta_codigo, meta_vacio)]
+    nodos_expandidos = 0
+    revision, revisar = preparar_revision(control, estadisticas) # Próxima revisión (-1: nunca).
+    movimientos = configuracion.movimientos
+    profundidad = 0 # Suma de las capas completadas por ambos lados: cota inferior de la solución.
+    encuentro = codigo_inicial if codigo_inicial == meta_codigo else None
+
+    while encuentro is None and frontera_adelante and frontera_atras:
+        if len(frontera_adelante) <= len(frontera_atras):
+            frontera, padres, otros = frontera_adelante, padres_adelante, padres_atras
+        else:
+            frontera, padres, otros = frontera_atras, padres_atras, padres_adelante
+        siguiente = []
+        insertar = siguiente.append
+        if estadisticas is not None: # Solo entonces se cuentan y cronometran las inserciones en la frontera.
+            insertar, _ = estadisticas.cronometrar_cola(insertar, None)
+        for codigo, vacio in frontera:
+            nodos_expandidos += 1
+            if nodos_expandidos == revision:
+                revision = revisar(nodos_expandidos, len(frontera_adelante) + len(frontera_atras) + len(siguiente),
+                                   profundidad, profundidad, len(movimientos[vacio]))
+            for codigo_hijo, vacio_hijo in obtener_movimientos(codigo, vacio, configuracion):
+                if codigo_hijo not in padres:
+                    padres[codigo_hijo] = codigo
+                    if codigo_hijo in otros: # Las dos búsquedas se encontraron.
+                        encuentro = codigo_hijo
+                        break
+                    insertar((codigo_hijo, vacio_hijo))
+            if encuentro is not None:
+                break
+        if frontera is frontera_adelante:
+            frontera_adelante = siguiente
+        else:
+            frontera_atras = siguiente
+        profundidad += 1
+
+    if estadisticas is not None:
+        # Cada hijo generado es un estado nuevo (queda en `padres`) o un duplicado.
+        visitados = len(padres_adelante) + len(padres_atras)
+        estadisticas.terminar("Bidir", nodos_expandidos, duplicados=estadisticas.nodos_generados - (visitados - 2),
+                              visitados=visitados)
+    if encuentro is None:
+        return None, nodos_expandidos
+
+    # Une las dos mitades: inicio -> encuentro por los padres hacia adelante, y
+    # encuentro -> meta siguiendo los padres de la búsqueda hacia atrás.
+    mitad_inicial = []
+    codigo = encuentro
+    while codigo is not None:
+        mitad_inicial.append(codigo)
+        codigo = padres_adelante[codigo]
+    camino = mitad_inicial[::-1]
+    codigo = padres_atras[encuentro]
+    while codigo is not None:
+        camino.append(codigo)
+        codigo = padres_atras[codigo]
+
+    nodo = None
+    for codigo in camino:
+        nodo = Nodo(codigo, desempaquetar_vacio(codigo, configuracion), nodo)
+    return nodo, nodos_expandidos
+
+# Resolución con la tabla completa de distancias
+@_en_marco_canonico
+def busqueda_tabla(estado_inicial, control=None, estadisticas=None, meta=None):
+    # `control` se acepta por uniformidad con las demás búsquedas: como mucho son 31 pasos.
+    if len(estado_inicial) != 3:
+        raise ValueError("La tabla de distancias solo existe para el puzzle 3x3")
+    # Los estados no resolubles comparten índices con los resolubles, hay que descartarlos antes.
+    if not es_resoluble(estado_inicial, meta):
+        return None, 0
+    configuracion = obtener_configuracion(3, meta)
+    inicio_preparacion = time.perf_counter()
+    tabla = cargar_tabla_distancias(meta=meta) # Aquí la "heurística" es la distancia exacta de la tabla.
+    tiempo_preparacion = time.perf_counter() - inicio_preparacion
+    codigo, vacio = empaquetar(estado_inicial, configuracion)
+    nodo_actual = Nodo(codigo, vacio)
+    distancia = tabla[indice_estado(codigo, vacio)]
+    nodos_expandidos = 0
+
+    # Descenso voraz: sin cola ni visitados, un único nodo expandido por movimiento.
+    while distancia:
+        nodos_expandidos += 1
+        hijos = obtener_movimientos(nodo_actual.codigo, nodo_actual.vacio, configuracion)
+        if estadisticas is not None:
+            estadisticas.expandir(nodos_expandidos, 1, distancia, len(hijos))
+        for codigo_hijo, vacio_hijo in hijos:
+            if tabla[indice_estado(codigo_hijo, vacio_hijo)] < distancia:
+                nodo_actual = Nodo(codigo_hijo, vacio_hijo, nodo_actual)
+                distancia -= 1
+                break
+    if estadisticas is not None:
+        estadisticas.terminar("Tabla", nodos_expandidos, tiempo_preparacion)
+    return nodo_actual, nodos_expandidos
+
+# BFS por capas vectorizada (puzzle8.bfs_vectorial)
+def busqueda_bfs(estado_inicial, control=None, estadisticas=None, meta=None):
+    # Expande capas enteras de una vez con NumPy; óptima, pero guarda todos los estados vistos,
+    # así que solo es práctica en 3x3 o en tableros mayores cerca de la meta. NumPy se importa
+    # aquí para que el resto del núcleo no dependa de él.
+    try:
+        from .bfs_vectorial import busqueda_bfs_capas
+    except ImportError:
+        raise ValueError("La búsqueda BFS por capas necesita NumPy") from None
+    return busqueda_bfs_capas(estado_inicial, control, estadisticas, meta)
+
+def busqueda_hda_star(estado_inicial, control=None, estadisticas=None, meta=None):
+    # A* repartido entre un proceso por núcleo (ver puzzle8.paralelo). Da la misma longitud
+    # que A*, aunque expande más nodos (ver puzzle8.paralelo): vale la pena en 4x4 con muchos
+    # núcleos, o cuando g_scores no cabe en un proceso.
+    from .paralelo import busqueda_a_star_paralela
+    return busqueda_a_star_paralela(estado_inicial, control=control, estadisticas=estadisticas, meta=meta)
+
+# Función para reconstruir la solución
+def reconstruir_solucion(nodo, n):
+    # `n` es obligatorio: el entero empaquetado no dice el tamaño del tablero, y desempaquetar
+    # un nodo 4x4 como 3x3 daría tableros equivocados sin ningún error.
+    configuracion = obtener_configuracion(n)
+    codigos = [] # Estados empaquetados del camino, desde la meta hacia el inicio.
+    while nodo: # Mientras el nodo no sea None (es decir, mientras haya un padre).
+        codigos.append(nodo.codigo) # Añade el estado del nodo actual al camino.
+        nodo = nodo.padre # Retrocede al nodo padre.
+    # Invierte el camino para que empiece en el estado inicial y solo aquí se
+    # desempaquetan los estados a tuplas de tuplas para mostrarlos.
+    return [desempaquetar(codigo, configuracion) for codigo in reversed(codigos)]
+
+# Algoritmos disponibles por nombre (los mismos que ofrece la GUI).
+ALGORITMOS = {
+    "DFS": busqueda_profundidad,
+    "A*": busqueda_a_star,
+    "ARA*": busqueda_ara_star,
+    "IDA*": busqueda_ida_star,
+    "Bidir": busqueda_bidireccional,
+    "Tabla": busqueda_tabla,
+    "BFS": busqueda_bfs,
+    "HDA*": busqueda_hda_star,
+}
+
+def fichas_movidas(nodo, configuracion):
+    """Lista de fichas deslizadas, en orden, para llegar desde el inicio hasta `nodo`."""
+    bits, mascara = configuracion.bits, configuracion.mascara
+    fichas = []
+    while nodo is not None and nodo.padre is not None:
+        # La ficha movida es la que ahora ocupa la casilla donde estaba el vacío del padre.
+        fichas.append((nodo.codigo >> (bits * nodo.padre.vacio)) & mascara)
+        nodo = nodo.padre
+    return fichas[::-1]
+
+# --- Metas configurables: marco canónico ---
+# Renombrar las fichas (sin tocar el vacío) o aplicar una simetría del tablero (giros y
+# reflejos) no cambia el grafo de estados: cada movimiento sigue siendo un movimiento y las
+# distancias se conservan. Por eso resolver hacia cualquier meta es lo mismo que transformar
+# el tablero y resolver hacia una meta canónica, y las tablas, PDB y cachés de esa meta sirven
+# para todas las que se reducen a ella. Lo que no se puede cambiar así es la órbita de la
+# casilla del vacío de la meta (esquina, borde o interior), así que hay una meta canónica por
+# órbita: el caracol para la órbita de su vacío y, para las demás, la meta por filas con el
+# vacío en la última casilla de la órbita (en las esquinas, la meta por filas de siempre).
+
+def simetrias_tablero(n):
+    """Las 8 simetrías del tablero n x n, como tuplas simetria[casilla] = casilla de destino."""
+    casillas = range(n * n)
+    girar = tuple((i % n) * n + (n - 1 - i // n) for i in casillas) # Giro de 90 grados.
+    trasponer = tuple((i % n) * n + i // n for i in casillas)
+    simetrias = []
+    for simetria in (tuple(casillas), trasponer):
+        for _ in range(4):
+            simetrias.append(simetria)
+            simetria = tuple(girar[destino] for destino in simetria)
+    return simetrias
+
+class Marco:
+    # Traslado entre la meta de quien consulta y su meta canónica: una simetría del tablero
+    # (`casilla`) seguida de un renombrado de fichas (`etiqueta`). Ir y volver cuesta
+    # O(casillas) por tablero. `canonica` es la meta con la que se busca; None es el caracol,
+    # la meta por defecto de todas las tablas.
+    __slots__ = ("n", "meta", "canonica", "casilla", "etiqueta", "etiqueta_inversa", "identidad")
+
+    def __init__(self, n, meta):
+        self.n, self.meta = n, meta
+        plano = [valor for fila in meta for valor in fila]
+        vacio = plano.index(0)
+        simetrias = simetrias_tablero(n)
+        vacio_caracol = obtener_configuracion(n).meta_vacio
+        orbita = {simetria[vacio] for simetria in simetrias}
+        vacio_canonico = vacio_caracol if vacio_caracol in orbita else max(orbita)
+        self.canonica = None if vacio_canonico == vacio_caracol else generar_meta_filas(n, vacio_canonico)
+        canonica = [valor for fila in obtener_configuracion(n, self.canonica).meta for valor in fila]
+        self.casilla = next(simetria for simetria in simetrias if simetria[vacio] == vacio_canonico)
+        # La ficha que la meta tiene en la casilla i pasa a llamarse como la que la meta
+        # canónica tiene en la casilla transformada; el vacío sigue siendo el vacío.
+        self.etiqueta = [0] * (n * n)
+        for i, ficha in enumerate(plano):
+            self.etiqueta[ficha] = canonica[self.casilla[i]]
+        self.etiqueta_inversa = [0] * (n * n)
+        for ficha, nueva in enumerate(self.etiqueta):
+            self.etiqueta_inversa[nueva] = ficha
+        self.identidad = plano == canonica and self.casilla == tuple(range(n * n))
+
+    def a_canonico(self, estado):
+        """Tablero de quien consulta -> tablero equivalente respecto a la meta canónica."""
+        if self.identidad:
+            return estado
+        n, casilla, etiqueta = self.n, self.casilla, self.etiqueta
+        plano = [0] * (n * n)
+        for i, ficha in enumerate(valor for fila in estado for valor in fila):
+            plano[casilla[i]] = etiqueta[ficha]
+        return tuple(tuple(plano[i:i + n]) for i in range(0, n * n, n))
+
+    def desde_canonico(self, estado):
+        """Inversa de a_canonico(): tablero canónico -> tablero de quien consulta."""
+        if self.identidad:
+            return estado
+        n, casilla, etiqueta_inversa = self.n, self.casilla, self.etiqueta_inversa
+        canonico = [valor for fila in estado for valor in fila]
+        plano = [etiqueta_inversa[canonico[casilla[i]]] for i in range(n * n)]
+        return tuple(tuple(plano[i:i + n]) for i in range(0, n * n, n))
+
+    def fichas_desde_canonico(self, fichas):
+        """Traduce una lista de fichas movidas a los nombres de quien consulta."""
+        return fichas if self.identidad else [self.etiqueta_inversa[ficha] for ficha in fichas]
+
+_marcos = {} # Marcos ya construidos, por (tamaño de tablero, meta).
+
+def obtener_marco(n=3, meta=None):
+    """Devuelve (y memoriza) el marco que lleva `meta` (por defecto, el caracol) a su meta canónica."""
+    meta = normalizar_meta(meta)
+    marco = _marcos.get((n, meta))
+    if marco is None:
+        marco = _marcos[(n, meta)] = Marco(n, meta or generar_meta(n))
+    return marco
+
+def meta_desde_texto(texto, n):
+    """Meta dada por nombre ("caracol", "filas") o como lista de números (espacios, comas o JSON)."""
+    if texto in METAS:
+        return METAS[texto](n)
+    valores = [int(valor) for valor in texto.replace("[", " ").replace("]", " ").replace(",", " ").split()]
+    return tablero_desde_lista(valores)
+
+# --- Resolución de un tablero ---
+# Valida un tablero, lo resuelve con presupuestos opcionales y devuelve un resultado
+# serializable. Lo usan la orden `solve`, los lotes y el banco de pruebas.
+
+def tablero_desde_lista(valores):
+    """Normaliza un tablero dado como lista plana o lista de filas a tupla de tuplas.
+
+    Lanza ValueError si una lista plana no tiene un número cuadrado de fichas.
+    """
+    if valores and isinstance(valores[0], (list, tuple)):
+        return tuple(tuple(fila) for fila in valores)
+    n = math.isqrt(len(valores))
+    if n * n != len(valores): # Sin esto isqrt recortaría el tablero en silencio.
+        raise ValueError(f"{len(valores)} fichas no forman un tablero cuadrado")
+    return tuple(tuple(valores[i:i + n]) for i in range(0, n * n, n))
+
+def _es_tablero_valido(estado):
+    # Acepta cualquier objeto (viene de archivos de lotes): lo que no sea un tablero n x n con
+    # los enteros 0..n*n-1 es inválido, sin lanzar excepciones.
+    try:
+        n = len(estado)
+        plano = [valor for fila in estado for valor in fila]
+        filas_completas = all(len(fila) == n for fila in estado)
+    except TypeError:
+        return False
+    return n >= 2 and filas_completas and all(type(valor) is int for valor in plano) \
+        and sorted(plano) == list(range(n * n))
+
+def resolver_uno(identificador, estado, algoritmo="A*", limite_tiempo=None, limite_nodos=None,
+                 limite_memoria_mb=None, con_estadisticas=False, usar_cache=False, meta=None):
+    """Resuelve un tablero y devuelve un diccionario serializable con el resultado.
+
+    Con `con_estadisticas` el resultado incluye también las estadísticas detalladas de la búsqueda.
+    Con `usar_cache`, A* consulta y amplía la caché de soluciones del proceso (puzzle8.cache).
+    `meta` es el tablero meta (por defecto, el caracol). La búsqueda se hace en el marco canónico
+    de la meta, con sus tablas y su caché, y las fichas movidas se devuelven con los nombres de `meta`.
+    """
+    resultado = {"id": identificador, "algoritmo": algoritmo}
+    try:
+        meta = normalizar_meta(meta)
+    except ValueError:
+        resultado.update(estado="error", error="meta inválida")
+        return resultado
+    if not _es_tablero_valido(estado):
+        resultado.update(estado="error", error="tablero inválido")
+        return resultado
+    if meta is not None and (not _es_tablero_valido(meta) or len(meta) != len(estado)):
+        resultado.update(estado="error", error="meta inválida")
+        return resultado
+    if not es_resoluble(estado, meta):
+        resultado.update(estado="sin_solucion", nodos_expandidos=0, tiempo=0.0)
+        return resultado
+
+    # Los presupuestos se revisan dentro de la búsqueda, así que cortan cualquier algoritmo,
+    # incluso un DFS o IDA* muy largo, sin bloquear al trabajador.
+    control = None
+    if limite_tiempo or limite_nodos or limite_memoria_mb:
+        control = ControlBusqueda(limite_nodos, limite_memoria_mb, limite_tiempo)
+    estadisticas = EstadisticasBusqueda() if con_estadisticas else None
+    marco = obtener_marco(len(estado), meta)
+    opciones = {}
+    if usar_cache and algoritmo == "A*": # Solo A* usa la caché (y solo guarda soluciones óptimas).
+        from .cache import obtener_cache
+        opciones["cache"] = obtener_cache(len(estado), marco.canonica)
+    cota = None # Cota de subóptimo de la solución de ARA* (costo / óptimo).
+    inicio = time.perf_counter()
+    try:
+        if algoritmo == "ARA*": # Se queda con la última mejora, que es la mejor, y con su cota.
+            nodo, nodos_expandidos = None, 0
+            for nodo, nodos_expandidos, cota in busqueda_a_star_anytime(marco.a_canonico(estado), control=control,
+                                                                        estadisticas=estadisticas, meta=marco.canonica):
+                pass
+        else:
+            nodo, nodos_expandidos = ALGORITMOS[algoritmo](marco.a_canonico(estado), control=control,
+                                                           estadisticas=estadisticas, meta=marco.canonica, **opciones)
+    except BusquedaInterrumpida as interrupcion:
+        estado_resultado = "tiempo_agotado" if interrupcion.motivo == "limite_tiempo" else interrupcion.motivo
+        resultado.update(estado=estado_resultado, nodos_expandidos=interrupcion.nodos_expandidos,
+                         tiempo=time.perf_counter() - inicio)
+        return resultado
+    except (ValueError, MemoryError, RuntimeError) as error: # RuntimeError: un trabajador de HDA* perdido.
+        resultado.update(estado="error", error=str(error))
+        return resultado
+    tiempo = time.perf_counter() - inicio
+
+    if nodo is None:
+        resultado.update(estado="sin_solucion", nodos_expandidos=nodos_expandidos, tiempo=tiempo)
+    else:
+        fichas = marco.fichas_desde_canonico(fichas_movidas(nodo, obtener_configuracion(len(estado), marco.canonica)))
+        resultado.update(estado="resuelto", longitud=len(fichas), movimientos=fichas,
+                         nodos_expandidos=nodos_expandidos, tiempo=tiempo)
+        if cota is not None:
+            resultado["cota"] = cota
+    if estadisticas is not None:
+        resultado["estadisticas"] = estadisticas.como_diccionario()
+    return resultado
+
+def preparar_tablas(algoritmo, n, meta=None):
+    # Carga (o construye, la primera vez) las tablas que necesita el algoritmo. Se llama en el
+    # proceso principal antes de lanzar los trabajadores, para que no las construyan a la vez,
+    # y después en cada trabajador, que solo las mapea desde disco. Son las de la meta canónica.
+    canonica = obtener_marco(n, meta).canonica
+    configuracion = obtener_configuracion(n, canonica)
+    if algoritmo == "Tabla" and n == 3:
+        cargar_tabla_distancias(meta=canonica)
+    elif algoritmo in ("A*", "HDA*") and n > 3:
+        cargar_pdbs(n, meta=canonica)
+    elif algoritmo == "IDA*":
+        tablas_conflicto_lineal(configuracion)
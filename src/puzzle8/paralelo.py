@@ -0,0 +1,287 @@
+"""A* paralelo distribuido por hash (HDA*) entre procesos de una misma máquina.
+
+Cada estado pertenece a un solo trabajador, elegido con un hash de su código empaquetado, y
+solo ese trabajador guarda su g, su padre y, si está abierto, su entrada en la cola. Cada
+trabajador expande su propia cola; los hijos de otros dueños se acumulan en un lote por
+destino, que se envía al final de cada tramo de expansiones (o antes, si se llena). Así la
+memoria de g_scores se reparte entre los procesos y cada núcleo expande a su ritmo.
+
+Los lotes son arreglos planos de enteros de 64 bits (cuatro por estado: código, padre,
+inverso y vacío/g/h juntos), que se envían como bytes por una cola de multiprocessing.
+
+Sin un orden global, un trabajador con la cola casi vacía expandiría nodos de f muy alta
+mientras los de f baja siguen en camino hacia otros. Por eso se expande por capas: hay un
+umbral de f en memoria compartida y cada trabajador solo expande nodos con f <= umbral.
+Cuando todos están inactivos para el umbral actual y no hay lotes en tránsito (contadores de
+lotes enviados y recibidos que no cambian entre dos lecturas seguidas), el proceso principal
+sube el umbral a la menor f que queda en las colas. El costo de la mejor solución también
+está en memoria compartida: los nodos con f mayor o igual se descartan, y la búsqueda
+termina cuando ninguna cola tiene nodos por debajo de ese costo. Con una heurística
+consistente la solución es óptima.
+
+El reparto tiene un costo en nodos: los hijos de otros dueños solo llegan al final de cada
+tramo, y en la última capa de f cada salto del camino hacia la meta entre dos trabajadores
+espera a ese envío, mientras todos siguen expandiendo la capa. A* en serie, en cambio, deja
+sin expandir casi toda la última capa. En instancias 4x4 de 28 a 42 movimientos con 2 y 4
+procesos se expanden entre 1,5 y 4 veces los nodos de busqueda_a_star, y cada capa termina
+con una espera en la que los trabajadores ociosos no avanzan. Compensa cuando hay más
+núcleos que ese factor, o cuando g_scores no cabe en la memoria de un solo proceso.
+"""
+import array # Importa array para los lotes compactos de estados.
+import heapq # Importa heapq para la cola de prioridad de cada trabajador.
+import multiprocessing # Importa multiprocessing para los trabajadores y la memoria compartida.
+import os # Importa os para contar los núcleos y elegir cómo se lanzan los procesos.
+import queue # Importa queue para esperar con tiempo límite en las colas.
+import time # Importa time para las pausas del proceso principal.
+
+from .nucleo import (BusquedaInterrumpida, Nodo, _en_marco_canonico, _preparar_heuristica, desempaquetar_vacio,
+                     empaquetar, es_resoluble, memoria_mb, obtener_configuracion)
+
+MAXIMO_LADO = 4 # Los lotes guardan el estado empaquetado en 64 bits: cabe hasta 4x4.
+TAMANO_LOTE = 256 # Nodos expandidos por tramo, y estados como máximo por lote enviado.
+SIN_PADRE = 0 # Padre del estado inicial (ningún tablero válido se empaqueta como 0).
+SIN_SOLUCION = 1 << 62 # "Infinito" en la memoria compartida (costo sin solución, f de una cola vacía).
+OCUPADO = -1 # Valor de `inactivos` para un trabajador con nodos por expandir.
+TIEMPO_RESPUESTA = 10 # Segundos que se espera una respuesta de los trabajadores antes de darla por perdida.
+
+def dueno(codigo, procesos):
+    """Trabajador dueño de un estado: hash de Fibonacci del código, reducido a `procesos`."""
+    return (((codigo * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % procesos
+
+def _trabajador(indice, procesos, n, meta, heuristica, particion, entradas, respuestas, compartido,
+                limite_memoria_mb, tamano_lote):
+    enviados, recibidos, expandidos, inactivos, fronteras, umbral, mejor, motivo = compartido
+    configuracion = obtener_configuracion(n, meta)
+    bits, mascara, meta_codigo = configuracion.bits, configuracion.mascara, configuracion.meta_codigo
+    movimientos_manhattan = configuracion.movimientos_manhattan
+    # Las tablas ya están en disco (las preparó el proceso principal): aquí solo se mapean.
+    _, _, pdb_por_ficha = _preparar_heuristica(configuracion, heuristica, particion, meta, meta_codigo)
+    entrada = entradas[indice]
+    g_scores = {}
+    padres = {}
+    cola_prioridad = [] # Tuplas (f, h, codigo, vacio, inverso).
+    salidas = [array.array("Q") for _ in range(procesos)] # Lote pendiente por destino.
+    nodos_expandidos = 0
+    mejor_costo = SIN_SOLUCION # Copia local de `mejor`, que se relee en cada vuelta.
+
+    def recibir(codigo, padre, inverso_estado, vacio, g, h):
+        # Un estado de este trabajador llega (de otro o de sí mismo) con un costo g.
+        nonlocal mejor_costo
+        if g + h >= mejor_costo or g >= g_scores.get(codigo, g + 1):
+            return
+        g_scores[codigo] = g
+        padres[codigo] = padre
+        if codigo == meta_codigo: # Solo el dueño de la meta escribe `mejor`: no hace falta cerrojo.
+            mejor_costo = mejor.value = g
+        else:
+            heapq.heappush(cola_prioridad, (g + h, h, codigo, vacio, inverso_estado))
+
+    def enviar(destino):
+        enviados[indice] += 1 # Antes de enviarlo, para que nunca haya un lote en tránsito sin contar.
+        entradas[destino].put(("lote", salidas[destino].tobytes()))
+        salidas[destino] = array.array("Q")
+
+    while True:
+        # El umbral se lee una vez por vuelta: si al final se declara inactivo, es para este umbral.
+        umbral_actual = umbral.value
+        mejor_costo = mejor.value
+        # Inactivo se espera un poco al siguiente mensaje; con trabajo solo se mira si hay alguno.
+        try:
+            if inactivos[indice] == OCUPADO:
+                mensaje = entrada.get_nowait()
+            else:
+                mensaje = entrada.get(timeout=0.002)
+        except queue.Empty:
+            mensaje = None
+        if mensaje is not None:
+            tipo = mensaje[0]
+            if tipo == "lote":
+                inactivos[indice] = OCUPADO # Antes de contarlo como recibido (ver la detección de terminación).
+                lote = array.array("Q")
+                lote.frombytes(mensaje[1])
+                for i in range(0, len(lote), 4):
+                    datos = lote[i + 3]
+                    recibir(lote[i], lote[i + 1], lote[i + 2], datos & 0xFF, datos >> 16, (datos >> 8) & 0xFF)
+                recibidos[indice] += 1
+            elif tipo == "padre": # Reconstrucción del camino al terminar.
+                respuestas.put(padres[mensaje[1]])
+                continue
+            else: # "fin"
+                respuestas.put(("resumen", indice, len(g_scores)))
+                return
+
+        # Expande un tramo de la cola propia, solo con nodos dentro del umbral.
+        if cola_prioridad and cola_prioridad[0][0] <= umbral_actual:
+            inactivos[indice] = OCUPADO # Con un umbral nuevo vuelve a tener trabajo.
+        for _ in range(tamano_lote):
+            if not cola_prioridad or cola_prioridad[0][0] > umbral_actual:
+                break
+            f, h, codigo, vacio, inverso_actual = heapq.heappop(cola_prioridad)
+            if f >= mejor_costo: # Nada de la cola puede mejorar ya la solución.
+                cola_prioridad.clear()
+                break
+            g = f - h
+            if g_scores[codigo] != g: # Entrada obsoleta: el estado llegó después con menor costo.
+                continue
+            nodos_expandidos += 1
+            if not nodos_expandidos & 1023:
+                expandidos[indice] = nodos_expandidos
+                if limite_memoria_mb is not None and memoria_mb() >= limite_memoria_mb:
+                    motivo.value = 1
+            costo_hijo = g + 1
+            for destino, desp_destino, desp_vacio, deltas in movimientos_manhattan[vacio]:
+                ficha = (codigo >> desp_destino) & mascara
+                codigo_hijo = codigo + (ficha << desp_vacio) - (ficha << desp_destino)
+                if pdb_por_ficha is None:
+                    h_hijo = h + deltas[ficha]
+                    inverso_hijo = 0
+                else:
+                    inverso_hijo = inverso_actual + ((vacio - destino) << (bits * ficha)) + (destino - vacio)
+                    desplazamiento, mascara_pdb, tabla = pdb_por_ficha[ficha]
+                    h_hijo = (h - tabla[(inverso_actual >> desplazamiento) & mascara_pdb]
+                              + tabla[(inverso_hijo >> desplazamiento) & mascara_pdb])
+                propietario = dueno(codigo_hijo, procesos)
+                if propietario == indice:
+                    recibir(codigo_hijo, codigo, inverso_hijo, destino, costo_hijo, h_hijo)
+                else:
+                    salida = salidas[propietario]
+                    salida.extend((codigo_hijo, codigo, inverso_hijo, destino | (h_hijo << 8) | (costo_hijo << 16)))
+                    if len(salida) >= 4 * tamano_lote:
+                        enviar(propietario)
+        expandidos[indice] = nodos_expandidos
+
+        # Lo pendiente se envía al final de cada tramo, para que los demás no esperen a que se llene.
+        for destino in range(procesos):
+            if salidas[destino]:
+                enviar(destino)
+        if not cola_prioridad or cola_prioridad[0][0] > umbral_actual:
+            # Nada más que expandir con este umbral: se publica la menor f que queda y después
+            # (en este orden) se marca inactivo para este umbral.
+            fronteras[indice] = cola_prioridad[0][0] if cola_prioridad else SIN_SOLUCION
+            inactivos[indice] = umbral_actual
+
+def _terminada(enviados, recibidos, inactivos, umbral_actual):
+    # Una lectura: todos inactivos para el umbral actual y tantos lotes recibidos como enviados.
+    # Los recibidos se leen antes que los enviados, así que un lote en tránsito siempre deja
+    # recibidos < enviados. Como el umbral solo sube, una marca de un umbral anterior no cuenta.
+    todos_inactivos = all(valor == umbral_actual for valor in inactivos)
+    total_recibidos = sum(recibidos)
+    total_enviados = sum(enviados)
+    return todos_inactivos and total_recibidos == total_enviados, total_enviados
+
+def _revisar_trabajadores(trabajadores):
+    # Un trabajador que murió (señal, falta de memoria del sistema...) ya no va a contestar ni a
+    # marcarse inactivo: se convierte en un error en lugar de esperarlo para siempre. Tras "fin"
+    # salen con código 0, que no cuenta.
+    for indice, trabajador in enumerate(trabajadores):
+        if trabajador.exitcode not in (None, 0):
+            raise RuntimeError(f"el trabajador {indice} de HDA* terminó inesperadamente "
+                               f"(código {trabajador.exitcode})")
+
+def _esperar_respuesta(respuestas, trabajadores):
+    # Espera en tramos cortos para notar enseguida si un trabajador murió; si nadie contesta en
+    # TIEMPO_RESPUESTA segundos también es un error.
+    limite = time.monotonic() + TIEMPO_RESPUESTA
+    while True:
+        try:
+            return respuestas.get(timeout=0.05)
+        except queue.Empty:
+            _revisar_trabajadores(trabajadores)
+            if time.monotonic() >= limite:
+                raise RuntimeError(f"los trabajadores de HDA* no respondieron en {TIEMPO_RESPUESTA} s") from None
+
+@_en_marco_canonico
+def busqueda_a_star_paralela(estado_inicial, control=None, estadisticas=None, meta=None, procesos=None,
+                             heuristica=None, particion=None, tamano_lote=TAMANO_LOTE):
+    # Misma interfaz y mismo resultado (óptimo) que busqueda_a_star, con `procesos` trabajadores
+    # (por defecto, uno por núcleo). El control se revisa en el proceso principal cada pocos
+    # milisegundos; el límite de memoria se aplica a cada trabajador. Con estadísticas, además de
+    # los totales se guardan los nodos expandidos por cada trabajador, para ver el reparto.
+    if len(estado_inicial) > MAXIMO_LADO: # Antes de lanzar procesos: los lotes no lo admitirían.
+        raise ValueError(f"HDA* solo admite tableros de hasta {MAXIMO_LADO}x{MAXIMO_LADO}")
+    if not es_resoluble(estado_inicial, meta):
+        return None, 0
+    procesos = procesos or os.cpu_count() or 1
+    configuracion = obtener_configuracion(len(estado_inicial), meta)
+    codigo_inicial, vacio_inicial = empaquetar(estado_inicial, configuracion)
+    if codigo_inicial == configuracion.meta_codigo:
+        if estadisticas is not None:
+            estadisticas.expandidos_por_trabajador = [0] * procesos
+            estadisticas.terminar("HDA*", 0)
+        return Nodo(codigo_inicial, vacio_inicial), 0
+    inicio_preparacion = time.perf_counter()
+    # Construye las tablas que falten antes de lanzar a los trabajadores, que solo las mapean.
+    h_inicial, inverso_inicial, _ = _preparar_heuristica(configuracion, heuristica, particion, meta, codigo_inicial)
+    tiempo_preparacion = time.perf_counter() - inicio_preparacion
+
+    contexto = multiprocessing.get_context("fork") if hasattr(os, "fork") else multiprocessing.get_context()
+    enviados = contexto.Array("q", procesos + 1, lock=False) # El último es el proceso principal.
+    recibidos = contexto.Array("q", procesos, lock=False)
+    expandidos = contexto.Array("q", procesos, lock=False)
+    inactivos = contexto.Array("q", [OCUPADO] * procesos, lock=False) # Umbral para el que cada uno está inactivo.
+    fronteras = contexto.Array("q", [SIN_SOLUCION] * procesos, lock=False) # Menor f de la cola de cada uno.
+    umbral = contexto.Value("q", h_inicial, lock=False) # Solo lo cambia el proceso principal.
+    mejor = contexto.Value("q", SIN_SOLUCION, lock=False) # Costo de la mejor solución encontrada.
+    motivo = contexto.Value("b", 0, lock=False) # 1 si algún trabajador superó el límite de memoria.
+    entradas = [contexto.Queue() for _ in range(procesos)]
+    respuestas = contexto.Queue()
+    limite_memoria_mb = control.limite_memoria_mb if control is not None else None
+    compartido = (enviados, recibidos, expandidos, inactivos, fronteras, umbral, mejor, motivo)
+    trabajadores = [contexto.Process(target=_trabajador, daemon=True,
+                                     args=(i, procesos, configuracion.n, meta, heuristica, particion, entradas,
+                                           respuestas, compartido, limite_memoria_mb, tamano_lote))
+                    for i in range(procesos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    try:
+        lote = array.array("Q", (codigo_inicial, SIN_PADRE, inverso_inicial, vacio_inicial | (h_inicial << 8)))
+        enviados[procesos] += 1
+        entradas[dueno(codigo_inicial, procesos)].put(("lote", lote.tobytes()))
+
+        anterior = None # Lotes enviados en la lectura previa, si en ella la capa parecía terminada.
+        while True:
+            time.sleep(0.001)
+            if motivo.value:
+                raise BusquedaInterrumpida("limite_memoria", sum(expandidos))
+            _revisar_trabajadores(trabajadores)
+            if control is not None:
+                control.revisar(sum(expandidos), 0, umbral.value)
+            terminada, total_enviados = _terminada(enviados, recibidos, inactivos, umbral.value)
+            if not terminada or total_enviados != anterior:
+                anterior = total_enviados if terminada else None
+                continue
+            # Capa terminada: se sigue con la menor f abierta, salvo que ya no pueda mejorar la solución.
+            anterior = None
+            siguiente = min(fronteras)
+            if siguiente >= mejor.value:
+                break
+            umbral.value = siguiente
+
+        nodos_expandidos = sum(expandidos)
+        nodo_meta = None
+        if mejor.value != SIN_SOLUCION:
+            # Se sigue la cadena de padres preguntando a cada dueño, desde la meta hasta el inicio.
+            codigos = [configuracion.meta_codigo]
+            while codigos[-1] != codigo_inicial:
+                entradas[dueno(codigos[-1], procesos)].put(("padre", codigos[-1]))
+                codigos.append(_esperar_respuesta(respuestas, trabajadores))
+            for codigo in reversed(codigos):
+                nodo_meta = Nodo(codigo, desempaquetar_vacio(codigo, configuracion), nodo_meta)
+
+        for entrada in entradas:
+            entrada.put(("fin",))
+        tamanos = [0] * procesos
+        for _ in range(procesos):
+            _, indice, tamano = _esperar_respuesta(respuestas, trabajadores)
+            tamanos[indice] = tamano
+        if estadisticas is not None:
+            estadisticas.expandidos_por_trabajador = list(expandidos)
+            estadisticas.terminar("HDA*", nodos_expandidos, tiempo_preparacion, visitados=sum(tamanos),
+                                  g_scores=sum(tamanos))
+        return nodo_meta, nodos_expandidos
+    finally:
+        # Tras "fin" los trabajadores ya están saliendo; si la búsqueda se cortó, siguen expandiendo.
+        for trabajador in trabajadores:
+            if trabajador.is_alive():
+                trabajador.terminate()
+            trabajador.join(timeout=1)
@@ -0,0 +1,52 @@
+import os
+import sys
+import tracemalloc
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from puzzle8 import nucleo
+
+try:
+    from puzzle8 import bfs_vectorial
+except ImportError: # Sin NumPy no hay BFS por capas.
+    bfs_vectorial = None
+
+
+@unittest.skipIf(bfs_vectorial is None, "necesita NumPy")
+class PruebaBfsCapas(unittest.TestCase):
+    def test_solucion_optima(self):
+        estado = ((2, 8, 3), (1, 6, 4), (7, 0, 5))
+        nodo, _ = bfs_vectorial.busqueda_bfs_capas(estado)
+        camino = nucleo.reconstruir_solucion(nodo, 3)
+        self.assertEqual(camino[0], estado)
+        self.assertEqual(camino[-1], nucleo.META)
+        self.assertEqual(len(camino) - 1, nucleo.distancia_optima(estado))
+
+    def test_limite_de_memoria_antes_de_reservar_la_capa(self):
+        # Tablero 4x4 lejano: sin la estimación, una sola capa supera con creces el presupuesto.
+        estado = nucleo.tablero_desde_lista([5, 1, 2, 3, 9, 6, 7, 4, 13, 10, 11, 8, 0, 14, 15, 12])
+        control = nucleo.ControlBusqueda(limite_memoria_mb=nucleo.memoria_mb() + 40)
+        tracemalloc.start() # NumPy también registra sus reservas en tracemalloc.
+        try:
+            with self.assertRaises(nucleo.BusquedaInterrumpida) as contexto:
+                bfs_vectorial.busqueda_bfs_capas(estado, control=control)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(contexto.exception.motivo, "limite_memoria")
+        self.assertLess(pico, 40 * 2 ** 20)
+
+    def test_rechaza_tableros_mayores_de_4x4(self):
+        estado = nucleo.generar_meta(5)
+        with self.assertRaises(ValueError):
+            bfs_vectorial.busqueda_bfs_capas(estado)
+        configuracion = nucleo.obtener_configuracion(5)
+        with self.assertRaises(ValueError):
+            next(bfs_vectorial.capas(configuracion, configuracion.meta_codigo, configuracion.meta_vacio))
+        resultado = nucleo.resolver_uno("a", estado, "BFS")
+        self.assertEqual(resultado["estado"], "error")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from puzzle8 import nucleo
+from puzzle8.cache import ENTRADA, CacheSoluciones
+
+# Tableros 3x3 con caminos óptimos que no comparten estados salvo la meta.
+DIFICIL = ((2, 8, 3), (1, 6, 4), (7, 0, 5)) # 5 movimientos.
+FACIL = ((1, 2, 3), (8, 4, 0), (7, 6, 5)) # 1 movimiento.
+
+
+class PruebaCacheSoluciones(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "soluciones.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def nueva(self, capacidad=100):
+        return CacheSoluciones(3, capacidad=capacidad, ruta=self.ruta)
+
+    def resolver(self, estado, cache, estadisticas=None):
+        nodo, nodos_expandidos = nucleo.busqueda_a_star(estado, cache=cache, estadisticas=estadisticas)
+        return nucleo.reconstruir_solucion(nodo, 3), nodos_expandidos
+
+    def test_acierto_sin_buscar(self):
+        cache = self.nueva()
+        camino, nodos_expandidos = self.resolver(DIFICIL, cache)
+        self.assertGreater(nodos_expandidos, 0)
+        self.assertEqual(len(cache), len(camino))
+        self.assertEqual(cache.distancia(nucleo.empaquetar(DIFICIL)[0]), 5)
+        estadisticas = nucleo.EstadisticasBusqueda()
+        repetido, nodos_expandidos = self.resolver(DIFICIL, cache, estadisticas)
+        self.assertEqual((repetido, nodos_expandidos), (camino, 0))
+        self.assertEqual(estadisticas.algoritmo, "A*") # Las estadísticas quedan cerradas también en un acierto.
+        self.assertGreater(estadisticas.tiempo_total, 0.0)
+        self.assertEqual(estadisticas.como_diccionario()["nodos_expandidos"], 0)
+
+    def test_expulsa_lo_menos_reciente_sin_romper_caminos(self):
+        cache = self.nueva(capacidad=6)
+        self.resolver(DIFICIL, cache) # 6 estados, meta incluida.
+        self.resolver(FACIL, cache) # Usa la meta y añade uno: el inicio de DIFICIL es el más antiguo.
+        self.assertEqual(len(cache), 6)
+        self.assertIsNone(cache.distancia(nucleo.empaquetar(DIFICIL)[0]))
+        for codigo in list(cache.entradas): # Todo lo que queda sigue llevando hasta la meta.
+            pasos = cache.camino(codigo, nucleo.desempaquetar_vacio(codigo, cache.configuracion))
+            self.assertEqual(pasos[-1][0], cache.configuracion.meta_codigo)
+            self.assertEqual(len(pasos) - 1, cache.distancia(codigo))
+
+    def test_persistencia_y_recarga(self):
+        escritora, lectora = self.nueva(), self.nueva()
+        camino, _ = self.resolver(DIFICIL, escritora)
+        self.assertEqual(len(self.nueva()), 0) # Nada en disco hasta guardar.
+        escritora.guardar()
+        self.assertEqual(len(self.nueva()), len(camino)) # Una instancia nueva lee el registro.
+        lectora.recargar() # Y una ya abierta lee solo lo añadido desde su última lectura.
+        self.assertEqual(lectora.distancia(nucleo.empaquetar(DIFICIL)[0]), 5)
+        repetido, nodos_expandidos = self.resolver(DIFICIL, lectora)
+        self.assertEqual((repetido, nodos_expandidos), (camino, 0))
+
+    def test_compacta_el_registro(self):
+        cache = self.nueva(capacidad=6)
+        for _ in range(5): # Cada uso vuelve a añadir las entradas al registro.
+            self.resolver(DIFICIL, cache)
+            cache.guardar()
+        self.assertLessEqual(os.path.getsize(self.ruta), 2 * 6 * ENTRADA.size)
+        self.assertEqual(len(self.nueva()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def puzzle8(*argumentos):
+    entorno = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run([sys.executable, "-m", "puzzle8", *argumentos], capture_output=True, text=True, env=entorno)
+
+
+class PruebaSolve(unittest.TestCase):
+    def test_resuelve(self):
+        proceso = puzzle8("solve", "2", "8", "3", "1", "6", "4", "7", "0", "5")
+        self.assertEqual(proceso.returncode, 0)
+        self.assertEqual(json.loads(proceso.stdout)["longitud"], 5)
+
+    def test_rechaza_tableros_no_cuadrados(self):
+        for fichas in (["1", "2", "3", "8", "0", "4", "7", "6", "5", "9"], ["0", "1", "2", "3", "4"]):
+            proceso = puzzle8("solve", *fichas)
+            self.assertEqual(proceso.returncode, 2) # Error de argumentos, sin resultado.
+            self.assertIn("tablero inválido", proceso.stderr)
+            self.assertEqual(proceso.stdout, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
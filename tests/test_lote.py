@@ -0,0 +1,56 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from puzzle8.lote import RegistroInvalido, leer_tableros, resolver_lote
+
+LINEAS = "\n".join([
+    "[2, 8, 3, 1, 6, 4, 7, 0, 5]",
+    "{esto no es JSON",
+    '{"id": "x", "tablero": [[2, 8, 3], [1, 6, 4], [7, "a", 5]]}',
+    '{"id": "y"}',
+    "[1, 2, 3, 4, 5]",
+    "",
+    '{"id": "z", "tablero": [[1, 2, 3], [8, 0, 4], [7, 6, 5]]}',
+]) + "\n"
+
+
+class PruebaLeerTableros(unittest.TestCase):
+    def test_jsonl_con_registros_invalidos(self):
+        registros = list(leer_tableros(io.StringIO(LINEAS)))
+        self.assertEqual([identificador for identificador, _ in registros], [0, 1, "x", "y", 4, "z"])
+        self.assertEqual(registros[0][1], ((2, 8, 3), (1, 6, 4), (7, 0, 5)))
+        self.assertEqual([isinstance(tablero, RegistroInvalido) for _, tablero in registros],
+                         [False, True, False, True, True, False])
+
+    def test_binario(self):
+        archivo = io.BytesIO(bytes([2, 8, 3, 1, 6, 4, 7, 0, 5, 1, 2, 3, 8, 0, 4, 7, 6, 5, 1]))
+        self.assertEqual(list(leer_tableros(archivo, "binario")),
+                         [(0, ((2, 8, 3), (1, 6, 4), (7, 0, 5))), (1, ((1, 2, 3), (8, 0, 4), (7, 6, 5)))])
+
+
+class PruebaResolverLote(unittest.TestCase):
+    def comprobar(self, procesos):
+        resultados = list(resolver_lote(leer_tableros(io.StringIO(LINEAS)), procesos=procesos, tamano_bloque=2))
+        self.assertEqual([resultado["id"] for resultado in resultados], [0, 1, "x", "y", 4, "z"])
+        self.assertEqual([resultado["estado"] for resultado in resultados],
+                         ["resuelto", "error", "error", "error", "error", "resuelto"])
+        self.assertEqual(resultados[0]["longitud"], 5)
+        self.assertEqual(resultados[-1]["longitud"], 0)
+
+    def test_un_registro_invalido_no_corta_el_lote(self):
+        self.comprobar(procesos=1)
+
+    def test_con_trabajadores(self):
+        self.comprobar(procesos=2)
+
+    def test_algoritmo_desconocido(self):
+        with self.assertRaises(ValueError):
+            list(resolver_lote(iter([]), algoritmo="Nada"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from puzzle8 import nucleo
+
+
+class PruebaConflictoLineal(unittest.TestCase):
+    def test_segunda_llamada_devuelve_tablas_memorizadas(self):
+        configuracion = nucleo.obtener_configuracion(3)
+        primera = nucleo.tablas_conflicto_lineal(configuracion)
+        self.assertIs(nucleo.tablas_conflicto_lineal(configuracion), primera)
+        self.assertIn((3, configuracion.meta_codigo), nucleo._conflictos)
+
+
+class PruebaTableroDesdeLista(unittest.TestCase):
+    def test_lista_plana_y_de_filas(self):
+        esperado = ((1, 2, 3), (8, 0, 4), (7, 6, 5))
+        self.assertEqual(nucleo.tablero_desde_lista([1, 2, 3, 8, 0, 4, 7, 6, 5]), esperado)
+        self.assertEqual(nucleo.tablero_desde_lista([[1, 2, 3], [8, 0, 4], [7, 6, 5]]), esperado)
+
+    def test_rechaza_listas_no_cuadradas(self):
+        for valores in ([1, 2, 3, 8, 0, 4, 7, 6, 5, 9], [0, 1, 2, 3, 4]):
+            with self.assertRaises(ValueError):
+                nucleo.tablero_desde_lista(valores)
+
+    def test_meta_no_cuadrada_en_resolver_uno(self):
+        resultado = nucleo.resolver_uno("a", nucleo.META, meta=[1, 2, 3, 4, 0])
+        self.assertEqual((resultado["estado"], resultado["error"]), ("error", "meta inválida"))
+
+
+class PruebaMetaComoLista(unittest.TestCase):
+    META_FILAS = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    ESTADO = ((1, 2, 3), (4, 5, 6), (0, 7, 8))
+
+    def test_tablas_memorizadas_con_meta_en_listas(self):
+        meta = nucleo.generar_meta_filas(3)
+        self.assertIs(nucleo.obtener_configuracion(3, self.META_FILAS), nucleo.obtener_configuracion(3, meta))
+        self.assertIs(nucleo.obtener_marco(3, self.META_FILAS), nucleo.obtener_marco(3, meta))
+
+    def test_resolver_uno_con_meta_en_listas(self):
+        resultado = nucleo.resolver_uno("a", self.ESTADO, "A*", meta=self.META_FILAS)
+        self.assertEqual(resultado["estado"], "resuelto")
+        self.assertEqual(resultado["movimientos"], [7, 8])
+
+
+class PruebaMarcoCanonico(unittest.TestCase):
+    # Meta con el vacío en una esquina pero sin ser la meta por filas: se busca en otro marco.
+    META = ((0, 8, 7), (6, 5, 4), (3, 2, 1))
+    ESTADOS = (((8, 0, 7), (6, 5, 4), (3, 2, 1)), ((6, 8, 7), (3, 5, 4), (0, 2, 1)),
+               ((3, 8, 5), (7, 0, 4), (6, 2, 1)))
+
+    def comprobar_camino(self, nodo, estado, meta):
+        camino = nucleo.reconstruir_solucion(nodo, len(estado))
+        self.assertEqual(camino[0], estado)
+        self.assertEqual(camino[-1], meta)
+        return len(camino) - 1
+
+    def test_busquedas_devuelven_el_camino_hacia_la_meta_pedida(self):
+        for estado in self.ESTADOS:
+            optima = nucleo.distancia_optima(estado, self.META)
+            for nombre in ("A*", "IDA*", "Bidir", "Tabla", "ARA*"):
+                nodo, _ = nucleo.ALGORITMOS[nombre](estado, meta=self.META)
+                self.assertEqual(self.comprobar_camino(nodo, estado, self.META), optima, nombre)
+        nodo, _ = nucleo.busqueda_profundidad(self.ESTADOS[0], None, None, self.META) # Meta por posición.
+        self.comprobar_camino(nodo, self.ESTADOS[0], self.META)
+
+    def test_tablas_de_la_meta_canonica(self):
+        nucleo.busqueda_ida_star(self.ESTADOS[2], meta=self.META)
+        self.assertNotIn((3, nucleo.empaquetar(self.META)[0]), nucleo._conflictos)
+        self.assertIn((3, nucleo.obtener_configuracion(3, nucleo.generar_meta_filas(3)).meta_codigo), nucleo._conflictos)
+
+
+def tableros_aleatorios(cantidad, semilla, n=3):
+    # Tableros resolubles reproducibles (generar_estado_aleatorio usa el `random` global).
+    estado_random = random.getstate()
+    random.seed(semilla)
+    try:
+        return [nucleo.generar_estado_aleatorio(n) for _ in range(cantidad)]
+    finally:
+        random.setstate(estado_random)
+
+
+def longitud(nodo, n=3):
+    return len(nucleo.reconstruir_solucion(nodo, n)) - 1
+
+
+class PruebaReconstruirSolucion(unittest.TestCase):
+    def test_tablero_4x4(self):
+        estado = ((1, 2, 3, 4), (12, 0, 14, 5), (11, 13, 15, 6), (10, 9, 8, 7))
+        nodo, _ = nucleo.busqueda_a_star(estado, heuristica="manhattan")
+        self.assertEqual(nucleo.reconstruir_solucion(nodo, 4), [estado, nucleo.generar_meta(4)])
+        with self.assertRaises(TypeError): # Sin tamaño por defecto.
+            nucleo.reconstruir_solucion(nodo)
+
+
+class PruebaAStarConPdb(unittest.TestCase):
+    # La PDB no es consistente: A* tiene que reabrir estados cerrados para seguir siendo óptimo.
+    def test_longitudes_optimas(self):
+        estados = [((3, 1, 6), (7, 8, 0), (2, 4, 5)), ((1, 8, 7), (5, 0, 2), (3, 6, 4))]
+        for estado in estados + tableros_aleatorios(300, 1):
+            nodo, _ = nucleo.busqueda_a_star(estado, heuristica="pdb")
+            self.assertEqual(longitud(nodo), nucleo.distancia_optima(estado), estado)
+
+
+class PruebaAraStar(unittest.TestCase):
+    def comprobar_anytime(self, estado, heuristica):
+        optima = nucleo.distancia_optima(estado)
+        soluciones = list(nucleo.busqueda_a_star_anytime(estado, heuristica=heuristica))
+        longitudes = [longitud(nodo) for nodo, _, _ in soluciones]
+        for (_, _, cota), largo in zip(soluciones, longitudes):
+            self.assertGreaterEqual(cota, 1.0)
+            self.assertLessEqual(largo, cota * optima + 1e-9) # La cota es válida en cada mejora.
+        # Cada solución es más corta que la anterior, salvo la última, que solo prueba la optimalidad.
+        self.assertEqual(longitudes[:-1], sorted(set(longitudes[:-1]), reverse=True))
+        self.assertEqual(longitudes[-1], min(longitudes))
+        self.assertEqual(soluciones[-1][2], 1.0)
+        self.assertEqual(longitudes[-1], optima)
+
+    def test_mejoras_y_cota_final(self):
+        estados = [((3, 1, 6), (7, 8, 0), (2, 4, 5)), ((1, 8, 7), (5, 0, 2), (3, 6, 4))]
+        for estado in estados + tableros_aleatorios(200, 2):
+            for heuristica in ("manhattan", "pdb"):
+                self.comprobar_anytime(estado, heuristica)
+
+
+class PruebaEstadisticas(unittest.TestCase):
+    def test_reparto_del_tiempo(self):
+        estadisticas = nucleo.EstadisticasBusqueda()
+        nucleo.busqueda_a_star(((2, 8, 3), (1, 6, 4), (7, 0, 5)), estadisticas=estadisticas)
+        datos = estadisticas.como_diccionario()
+        self.assertNotIn("tiempo_heuristica", datos)
+        self.assertAlmostEqual(datos["tiempo_preparacion"] + datos["tiempo_cola"] + datos["tiempo_expansion"],
+                               datos["tiempo_total"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from puzzle8 import nucleo, paralelo
+from puzzle8.paralelo import busqueda_a_star_paralela
+
+
+def paseo_aleatorio(n, pasos, semilla):
+    # Tablero a `pasos` movimientos aleatorios (sin deshacer el último) de la meta.
+    aleatorio = random.Random(semilla)
+    configuracion = nucleo.obtener_configuracion(n)
+    codigo, vacio, anterior = configuracion.meta_codigo, configuracion.meta_vacio, None
+    for _ in range(pasos):
+        hijos = [hijo for hijo in nucleo.obtener_movimientos(codigo, vacio, configuracion) if hijo[0] != anterior]
+        anterior = codigo
+        codigo, vacio = aleatorio.choice(hijos)
+    return nucleo.desempaquetar(codigo, configuracion)
+
+
+class PruebaHdaStar(unittest.TestCase):
+    def comprobar_optima(self, estado, heuristica=None):
+        n = len(estado)
+        esperado, _ = nucleo.busqueda_a_star(estado, heuristica=heuristica)
+        nodo, _ = busqueda_a_star_paralela(estado, procesos=2, heuristica=heuristica)
+        camino = nucleo.reconstruir_solucion(nodo, n)
+        self.assertEqual(camino[0], estado)
+        self.assertEqual(camino[-1], nucleo.obtener_configuracion(n).meta)
+        for actual, siguiente in zip(camino, camino[1:]): # Cada paso es un movimiento legal.
+            codigo, vacio = nucleo.empaquetar(actual)
+            hijos = [hijo for hijo, _ in nucleo.obtener_movimientos(codigo, vacio, nucleo.obtener_configuracion(n))]
+            self.assertIn(nucleo.empaquetar(siguiente)[0], hijos)
+        self.assertEqual(len(camino), len(nucleo.reconstruir_solucion(esperado, n)))
+
+    def test_optima_en_3x3_con_dos_procesos(self):
+        for semilla in range(4):
+            with self.subTest(semilla=semilla):
+                self.comprobar_optima(paseo_aleatorio(3, 40, semilla))
+
+    def test_optima_en_4x4_con_dos_procesos(self):
+        for semilla in range(3):
+            with self.subTest(semilla=semilla):
+                self.comprobar_optima(paseo_aleatorio(4, 30, semilla), heuristica="manhattan")
+
+    def test_rechaza_tableros_mayores_de_4x4_sin_lanzar_procesos(self):
+        with self.assertRaises(ValueError):
+            busqueda_a_star_paralela(paseo_aleatorio(5, 4, 0), procesos=2)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+class EntradaQueMuere:
+    # Cola de entrada de un trabajador que muere al recibir la primera consulta de padre.
+    def __init__(self, cola):
+        self.cola = cola
+
+    def put(self, mensaje):
+        self.cola.put(mensaje)
+
+    def get(self, timeout=None):
+        return self.revisar(self.cola.get(timeout=timeout))
+
+    def get_nowait(self):
+        return self.revisar(self.cola.get_nowait())
+
+    def revisar(self, mensaje):
+        if mensaje[0] == "padre":
+            os._exit(1)
+        return mensaje
+
+
+def trabajador_que_muere(indice, procesos, n, meta, heuristica, particion, entradas, *resto,
+                         trabajador=paralelo._trabajador):
+    entradas = list(entradas)
+    entradas[indice] = EntradaQueMuere(entradas[indice])
+    trabajador(indice, procesos, n, meta, heuristica, particion, entradas, *resto)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "el trabajador sustituido solo llega a los procesos con fork")
+class PruebaTrabajadorPerdido(unittest.TestCase):
+    def test_error_en_lugar_de_esperar_para_siempre(self):
+        with mock.patch.object(paralelo, "_trabajador", trabajador_que_muere), \
+                mock.patch.object(paralelo, "TIEMPO_RESPUESTA", 5):
+            with self.assertRaisesRegex(RuntimeError, "terminó inesperadamente"):
+                busqueda_a_star_paralela(paseo_aleatorio(3, 20, 0), procesos=2)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()